@@ -0,0 +1,63 @@
+"""
+Compares the bracket scanner finding the job listings of Google's initial page with
+the previous nested bracket regex, on pages of growing size.
+
+    python benchmarks/bench_google_initial_page.py [cassette]
+
+With a cassette recorded by jobspy.set_cassette, its Google search pages are used
+instead of the synthetic pages.
+"""
+
+import re
+import sys
+import json
+import timeit
+
+from pages import google_initial_page, cassette_pages
+
+from jobspy.scrapers.google import GoogleJobsScraper
+
+
+def find_job_info_before(html_text: str) -> list:
+    """The search replaced by GoogleJobsScraper._find_job_info_initial_page"""
+    pattern = (
+        '520084652":('
+        + r"\[(?:[^\[\]]|\[(?:[^\[\]]|\[(?:[^\[\]]|\[[^\[\]]*\])*\])*\])*\])"
+    )
+    results = []
+    for match in re.finditer(pattern, html_text):
+        try:
+            results.append(json.loads(match.group(1)))
+        except json.JSONDecodeError as e:
+            results.append({"raw_match": match.group(0), "error": str(e)})
+    return results
+
+
+def main(number: int = 20):
+    if len(sys.argv) > 1:
+        pages = [
+            page.encode() for page in cassette_pages(sys.argv[1], "google.com/search")
+        ]
+    else:
+        pages = [google_initial_page(count).encode() for count in (1, 10, 50, 200)]
+    print(f"{'page':>12}{'listings':>10}{'before':>14}{'scanner':>14}")
+    for content in sorted(pages, key=len):
+        listings = GoogleJobsScraper._find_job_info_initial_page(content)
+        # the previous search ran on the decoded page
+        before = timeit.timeit(
+            lambda: find_job_info_before(content.decode()), number=number
+        )
+        after = timeit.timeit(
+            lambda: GoogleJobsScraper._find_job_info_initial_page(content),
+            number=number,
+        )
+        same = find_job_info_before(content.decode()) == listings
+        print(
+            f"{len(content) // 1024:>10}kB{len(listings):>10}"
+            f"{before / number * 1000:>12.2f}ms{after / number * 1000:>12.2f}ms"
+            + ("" if same else "  (listings differ)")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compares the html parsers of the LinkedIn and ZipRecruiter page parsing.
+
+    python benchmarks/bench_html_parser.py
+"""
+
+import timeit
+
+from pages import linkedin_job_page, linkedin_search_page, ziprecruiter_job_page
+
+from jobspy.jobs import DescriptionFormat
+from jobspy.scrapers.utils import HTML_PARSERS, parse_html
+from jobspy.scrapers.linkedin import LinkedInScraper
+from jobspy.scrapers.ziprecruiter import ZipRecruiterScraper
+
+
+def available_parsers() -> list[str]:
+    parsers = []
+    for parser in HTML_PARSERS:
+        try:
+            parse_html("<p></p>", parser)
+        except Exception:
+            continue
+        parsers.append(parser)
+    return parsers
+
+
+def main(number: int = 50):
+    cases = {
+        "linkedin search page": lambda parser, html=linkedin_search_page(): (
+            parse_html(html, parser).find_all("div", class_="base-search-card")
+        ),
+        "linkedin job page": lambda parser, html=linkedin_job_page(): (
+            LinkedInScraper._parse_job_page(html, DescriptionFormat.HTML, parser)
+        ),
+        "linkedin job page, markdown": lambda parser, html=linkedin_job_page(): (
+            LinkedInScraper._parse_job_page(html, DescriptionFormat.MARKDOWN, parser)
+        ),
+        "ziprecruiter job page": lambda parser, html=ziprecruiter_job_page(): (
+            ZipRecruiterScraper._parse_job_page(html, DescriptionFormat.HTML, parser)
+        ),
+    }
+    parsers = available_parsers()
+    print(f"{'case':<30}" + "".join(f"{parser:>14}" for parser in parsers))
+    for name, case in cases.items():
+        outputs = {parser: case(parser) for parser in parsers}
+        timings = [
+            timeit.timeit(lambda: case(parser), number=number) / number * 1000
+            for parser in parsers
+        ]
+        row = "".join(f"{ms:>12.2f}ms" for ms in timings)
+        same = all(output == outputs[parsers[0]] for output in outputs.values())
+        print(f"{name:<30}{row}" + ("" if same else "  (outputs differ)"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Compares the single pass parsing of LinkedIn job pages with the previous parsing,
+which searched the whole page once per field.
+
+    python benchmarks/bench_linkedin_job_page.py [cassette]
+
+With a cassette recorded by jobspy.set_cassette, its LinkedIn job pages are used
+instead of the synthetic page.
+"""
+
+import sys
+import timeit
+from urllib.parse import unquote
+
+from bs4 import BeautifulSoup
+from pages import linkedin_job_page, cassette_pages
+
+from jobspy.jobs import DescriptionFormat
+from jobspy.scrapers.linkedin import LinkedInScraper
+from jobspy.scrapers.utils import (
+    remove_attributes,
+    get_enum_from_job_type,
+    markdown_converter,
+)
+
+
+def parse_job_page_before(html: str, description_format: DescriptionFormat) -> dict:
+    """The job page parsing replaced by LinkedInScraper._parse_job_page"""
+    soup = BeautifulSoup(html, "html.parser")
+    div_content = soup.find(
+        "div", class_=lambda x: x and "show-more-less-html__markup" in x
+    )
+    description = None
+    if div_content is not None:
+        div_content = remove_attributes(div_content)
+        description = div_content.prettify(formatter="html")
+        if description_format == DescriptionFormat.MARKDOWN:
+            description = markdown_converter(description)
+
+    h3_tag = soup.find(
+        "h3", string=lambda text: text and "Job function" in text.strip()
+    )
+    job_function = None
+    if h3_tag:
+        job_function_span = h3_tag.find_next(
+            "span", class_="description__job-criteria-text"
+        )
+        if job_function_span:
+            job_function = job_function_span.text.strip()
+
+    company_logo = (
+        logo_image.get("data-delayed-url")
+        if (logo_image := soup.find("img", {"class": "artdeco-entity-image"}))
+        else None
+    )
+
+    def criteria(name: str) -> str | None:
+        h3_tag = soup.find(
+            "h3",
+            class_="description__job-criteria-subheader",
+            string=lambda text: name in text,
+        )
+        if h3_tag:
+            span = h3_tag.find_next_sibling(
+                "span",
+                class_="description__job-criteria-text description__job-criteria-text--criteria",
+            )
+            if span:
+                return span.get_text(strip=True)
+        return None
+
+    employment_type = criteria("Employment type")
+    if employment_type:
+        employment_type = employment_type.lower().replace("-", "")
+
+    job_url_direct = None
+    job_url_direct_content = soup.find("code", id="applyUrl")
+    if job_url_direct_content:
+        job_url_direct_match = LinkedInScraper.job_url_direct_regex.search(
+            job_url_direct_content.decode_contents().strip()
+        )
+        if job_url_direct_match:
+            job_url_direct = unquote(job_url_direct_match.group())
+
+    return {
+        "description": description,
+        "job_level": criteria("Seniority level"),
+        "company_industry": criteria("Industries"),
+        "job_type": (
+            [get_enum_from_job_type(employment_type)] if employment_type else []
+        ),
+        "job_url_direct": job_url_direct,
+        "company_logo": company_logo,
+        "job_function": job_function,
+    }
+
+
+def normalized(details: dict) -> dict:
+    """Details with the whitespace of the description collapsed, since markdown is
+    no longer converted from prettified html"""
+    description = details["description"]
+    if description is not None:
+        description = " ".join(description.split())
+    return {**details, "description": description}
+
+
+def main(number: int = 50):
+    pages = cassette_pages(sys.argv[1], "/jobs/view/") if len(sys.argv) > 1 else []
+    pages = pages or [linkedin_job_page()]
+    print(f"{len(pages)} job pages")
+    for description_format in (DescriptionFormat.HTML, DescriptionFormat.MARKDOWN):
+        timings = []
+        for parse in (parse_job_page_before, LinkedInScraper._parse_job_page):
+            seconds = timeit.timeit(
+                lambda: [parse(page, description_format) for page in pages],
+                number=number,
+            )
+            timings.append(seconds / number / len(pages) * 1000)
+        same = all(
+            normalized(parse_job_page_before(page, description_format))
+            == normalized(LinkedInScraper._parse_job_page(page, description_format))
+            for page in pages
+        )
+        print(
+            f"{description_format.value:<10} before {timings[0]:.2f}ms"
+            f"  after {timings[1]:.2f}ms  ({timings[0] / timings[1]:.1f}x)"
+            + ("" if same else "  (outputs differ)")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compares the markdown conversion of descriptions with markdownify, which converted
+them before.
+
+    python benchmarks/bench_markdown.py
+"""
+
+import timeit
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+from pages import DESCRIPTION
+
+from jobspy.scrapers.markdown import (
+    html_to_markdown,
+    convert_markdown,
+    set_markdown_memo,
+)
+
+
+def indeed_page(count: int = 100, reposted: int = 30) -> list[str]:
+    """Descriptions of a page of jobs, some reposted for several locations"""
+    unique = [f"<p>Job {i}</p>{DESCRIPTION}" for i in range(count - reposted)]
+    return unique + unique[:reposted]
+
+
+def main(number: int = 5):
+    descriptions = indeed_page()
+    prettified = [
+        BeautifulSoup(html, "html.parser").prettify(formatter="html")
+        for html in descriptions
+    ]
+
+    def memoized():
+        set_markdown_memo()
+        return [convert_markdown(html) for html in descriptions]
+
+    cases = {
+        "markdownify of prettified html": lambda: [md(html) for html in prettified],
+        "markdownify": lambda: [md(html) for html in descriptions],
+        "converter": lambda: [html_to_markdown(html) for html in descriptions],
+        "converter, memoized": memoized,
+    }
+    print(f"{len(descriptions)} descriptions, {len(set(descriptions))} unique")
+    for name, case in cases.items():
+        seconds = timeit.timeit(case, number=number) / number
+        print(f"{name:<32}{seconds * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Synthetic job pages shaped like the LinkedIn, ZipRecruiter and Google pages the scrapers
+parse, so the benchmarks run offline. Record real pages with jobspy.set_cassette to
+benchmark against those instead.
+"""
+
+import gzip
+import json
+import base64
+
+PARAGRAPH = (
+    "We are looking for a <strong>Senior Software Engineer</strong> to join our "
+    "platform team. You will design, build &amp; operate services handling millions "
+    "of requests a day. Reach us at jobs@example.com.<br>"
+)
+BULLETS = "".join(
+    f"<li>Experience with {skill} in production &mdash; 3+ years</li>"
+    for skill in ("Python", "Go", "Kubernetes", "PostgreSQL", "Kafka", "AWS")
+)
+DESCRIPTION = (
+    f"<p>{PARAGRAPH * 3}</p><ul>{BULLETS}</ul><p><em>Salary</em> $150,000 - "
+    f"$190,000 a year. Full-time, remote.</p>"
+) * 4
+
+# navigation, scripts and recommendations around the job of a real page
+BOILERPLATE = (
+    "".join(
+        f'<li class="nav__item"><a class="nav__link" href="/jobs/view/{i}" '
+        f'data-tracking-control-name="public_jobs_nav-{i}">Similar job {i}</a>'
+        f'<img class="artdeco-entity-image--ghost" data-delayed-url="/img/{i}.png">'
+        f"</li>"
+        for i in range(300)
+    )
+    + '<script type="text/javascript">window.__config = {"a": 1};</script>' * 20
+)
+
+
+def linkedin_job_page(job_id: int = 1) -> str:
+    criteria = "".join(
+        f'<li class="description__job-criteria-item">'
+        f'<h3 class="description__job-criteria-subheader">{name}</h3>'
+        f'<span class="description__job-criteria-text '
+        f'description__job-criteria-text--criteria">{value}</span></li>'
+        for name, value in (
+            ("Seniority level", "Mid-Senior level"),
+            ("Employment type", "Full-time"),
+            ("Job function", "Engineering and Information Technology"),
+            ("Industries", "Software Development"),
+        )
+    )
+    return (
+        f"<!DOCTYPE html><html><head><title>Job {job_id}</title></head><body>"
+        f'<nav><ul class="nav">{BOILERPLATE}</ul></nav>'
+        f'<img class="artdeco-entity-image" data-delayed-url="/logo/{job_id}.png">'
+        f'<code id="applyUrl" style="display: none"><!--"https://www.linkedin.com'
+        f"/jobs/view/externalApply/{job_id}?url=https%3A%2F%2Fcareers.example.com"
+        f'%2Fjobs%2F{job_id}&urlHash=abc"--></code>'
+        f'<section class="description"><div class="description__text">'
+        f'<div class="show-more-less-html__markup relative overflow-hidden">'
+        f"{DESCRIPTION}</div></div>"
+        f'<ul class="description__job-criteria-list">{criteria}</ul></section>'
+        f"</body></html>"
+    )
+
+
+def linkedin_search_page(count: int = 10) -> str:
+    return "".join(
+        f'<li><div class="base-card base-search-card job-search-card">'
+        f'<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/'
+        f'software-engineer-at-example-{i}?refId=abc&trackingId=def"></a>'
+        f'<div class="base-search-card__info">'
+        f'<h3 class="base-search-card__title">Software Engineer {i}</h3>'
+        f'<h4 class="base-search-card__subtitle"><a href="https://www.linkedin.com'
+        f'/company/example-{i}?trk=x">Example {i}</a></h4>'
+        f'<div class="base-search-card__metadata">'
+        f'<span class="job-search-card__location">Austin, TX</span>'
+        f'<span class="job-search-card__salary-info">$150,000.00/yr - '
+        f"$190,000.00/yr</span>"
+        f'<time class="job-search-card__listdate" datetime="2024-05-01">1 day ago'
+        f"</time></div></div></div></li>"
+        for i in range(count)
+    )
+
+
+def ziprecruiter_job_page(job_id: int = 1) -> str:
+    model = {"model": {"saveJobURL": f"/job/save?job_url=https://example.com/{job_id}"}}
+    return (
+        f"<!DOCTYPE html><html><head><title>Job {job_id}</title></head><body>"
+        f'<nav><ul class="nav">{BOILERPLATE}</ul></nav>'
+        f'<div class="job_description" data-id="{job_id}">{DESCRIPTION}</div>'
+        f'<section class="company_description"><p>{PARAGRAPH}</p></section>'
+        f'<script type="application/json">{json.dumps(model)}</script>'
+        f"</body></html>"
+    )
+
+
+def google_job_info(job_id: int = 1) -> list:
+    job_info = [None] * 29
+    job_info[0] = f"Software Engineer {job_id}"
+    job_info[1] = f"Example {job_id}"
+    job_info[2] = "Austin, TX, United States"
+    job_info[3] = [[f"https://careers.example.com/jobs/{job_id}"]]
+    job_info[12] = "3 days ago"
+    job_info[19] = DESCRIPTION
+    job_info[28] = f"{job_id:x}"
+    return job_info
+
+
+def google_initial_page(count: int = 10) -> str:
+    listings = "".join(
+        f'<script nonce="x">AF_initDataCallback({{"data": [{{"520084652":'
+        f"{json.dumps(google_job_info(i))}}}]}});</script>"
+        f'<div class="job-card">{BOILERPLATE[:2000]}</div>'
+        for i in range(count)
+    )
+    return (
+        f"<!DOCTYPE html><html><head><title>jobs</title></head><body>"
+        f'<nav><ul class="nav">{BOILERPLATE}</ul></nav>{listings}'
+        f'<div jsname="Yust4d" data-async-fc="cursor{count}"></div>'
+        f"</body></html>"
+    )
+
+
+def cassette_pages(path: str, url_part: str) -> list[str]:
+    """Pages of the responses recorded to a cassette whose url contains url_part"""
+    pages = []
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            interaction = json.loads(line)
+            if url_part in interaction["request_url"]:
+                content = base64.b64decode(interaction["content"])
+                pages.append(content.decode(interaction["encoding"] or "utf-8"))
+    return pages
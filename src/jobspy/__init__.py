@@ -1,17 +1,48 @@
 from __future__ import annotations
 
+import queue
+import asyncio
+import threading
 import pandas as pd
-from typing import Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Tuple, Iterator
 
-from .jobs import JobType, Location
-from .scrapers.utils import set_logger_level, extract_salary, create_logger
+from .jobs import JobType, JobPost
+from .results import (
+    JobsFrameBuilder,
+    normalize_compensation,
+    deduplicate_jobs,
+    convert_output,
+    check_output_format,
+    check_columns,
+)
+from .scrapers.cache import set_response_cache
+from .scrapers.cassette import set_cassette
+from .scrapers.markdown import set_markdown_memo
+from .scrapers.metrics import metrics
+from .scrapers.retry import (
+    CircuitOpenError,
+    set_circuit_breaker,
+    reset_circuit_breakers,
+)
+from .scrapers.utils import (
+    set_logger_level,
+    create_logger,
+    get_executor,
+    set_executor,
+    set_site_workers,
+    run_concurrent,
+    set_http2,
+    set_html_parser,
+    set_rate_limit,
+    get_proxy_pool,
+)
 from .scrapers.indeed import IndeedScraper
 from .scrapers.ziprecruiter import ZipRecruiterScraper
 from .scrapers.glassdoor import GlassdoorScraper
 from .scrapers.google import GoogleJobsScraper
 from .scrapers.linkedin import LinkedInScraper
-from .scrapers import SalarySource, ScraperInput, Site, JobResponse, Country
+from .scrapers import ScraperInput, Site, JobResponse, Country
+from .pool import SCRAPER_MAPPING, ScraperPool, scraper_pool
 from .scrapers.exceptions import (
     LinkedInException,
     IndeedException,
@@ -20,6 +51,92 @@ from .scrapers.exceptions import (
     GoogleJobsException,
 )
 
+# seconds scrape_jobs_iter waits for a page before scraping a site nobody took up
+INLINE_SITE_WAIT = 0.1
+
+
+def _get_job_type(value_str: str | None) -> JobType | None:
+    if not value_str:
+        return None
+    for job_type in JobType:
+        if value_str in job_type.value:
+            return job_type
+    raise Exception(f"Invalid job type: {value_str}")
+
+
+def _get_site_types(
+    site_name: str | list[str] | Site | list[Site] | None,
+) -> list[Site]:
+    def map_str_to_site(site_name: str) -> Site:
+        return Site[site_name.upper()]
+
+    site_types = list(Site)
+    if isinstance(site_name, str):
+        site_types = [map_str_to_site(site_name)]
+    elif isinstance(site_name, Site):
+        site_types = [site_name]
+    elif isinstance(site_name, list):
+        site_types = [
+            map_str_to_site(site) if isinstance(site, str) else site
+            for site in site_name
+        ]
+    return site_types
+
+
+def _create_scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    offload_parsing: bool = False,
+    columns: list[str] | None = None,
+    output_format: str = "pandas",
+    **kwargs,
+) -> ScraperInput:
+    """
+    Validates the scrape_jobs arguments that are shared by all scrapers, and the
+    output arguments, so invalid values fail before any request is sent
+    """
+    check_output_format(output_format)
+    # Indeed shapes its query by the columns, so they are checked before it runs
+    check_columns(columns)
+    return ScraperInput(
+        site_type=_get_site_types(site_name),
+        country=Country.from_string(country_indeed),
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=_get_job_type(job_type),
+        easy_apply=easy_apply,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        results_wanted=results_wanted,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        offload_parsing=offload_parsing,
+        columns=columns,
+    )
+
+
+def _log_finished(site: Site):
+    cap_name = site.value.capitalize()
+    site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
+    create_logger(site_name).info(f"finished scraping")
+
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -41,51 +158,21 @@ def scrape_jobs(
     offset: int | None = 0,
     hours_old: int = None,
     enforce_annual_salary: bool = False,
+    deduplicate: bool = False,
+    offload_parsing: bool = False,
+    columns: list[str] | None = None,
+    output_format: str = "pandas",
     verbose: int = 2,
     **kwargs,
 ) -> pd.DataFrame:
     """
     Simultaneously scrapes job data from multiple job sites.
-    :return: pandas dataframe containing job data
+    :return: pandas dataframe containing job data, or a pyarrow.Table with
+        output_format arrow_table
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedInScraper,
-        Site.INDEED: IndeedScraper,
-        Site.ZIP_RECRUITER: ZipRecruiterScraper,
-        Site.GLASSDOOR: GlassdoorScraper,
-        Site.GOOGLE: GoogleJobsScraper,
-    }
     set_logger_level(verbose)
-
-    def map_str_to_site(site_name: str) -> Site:
-        return Site[site_name.upper()]
-
-    def get_enum_from_value(value_str):
-        for job_type in JobType:
-            if value_str in job_type.value:
-                return job_type
-        raise Exception(f"Invalid job type: {value_str}")
-
-    job_type = get_enum_from_value(job_type) if job_type else None
-
-    def get_site_type():
-        site_types = list(Site)
-        if isinstance(site_name, str):
-            site_types = [map_str_to_site(site_name)]
-        elif isinstance(site_name, Site):
-            site_types = [site_name]
-        elif isinstance(site_name, list):
-            site_types = [
-                map_str_to_site(site) if isinstance(site, str) else site
-                for site in site_name
-            ]
-        return site_types
-
-    country_enum = Country.from_string(country_indeed)
-
-    scraper_input = ScraperInput(
-        site_type=get_site_type(),
-        country=country_enum,
+    scraper_input = _create_scraper_input(
+        site_name=site_name,
         search_term=search_term,
         google_search_term=google_search_term,
         location=location,
@@ -93,165 +180,297 @@ def scrape_jobs(
         is_remote=is_remote,
         job_type=job_type,
         easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
         description_format=description_format,
         linkedin_fetch_description=linkedin_fetch_description,
-        results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
         offset=offset,
         hours_old=hours_old,
+        offload_parsing=offload_parsing,
+        columns=columns,
+        output_format=output_format,
     )
 
     def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        create_logger(site_name).info(f"finished scraping")
+        with scraper_pool.scraper(site, proxies=proxies, ca_cert=ca_cert) as scraper:
+            scraped_data: JobResponse = scraper.scrape(scraper_input)
+        _log_finished(site)
         return site.value, scraped_data
 
-    site_to_jobs_dict = {}
-
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
-
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
-
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    def convert_to_annual(job_data: dict):
-        if job_data["interval"] == "hourly":
-            job_data["min_amount"] *= 2080
-            job_data["max_amount"] *= 2080
-        if job_data["interval"] == "monthly":
-            job_data["min_amount"] *= 12
-            job_data["max_amount"] *= 12
-        if job_data["interval"] == "weekly":
-            job_data["min_amount"] *= 52
-            job_data["max_amount"] *= 52
-        if job_data["interval"] == "daily":
-            job_data["min_amount"] *= 260
-            job_data["max_amount"] *= 260
-        job_data["interval"] = "yearly"
-
-    jobs_dfs: list[pd.DataFrame] = []
+    site_to_jobs_dict = dict(run_concurrent(scrape_site, scraper_input.site_type))
 
+    builder = JobsFrameBuilder(
+        country=scraper_input.country,
+        hyperlinks=hyperlinks,
+        enforce_annual_salary=enforce_annual_salary,
+        deduplicate=deduplicate,
+        columns=columns,
+        output_format=output_format,
+    )
     for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["job_url_hyper"] = f'<a href="{job_url}">{job_url}</a>'
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
+        builder.add(site, job_response.jobs)
+    return builder.build()
+
+
+def scrape_jobs_iter(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    hyperlinks: bool = False,
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    offload_parsing: bool = False,
+    columns: list[str] | None = None,
+    output_format: str = "pandas",
+    verbose: int = 2,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    """
+    Simultaneously scrapes job data from multiple job sites, yielding every page as
+    soon as it has been parsed instead of waiting for all sites to finish.
+    :return: iterator of pandas dataframes, one per scraped page, with the same
+        columns as scrape_jobs
+    """
+    set_logger_level(verbose)
+    scraper_input = _create_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        offload_parsing=offload_parsing,
+        columns=columns,
+        output_format=output_format,
+    )
+    pages: queue.Queue[Tuple[Site, list[JobPost] | None]] = queue.Queue()
+    stopped = threading.Event()
+
+    def worker(site: Site):
+        try:
+            with scraper_pool.scraper(
+                site, proxies=proxies, ca_cert=ca_cert
+            ) as scraper:
+                for jobs in scraper.iter_pages(scraper_input):
+                    if stopped.is_set():
+                        break
+                    pages.put((site, jobs))
+            _log_finished(site)
+        finally:
+            pages.put((site, None))
+
+    def build_frame(site: Site, jobs: list[JobPost]):
+        builder = JobsFrameBuilder(
+            country=scraper_input.country,
+            hyperlinks=hyperlinks,
+            enforce_annual_salary=enforce_annual_salary,
+            columns=columns,
+            output_format=output_format,
+        )
+        builder.add(site.value, jobs)
+        return builder.build()
+
+    executor = get_executor()
+    future_to_site = {
+        site: executor.submit(worker, site) for site in scraper_input.site_type
+    }
+    remaining = len(future_to_site)
+    try:
+        while remaining:
+            try:
+                site, jobs = pages.get(timeout=INLINE_SITE_WAIT)
+            except queue.Empty:
+                # no thread of the shared pool took up a site, e.g. when called from
+                # one of its threads while the others are busy: scrape it here
+                site = next(
+                    (site for site, f in future_to_site.items() if f.cancel()), None
                 )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
-
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
+                if site is None:
+                    continue
+                with scraper_pool.scraper(
+                    site, proxies=proxies, ca_cert=ca_cert
+                ) as scraper:
+                    for jobs in scraper.iter_pages(scraper_input):
+                        yield build_frame(site, jobs)
+                _log_finished(site)
+                remaining -= 1
+                continue
+            if jobs is None:
+                remaining -= 1
+                future_to_site[site].result()
+                continue
+            yield build_frame(site, jobs)
+    finally:
+        stopped.set()
+
+
+async def scrape_jobs_async(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    hyperlinks: bool = False,
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    deduplicate: bool = False,
+    offload_parsing: bool = False,
+    columns: list[str] | None = None,
+    output_format: str = "pandas",
+    verbose: int = 2,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Awaitable variant of scrape_jobs. All sites are scraped concurrently on the
+    running event loop instead of a thread pool created per call.
+    :return: pandas dataframe containing job data
+    """
+    set_logger_level(verbose)
+    scraper_input = _create_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        offload_parsing=offload_parsing,
+        columns=columns,
+        output_format=output_format,
+    )
+
+    async def scrape_site(site: Site) -> Tuple[str, JobResponse]:
+        scraper = await asyncio.to_thread(
+            scraper_pool.acquire, site, proxies=proxies, ca_cert=ca_cert
+        )
+        try:
+            scraped_data = await scraper.scrape_async(scraper_input)
+        finally:
+            scraper_pool.release(scraper)
+        _log_finished(site)
+        return site.value, scraped_data
+
+    site_to_jobs = await asyncio.gather(
+        *(scrape_site(site) for site in scraper_input.site_type)
+    )
+
+    builder = JobsFrameBuilder(
+        country=scraper_input.country,
+        hyperlinks=hyperlinks,
+        enforce_annual_salary=enforce_annual_salary,
+        deduplicate=deduplicate,
+        columns=columns,
+        output_format=output_format,
+    )
+    for site, job_response in site_to_jobs:
+        builder.add(site, job_response.jobs)
+    return builder.build()
+
+
+def scrape_jobs_batch(
+    queries: list[dict],
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    max_workers: int = 10,
+    output_format: str = "pandas",
+    verbose: int = 2,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Scrapes many searches over the shared, already initialized scrapers of the
+    scraper pool, so cookies, tokens and connections are set up once per scraper
+    instead of once per search.
+    :param queries: scrape_jobs arguments of each search, e.g. search_term and location
+    :param max_workers: number of site searches of this call running at the same
+        time on the shared thread pool, across all queries
+    :param output_format: pandas, pandas_arrow or arrow_table, for all queries
+    :param kwargs: scrape_jobs arguments applied to every query
+    :return: pandas dataframe containing job data, with the index of the query in
+        queries as query_id
+    """
+    set_logger_level(verbose)
+    check_output_format(output_format)
+    builders: list[JobsFrameBuilder] = []
+    scraper_inputs: list[ScraperInput] = []
+    for query in queries:
+        query = {**kwargs, **query}
+        scraper_input = _create_scraper_input(**query)
+        scraper_inputs.append(scraper_input)
+        builders.append(
+            JobsFrameBuilder(
+                country=scraper_input.country,
+                hyperlinks=query.get("hyperlinks", False),
+                enforce_annual_salary=query.get("enforce_annual_salary", False),
+                deduplicate=query.get("deduplicate", False),
+                columns=query.get("columns"),
+                output_format="pandas" if output_format == "pandas" else "pandas_arrow",
             )
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-        # Desired column order
-        desired_order = [
-            "id",
-            "site",
-            "job_url_hyper" if hyperlinks else "job_url",
-            "job_url_direct",
-            "title",
-            "company",
-            "location",
-            "date_posted",
-            "job_type",
-            "salary_source",
-            "interval",
-            "min_amount",
-            "max_amount",
-            "currency",
-            "is_remote",
-            "job_level",
-            "job_function",
-            "listing_type",
-            "emails",
-            "description",
-            "company_industry",
-            "company_url",
-            "company_logo",
-            "company_url_direct",
-            "company_addresses",
-            "company_num_employees",
-            "company_revenue",
-            "company_description",
-        ]
+        )
 
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
+    def scrape_site(search: Tuple[int, Site]) -> Tuple[int, str, JobResponse]:
+        query_id, site = search
+        with scraper_pool.scraper(site, proxies=proxies, ca_cert=ca_cert) as scraper:
+            scraped_data = scraper.scrape(scraper_inputs[query_id])
+        return query_id, site.value, scraped_data
 
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
+    searches = [
+        (query_id, site)
+        for query_id, scraper_input in enumerate(scraper_inputs)
+        for site in scraper_input.site_type
+    ]
+    for query_id, site_value, scraped_data in run_concurrent(
+        scrape_site, searches, max_workers
+    ):
+        builders[query_id].add(site_value, scraped_data.jobs)
 
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
-    else:
-        return pd.DataFrame()
+    jobs_dfs = []
+    for query_id, builder in enumerate(builders):
+        jobs_df = builder.build()
+        if not jobs_df.empty:
+            jobs_df.insert(0, "query_id", query_id)
+            jobs_dfs.append(jobs_df)
+    if not jobs_dfs:
+        return convert_output(pd.DataFrame(), output_format)
+    return convert_output(pd.concat(jobs_dfs, ignore_index=True), output_format)
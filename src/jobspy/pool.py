@@ -0,0 +1,90 @@
+"""
+jobspy.pool
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the pool of initialized scrapers shared between searches.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+
+from .scrapers import Scraper, Site
+from .scrapers.indeed import IndeedScraper
+from .scrapers.ziprecruiter import ZipRecruiterScraper
+from .scrapers.glassdoor import GlassdoorScraper
+from .scrapers.google import GoogleJobsScraper
+from .scrapers.linkedin import LinkedInScraper
+
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: LinkedInScraper,
+    Site.INDEED: IndeedScraper,
+    Site.ZIP_RECRUITER: ZipRecruiterScraper,
+    Site.GLASSDOOR: GlassdoorScraper,
+    Site.GOOGLE: GoogleJobsScraper,
+}
+
+
+class ScraperPool:
+    """
+    Hands out initialized scrapers and takes them back after a search, so their
+    sessions, cookies and tokens are reused by the next search of the same site.
+    Scrapers are keyed by site, proxies and ca_cert, and a scraper is only used by
+    one search at a time.
+    """
+
+    def __init__(self, max_idle: int = 10):
+        self.max_idle = max_idle
+        self._idle: dict[tuple, list[Scraper]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(site: Site, proxies: list[str] | str | None, ca_cert: str | None) -> tuple:
+        if isinstance(proxies, list):
+            proxies = tuple(proxies)
+        return site, proxies, ca_cert
+
+    def acquire(
+        self,
+        site: Site,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+    ) -> Scraper:
+        key = self._key(site, proxies, ca_cert)
+        with self._lock:
+            if self._idle[key]:
+                return self._idle[key].pop()
+        return SCRAPER_MAPPING[site](proxies=proxies, ca_cert=ca_cert)
+
+    def release(self, scraper: Scraper):
+        scraper.reset()
+        with self._lock:
+            idle = self._idle[self._key(scraper.site, scraper.proxies, scraper.ca_cert)]
+            if len(idle) < self.max_idle:
+                idle.append(scraper)
+
+    def clear(self):
+        """Drops all idle scrapers, so the next searches start with new sessions"""
+        with self._lock:
+            self._idle.clear()
+
+    @contextmanager
+    def scraper(
+        self,
+        site: Site,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+    ) -> Iterator[Scraper]:
+        """
+        Borrows a scraper for one search. Scrapers that raised are discarded instead
+        of being returned to the pool.
+        """
+        scraper = self.acquire(site, proxies=proxies, ca_cert=ca_cert)
+        yield scraper
+        self.release(scraper)
+
+
+scraper_pool = ScraperPool()
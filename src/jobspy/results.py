@@ -0,0 +1,455 @@
+"""
+jobspy.results
+~~~~~~~~~~~~~~~~~~~
+
+This module contains routines to assemble scraped jobs into a DataFrame.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .jobs import JobPost, Country, Location
+from .scrapers import SalarySource
+from .scrapers.analysis import extract_salaries
+
+DESIRED_ORDER = [
+    "id",
+    "site",
+    "job_url",
+    "job_url_direct",
+    "title",
+    "company",
+    "location",
+    "date_posted",
+    "job_type",
+    "salary_source",
+    "interval",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "is_remote",
+    "job_level",
+    "job_function",
+    "listing_type",
+    "emails",
+    "description",
+    "company_industry",
+    "company_url",
+    "company_logo",
+    "company_url_direct",
+    "company_addresses",
+    "company_num_employees",
+    "company_revenue",
+    "company_description",
+]
+
+# factor that turns an amount paid per interval into a yearly amount
+INTERVAL_MULTIPLIERS = {
+    "yearly": 1,
+    "monthly": 12,
+    "weekly": 52,
+    "daily": 260,
+    "hourly": 2080,
+}
+
+# legal suffixes dropped from company names before comparing them
+COMPANY_SUFFIX_PATTERN = r"\b(?:inc|llc|ltd|gmbh|corp|corporation|co|company)\b"
+# normalized titles and companies of postings that are missing them
+MISSING_KEYS = ["", "n a"]
+
+# JobPost attributes copied into a column of the same name
+JOB_POST_COLUMNS = [
+    "id",
+    "job_url",
+    "job_url_direct",
+    "title",
+    "date_posted",
+    "is_remote",
+    "job_level",
+    "job_function",
+    "listing_type",
+    "description",
+    "company_industry",
+    "company_url",
+    "company_logo",
+    "company_url_direct",
+    "company_addresses",
+    "company_num_employees",
+    "company_revenue",
+    "company_description",
+]
+
+# pandas: object columns, pandas_arrow: pyarrow backed columns, arrow_table: pyarrow.Table
+OUTPUT_FORMATS = ("pandas", "pandas_arrow", "arrow_table")
+
+
+def desired_columns(hyperlinks: bool = False) -> list[str]:
+    """Column order of the result frame"""
+    if not hyperlinks:
+        return list(DESIRED_ORDER)
+    return [
+        "job_url_hyper" if column == "job_url" else column for column in DESIRED_ORDER
+    ]
+
+
+class JobsFrameBuilder:
+    """
+    Collects scraped jobs into per-column lists and creates the result frame once
+    """
+
+    def __init__(
+        self,
+        country: Country = Country.USA,
+        hyperlinks: bool = False,
+        enforce_annual_salary: bool = False,
+        deduplicate: bool = False,
+        columns: list[str] | None = None,
+        output_format: str = "pandas",
+    ):
+        check_output_format(output_format)
+        check_columns(columns)
+        self.country = country
+        self.hyperlinks = hyperlinks
+        self.enforce_annual_salary = enforce_annual_salary
+        self.deduplicate = deduplicate
+        self.column_selection = columns
+        self.output_format = output_format
+        self.columns: dict[str, list] = {
+            column: []
+            for column in JOB_POST_COLUMNS
+            + [
+                "site",
+                "company",
+                "location",
+                "job_type",
+                "emails",
+                "compensation",
+            ]
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def add(self, site: str, jobs: list[JobPost]):
+        """Appends the fields of each job to the column lists"""
+        columns = self.columns
+        for column in JOB_POST_COLUMNS:
+            columns[column].extend(getattr(job, column) for job in jobs)
+        columns["site"].extend([site] * len(jobs))
+        columns["company"].extend(job.company_name for job in jobs)
+        columns["location"].extend(job.location for job in jobs)
+        columns["job_type"].extend(job.job_type for job in jobs)
+        columns["emails"].extend(job.emails for job in jobs)
+        columns["compensation"].extend(job.compensation for job in jobs)
+
+    def _compensation_columns(self, columns: dict[str, list]):
+        """Unpacks the compensation column into the salary columns"""
+        compensations = columns.pop("compensation")
+        has_direct = [compensation is not None for compensation in compensations]
+        columns["interval"] = [
+            c.interval.value if c and c.interval else None for c in compensations
+        ]
+        columns["min_amount"] = [c.min_amount if c else None for c in compensations]
+        columns["max_amount"] = [c.max_amount if c else None for c in compensations]
+        columns["currency"] = [c.currency if c else None for c in compensations]
+        columns["salary_source"] = [
+            SalarySource.DIRECT_DATA.value if direct else None for direct in has_direct
+        ]
+        if self.country != Country.USA:
+            return
+        rows = [i for i, direct in enumerate(has_direct) if not direct]
+        salaries = extract_salaries([columns["description"][i] for i in rows])
+        for column in ("interval", "min_amount", "max_amount", "currency"):
+            for i, value in zip(rows, salaries[column].tolist()):
+                columns[column][i] = value
+        for i in rows:
+            columns["salary_source"][i] = SalarySource.DESCRIPTION.value
+
+    def _create_frame(self, columns: dict[str, list]) -> pd.DataFrame:
+        """
+        Creates the frame from the column lists. With an arrow output format the
+        strings are copied straight into arrow buffers instead of Python objects.
+        """
+        if self.output_format == "pandas":
+            return pd.DataFrame(columns)
+        return pd.DataFrame(
+            {column: _arrow_array(values) for column, values in columns.items()}
+        )
+
+    def build(self) -> pd.DataFrame | Any:
+        """
+        Creates the result frame with the desired column order
+        :return: jobs sorted by site and date posted, as a pyarrow.Table for the
+            arrow_table output format
+        """
+        if not len(self):
+            return convert_output(pd.DataFrame(), self.output_format)
+        columns = dict(self.columns)
+        self._compensation_columns(columns)
+        columns["location"] = [
+            Location.display_location(location) if location else None
+            for location in columns["location"]
+        ]
+        columns["job_type"] = [
+            (
+                ", ".join(job_type.value[0] for job_type in job_types)
+                if job_types
+                else None
+            )
+            for job_types in columns["job_type"]
+        ]
+        columns["emails"] = [
+            ", ".join(emails) if emails else None for emails in columns["emails"]
+        ]
+        jobs_df = self._create_frame(columns)
+        if self.hyperlinks:
+            jobs_df["job_url_hyper"] = (
+                '<a href="' + jobs_df["job_url"] + '">' + jobs_df["job_url"] + "</a>"
+            )
+        jobs_df = normalize_compensation(jobs_df, self.enforce_annual_salary)
+        jobs_df = jobs_df[desired_columns(self.hyperlinks)]
+        if self.deduplicate:
+            jobs_df = deduplicate_jobs(jobs_df)
+        jobs_df = jobs_df.sort_values(
+            by=["site", "date_posted"], ascending=[True, False]
+        ).reset_index(drop=True)
+        if self.column_selection is not None:
+            jobs_df = jobs_df[self._selected_columns(jobs_df)]
+        return convert_output(jobs_df, self.output_format)
+
+    def _selected_columns(self, jobs_df: pd.DataFrame) -> list[str]:
+        """Result columns kept for the column selection, in the desired order"""
+        selected = set(self.column_selection) | {"duplicate_sites"}
+        if "job_url" in selected:
+            selected.add("job_url_hyper")
+        return [column for column in jobs_df.columns if column in selected]
+
+
+def check_columns(columns: list[str] | None):
+    """Raises ValueError for columns that are not result columns"""
+    if columns is None:
+        return
+    unknown = set(columns) - set(DESIRED_ORDER)
+    if unknown:
+        raise ValueError(
+            f"Invalid columns: {sorted(unknown)}, expected any of {DESIRED_ORDER}"
+        )
+
+
+def check_output_format(output_format: str):
+    """Raises ValueError for an output_format other than OUTPUT_FORMATS"""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Invalid output_format: {output_format}, expected one of {OUTPUT_FORMATS}"
+        )
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for the pandas_arrow and arrow_table output formats,"
+            " install it with `pip install python-jobspy[arrow]`"
+        ) from e
+    return pyarrow
+
+
+def _arrow_array(values: list | pd.Series) -> Any:
+    """
+    Wraps values in a pyarrow backed array. Values arrow can't type, like lists of
+    mixed types or columns without any value, are left as they are.
+    """
+    pa = _import_pyarrow()
+    try:
+        array = pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return values
+    if pa.types.is_null(array.type):
+        return values
+    return pd.arrays.ArrowExtensionArray(array)
+
+
+def convert_output(jobs_df: pd.DataFrame, output_format: str = "pandas"):
+    """
+    Converts a result frame to an output format
+    :param jobs_df: result frame of scrape_jobs
+    :param output_format: pandas, pandas_arrow or arrow_table
+    :return: jobs_df, a frame with pyarrow backed columns or a pyarrow.Table
+    """
+    check_output_format(output_format)
+    if output_format == "pandas":
+        return jobs_df
+    pa = _import_pyarrow()
+    jobs_df = jobs_df.copy(deep=False)
+    for column in jobs_df.columns:
+        if not isinstance(jobs_df[column].dtype, pd.ArrowDtype):
+            jobs_df[column] = _arrow_array(jobs_df[column])
+    if output_format == "arrow_table":
+        return pa.Table.from_pandas(jobs_df, preserve_index=False)
+    return jobs_df
+
+
+def normalize_compensation(
+    jobs_df: pd.DataFrame, enforce_annual_salary: bool = False
+) -> pd.DataFrame:
+    """
+    Annualizes the salary columns and clears salary_source for jobs without an amount.
+    Works on any result frame, so stored results can be normalized again.
+    :param jobs_df: frame with interval, min_amount and max_amount columns
+    :param enforce_annual_salary: convert min/max amounts to yearly amounts
+    :return: normalized copy of jobs_df
+    """
+    jobs_df = jobs_df.copy()
+    if jobs_df.empty:
+        return jobs_df
+    min_amount = jobs_df["min_amount"].to_numpy(dtype=float, na_value=np.nan)
+    max_amount = jobs_df["max_amount"].to_numpy(dtype=float, na_value=np.nan)
+    has_min = np.nan_to_num(min_amount) != 0
+
+    if enforce_annual_salary:
+        multiplier = (
+            jobs_df["interval"]
+            .map(INTERVAL_MULTIPLIERS)
+            .to_numpy(dtype=float, na_value=np.nan)
+        )
+        annualize = (
+            ~np.isnan(multiplier)
+            & (multiplier != 1)
+            & has_min
+            & (np.nan_to_num(max_amount) != 0)
+        )
+        min_amount = np.where(annualize, min_amount * multiplier, min_amount)
+        max_amount = np.where(annualize, max_amount * multiplier, max_amount)
+        jobs_df["interval"] = jobs_df["interval"].mask(annualize, "yearly")
+        jobs_df["min_amount"] = min_amount
+        jobs_df["max_amount"] = max_amount
+
+    if "salary_source" in jobs_df:
+        salary_source = jobs_df["salary_source"]
+    else:
+        salary_source = pd.Series(
+            SalarySource.DIRECT_DATA.value, index=jobs_df.index, dtype=object
+        )
+    jobs_df["salary_source"] = salary_source.where(has_min, None)
+    return jobs_df
+
+
+def _normalize_text(values: pd.Series) -> pd.Series:
+    """Lowercases and replaces punctuation with single spaces"""
+    return (
+        values.fillna("")
+        .astype(str)
+        .str.lower()
+        .str.replace(r"[\W_]+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _fingerprint_keys(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalized title, company and city/state of each job. Locations are cut after
+    the state, since sites differ in how they print the country.
+    """
+    company = _normalize_text(jobs_df["company"])
+    company = company.str.replace(COMPANY_SUFFIX_PATTERN, "", regex=True)
+    location = jobs_df["location"].fillna("").astype(str).str.split(",").str[:2]
+    return pd.DataFrame(
+        {
+            "title": _normalize_text(jobs_df["title"]),
+            "company": company.str.split().str.join(" "),
+            "location": _normalize_text(location.str.join(" ")),
+        }
+    )
+
+
+def job_fingerprints(jobs_df: pd.DataFrame) -> pd.Series:
+    """
+    Hashes the normalized title, company and city/state of each job
+    :return: uint64 fingerprint per job
+    """
+    return pd.util.hash_pandas_object(_fingerprint_keys(jobs_df), index=False)
+
+
+def deduplicate_jobs(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Collapses a posting found on several sites into its richest record, the one with
+    the most fields filled in. Jobs of different sites are duplicates when their
+    fingerprints match or when they share the same job_url_direct. Jobs without a
+    title or company are only matched by job_url_direct, and distinct jobs of the
+    same site are never merged.
+    :param jobs_df: result frame of scrape_jobs
+    :return: deduplicated copy with the other sites of each posting in duplicate_sites
+    """
+    if jobs_df.empty:
+        return jobs_df.copy()
+    keys = _fingerprint_keys(jobs_df)
+    group = pd.factorize(pd.util.hash_pandas_object(keys, index=False))[0]
+    missing = keys["title"].isin(MISSING_KEYS) | keys["company"].isin(MISSING_KEYS)
+    missing = missing.to_numpy()
+    # every job missing its key is a fingerprint of its own
+    group[missing] = len(group) + np.flatnonzero(missing)
+    direct_url = (
+        jobs_df["job_url_direct"]
+        .astype("string")
+        .str.lower()
+        .str.replace(r"^https?://(?:www\.)?", "", regex=True)
+        .str.split("?")
+        .str[0]
+        .str.rstrip("/")
+    )
+    has_url = (direct_url.fillna("") != "").to_numpy()
+    if has_url.any():
+        # merge jobs sharing a direct url, then the jobs sharing a fingerprint with them
+        groups = pd.DataFrame({"group": group, "fingerprint": group})
+        groups.loc[has_url, "group"] = (
+            groups[has_url].groupby(direct_url[has_url].to_numpy())["group"]
+        ).transform("min")
+        group = groups.groupby("fingerprint")["group"].transform("min").to_numpy()
+
+    # the n-th job of each site in a group is merged with the n-th of the others
+    job_id = pd.factorize(jobs_df["id"])[0]
+    job_id = np.where(job_id == -1, len(job_id) + np.arange(len(job_id)), job_id)
+    nth = (
+        pd.DataFrame({"group": group, "site": jobs_df["site"].to_numpy(), "id": job_id})
+        .groupby(["group", "site"])["id"]
+        .rank(method="dense")
+        .to_numpy()
+    )
+    group = pd.factorize(pd.MultiIndex.from_arrays([group, nth]))[0]
+
+    description_length = jobs_df["description"].fillna("").astype(str).str.len()
+    ranked = pd.DataFrame(
+        {
+            "group": group,
+            "richness": jobs_df.notna().sum(axis=1).to_numpy(),
+            "description_length": description_length.to_numpy(),
+            "site": jobs_df["site"].to_numpy(),
+        }
+    )
+    ranked = ranked.sort_values(
+        ["group", "richness", "description_length"], ascending=[True, False, False]
+    )
+    kept = ranked.drop_duplicates("group")
+
+    other_sites = ranked.drop_duplicates(["group", "site"]).merge(
+        kept[["group", "site"]], on="group", suffixes=("", "_kept")
+    )
+    other_sites = other_sites[other_sites["site"] != other_sites["site_kept"]]
+    duplicate_sites = (
+        other_sites.sort_values("site").groupby("group")["site"].agg(", ".join)
+    )
+
+    kept_positions = np.sort(kept.index.to_numpy())
+    deduplicated = jobs_df.iloc[kept_positions].copy()
+    duplicate_sites = pd.Series(group[kept_positions]).map(duplicate_sites)
+    deduplicated.insert(
+        deduplicated.columns.get_loc("site") + 1,
+        "duplicate_sites",
+        duplicate_sites.astype(object).where(duplicate_sites.notna(), None).to_numpy(),
+    )
+    return deduplicated
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Iterator, AsyncIterator
 
 from ..jobs import (
     Enum,
     BaseModel,
     JobType,
+    JobPost,
     JobResponse,
     Country,
     DescriptionFormat,
 )
+from .metrics import metrics
+from .retry import CircuitOpenError
+from .utils import create_logger, rate_limiter, PacedStep
+
+logger = create_logger("Scraper")
 
 
 class Site(Enum):
@@ -40,6 +48,8 @@ class ScraperInput(BaseModel):
     linkedin_fetch_description: bool = False
     linkedin_company_ids: list[int] | None = None
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
+    offload_parsing: bool = False
+    columns: list[str] | None = None
 
     results_wanted: int = 15
     hours_old: int | None = None
@@ -52,6 +62,64 @@ class Scraper(ABC):
         self.site = site
         self.proxies = proxies
         self.ca_cert = ca_cert
+        self.scraper_input = None
+        self.seen_urls = set()
+
+    def reset(self):
+        """
+        Clears the state of the last search. Sessions, cookies and tokens are kept, so
+        the scraper can be reused for the next search without warming up again.
+        """
+        self.scraper_input = None
+        self.seen_urls = set()
 
     @abstractmethod
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Scrapes the site page by page, yielding the new jobs of each page as soon as
+        it has been parsed
+        """
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        scrape_pages, counting the jobs returned in the metrics. A site whose circuit
+        breaker opens stops there, keeping the pages already returned.
+        """
+        try:
+            for page in self.scrape_pages(scraper_input):
+                metrics.record_jobs(self.site.value, len(page))
+                yield page
+        except CircuitOpenError as e:
+            logger.error(f"{self.site.value}: {str(e)}")
+
+    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        jobs = [job for page in self.iter_pages(scraper_input) for job in page]
+        return JobResponse(jobs=jobs)
+
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        Awaitable variant of scrape_pages. The blocking sessions are bridged by
+        running each page step in the event loop's default executor, while the
+        rate limit waits between pages are awaited on the loop.
+        """
+        pages = self.iter_pages(scraper_input)
+        step = PacedStep()
+        try:
+            while True:
+                wait = rate_limiter.prepay(step)
+                if wait:
+                    await asyncio.sleep(wait)
+                page = await asyncio.to_thread(step.run, next, pages, None)
+                if page is None:
+                    return
+                yield page
+        finally:
+            rate_limiter.refund(step)
+
+    async def scrape_async(self, scraper_input: ScraperInput) -> JobResponse:
+        jobs = [
+            job async for page in self.scrape_pages_async(scraper_input) for job in page
+        ]
+        return JobResponse(jobs=jobs)
@@ -0,0 +1,261 @@
+"""
+jobspy.scrapers.analysis
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the analysis of job descriptions for emails, job types, remote
+work and salaries.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from ..jobs import CompensationInterval, JobType
+
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# longest local part and domain of an email, bounding the search around each @
+MAX_EMAIL_LOCAL = 64
+MAX_EMAIL_DOMAIN = 255
+# job types with a literal of their keyword, checked before their pattern
+JOB_TYPE_KEYWORDS = (
+    (JobType.FULL_TIME, "full", re.compile(r"full\s?time")),
+    (JobType.PART_TIME, "part", re.compile(r"part\s?time")),
+    (JobType.INTERNSHIP, "internship", None),
+    (JobType.CONTRACT, "contract", None),
+)
+REMOTE_KEYWORDS = ("remote", "work from home", "wfh")
+SALARY_RANGE_PATTERN = re.compile(
+    r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+)
+
+
+class TextAnalysis(NamedTuple):
+    emails: list[str] | None
+    job_types: list[JobType] | None
+    is_remote: bool
+
+
+def analyze_text(text: str | None) -> TextAnalysis:
+    """
+    Analyzes a description in one call, lowercasing it once for all keyword checks
+    and searching for emails only around its @ signs. Salaries are left to
+    extract_salaries, which the results frame runs over all descriptions at once.
+    """
+    if not text:
+        return TextAnalysis(None, [], False)
+    lower = text.lower()
+    return TextAnalysis(
+        emails=find_emails(text),
+        job_types=find_job_types(lower) or None,
+        is_remote=has_remote_keyword(lower),
+    )
+
+
+def find_emails(text: str) -> list[str]:
+    """Finds the emails in text, like EMAIL_PATTERN.findall but only near @ signs"""
+    emails = []
+    position = 0
+    at = text.find("@")
+    while at != -1:
+        match = EMAIL_PATTERN.search(
+            text, max(position, at - MAX_EMAIL_LOCAL), at + 1 + MAX_EMAIL_DOMAIN
+        )
+        if match is not None:
+            emails.append(match.group())
+            position = match.end()
+        at = text.find("@", max(position, at + 1))
+    return emails
+
+
+def find_job_types(lower: str) -> list[JobType]:
+    """
+    :param lower: lowercased description
+    :return: job types whose keywords the description mentions
+    """
+    return [
+        job_type
+        for job_type, literal, pattern in JOB_TYPE_KEYWORDS
+        if literal in lower and (pattern is None or pattern.search(lower))
+    ]
+
+
+def has_remote_keyword(lower: str) -> bool:
+    """
+    :param lower: lowercased text
+    """
+    return any(keyword in lower for keyword in REMOTE_KEYWORDS)
+
+
+def find_salary_range(text: str) -> re.Match | None:
+    """
+    Finds the first salary range in text, like SALARY_RANGE_PATTERN.search but only
+    trying the pattern at $ signs
+    """
+    dollar = text.find("$")
+    while dollar != -1:
+        match = SALARY_RANGE_PATTERN.match(text, dollar)
+        if match is not None:
+            return match
+        dollar = text.find("$", dollar + 1)
+    return None
+
+
+def extract_salary(
+    salary_str,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+):
+    """
+    Extracts salary information from a string and returns the salary interval, min and max salary values, and currency.
+    """
+    if not salary_str:
+        return None, None, None, None
+
+    annual_max_salary = None
+
+    def to_int(s):
+        return int(float(s.replace(",", "")))
+
+    def convert_hourly_to_annual(hourly_wage):
+        return hourly_wage * 2080
+
+    def convert_monthly_to_annual(monthly_wage):
+        return monthly_wage * 12
+
+    match = find_salary_range(salary_str)
+
+    if match:
+        min_salary = to_int(match.group(1))
+        max_salary = to_int(match.group(3))
+        # Handle 'k' suffix for min and max salaries independently
+        if "k" in match.group(2).lower() or "k" in match.group(4).lower():
+            min_salary *= 1000
+            max_salary *= 1000
+
+        # Convert to annual if less than the hourly threshold
+        if min_salary < hourly_threshold:
+            interval = CompensationInterval.HOURLY.value
+            annual_min_salary = convert_hourly_to_annual(min_salary)
+            if max_salary < hourly_threshold:
+                annual_max_salary = convert_hourly_to_annual(max_salary)
+
+        elif min_salary < monthly_threshold:
+            interval = CompensationInterval.MONTHLY.value
+            annual_min_salary = convert_monthly_to_annual(min_salary)
+            if max_salary < monthly_threshold:
+                annual_max_salary = convert_monthly_to_annual(max_salary)
+
+        else:
+            interval = CompensationInterval.YEARLY.value
+            annual_min_salary = min_salary
+            annual_max_salary = max_salary
+
+        # Ensure salary range is within specified limits
+        if not annual_max_salary:
+            return None, None, None, None
+        if (
+            lower_limit <= annual_min_salary <= upper_limit
+            and lower_limit <= annual_max_salary <= upper_limit
+            and annual_min_salary < annual_max_salary
+        ):
+            if enforce_annual_salary:
+                return interval, annual_min_salary, annual_max_salary, "USD"
+            else:
+                return interval, min_salary, max_salary, "USD"
+    return None, None, None, None
+
+
+def extract_salaries(
+    descriptions: pd.Series | list,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+) -> pd.DataFrame:
+    """
+    extract_salary over a column of descriptions. The salary ranges are found per
+    description, then classified, bounded and annualized for all of them at once.
+    :return: interval, min_amount, max_amount and currency columns, with the index
+        of descriptions and None where no salary was found
+    """
+    index = descriptions.index if isinstance(descriptions, pd.Series) else None
+    descriptions = list(descriptions)
+    found = np.zeros(len(descriptions), dtype=bool)
+    groups = [[], [], [], []]
+    for i, description in enumerate(descriptions):
+        if not isinstance(description, str):
+            continue
+        match = find_salary_range(description)
+        if match is not None:
+            found[i] = True
+            for values, value in zip(groups, match.groups()):
+                values.append(value)
+
+    def amounts(values: list[str]) -> np.ndarray:
+        column = np.full(len(descriptions), np.nan)
+        column[found] = np.trunc(
+            np.array([value.replace(",", "") for value in values], dtype=float)
+        )
+        return column
+
+    thousands = np.zeros(len(descriptions), dtype=bool)
+    thousands[found] = [bool(k or k_max) for k, k_max in zip(groups[1], groups[3])]
+    scale = np.where(thousands, 1000, 1)
+    min_salary = amounts(groups[0]) * scale
+    max_salary = amounts(groups[2]) * scale
+
+    with np.errstate(invalid="ignore"):
+        hourly = found & (min_salary < hourly_threshold)
+        monthly = found & ~hourly & (min_salary < monthly_threshold)
+        yearly = found & ~hourly & ~monthly
+        annual_min = np.select(
+            [hourly, monthly], [min_salary * 2080, min_salary * 12], min_salary
+        )
+        annual_max = np.select(
+            [
+                hourly & (max_salary < hourly_threshold),
+                monthly & (max_salary < monthly_threshold),
+                yearly,
+            ],
+            [max_salary * 2080, max_salary * 12, max_salary],
+            np.nan,
+        )
+        valid = (
+            (annual_max != 0)
+            & (lower_limit <= annual_min)
+            & (annual_min <= upper_limit)
+            & (lower_limit <= annual_max)
+            & (annual_max <= upper_limit)
+            & (annual_min < annual_max)
+        )
+
+    def column(values: np.ndarray) -> np.ndarray:
+        result = np.where(valid, values, 0).astype(np.int64).astype(object)
+        result[~valid] = None
+        return result
+
+    interval = np.select(
+        [hourly, monthly],
+        [CompensationInterval.HOURLY.value, CompensationInterval.MONTHLY.value],
+        CompensationInterval.YEARLY.value,
+    ).astype(object)
+    interval[~valid] = None
+    currency = np.where(valid, "USD", None)
+    return pd.DataFrame(
+        {
+            "interval": interval,
+            "min_amount": column(annual_min if enforce_annual_salary else min_salary),
+            "max_amount": column(annual_max if enforce_annual_salary else max_salary),
+            "currency": currency,
+        },
+        index=index,
+        dtype=object,
+    )
@@ -0,0 +1,212 @@
+"""
+jobspy.scrapers.cache
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the on-disk cache of detail page responses.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from typing import Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# seconds a cached response of a site stays valid, sites missing here are not cached
+CACHE_TTLS = {
+    "linkedin": 24 * 3600,
+    "zip_recruiter": 24 * 3600,
+    "glassdoor": 24 * 3600,
+}
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+
+def request_key(method: str, url: str, **kwargs) -> str:
+    """Hashes the method, url, params and body of a request"""
+    request = {
+        "method": method.upper(),
+        "url": url,
+        "params": kwargs.get("params"),
+        "data": kwargs.get("data"),
+        "json": kwargs.get("json"),
+    }
+    encoded = json.dumps(request, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def build_response(
+    url: str, status_code: int, headers: dict, encoding: str | None, content: bytes
+) -> requests.Response:
+    """Creates a requests response from stored fields"""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = encoding
+    response._content = content
+    return response
+
+
+class ResponseCache:
+    """
+    Stores responses zlib compressed in a SQLite database, keyed by method, url
+    and request body. Entries expire after the TTL of their site, and the least
+    recently used entries are evicted once the stored size exceeds max_size bytes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: dict[str, float] | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        self.path = path
+        self.ttls = dict(CACHE_TTLS if ttls is None else ttls)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                site TEXT,
+                url TEXT,
+                status_code INTEGER,
+                headers TEXT,
+                encoding TEXT,
+                content BLOB,
+                size INTEGER,
+                created REAL,
+                accessed REAL
+            )
+            """)
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._db.commit()
+        self.size = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    key = staticmethod(request_key)
+
+    def ttl(self, site: str | None) -> float | None:
+        return self.ttls.get(site)
+
+    def get(self, key: str, ttl: float) -> requests.Response | None:
+        """
+        :return: the cached response, or None if it is missing or older than ttl
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status_code, headers, encoding, content, created "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[5] + ttl < now:
+                self._delete([key])
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+        url, status_code, headers, encoding, content, _ = row
+        return build_response(
+            url, status_code, json.loads(headers), encoding, zlib.decompress(content)
+        )
+
+    def set(self, key: str, site: str, response: Any):
+        """Stores a response of a requests or tls_client session"""
+        content = zlib.compress(response.content)
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    site,
+                    str(response.url),
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    getattr(response, "encoding", None) or "utf-8",
+                    content,
+                    len(content),
+                    now,
+                    now,
+                ),
+            )
+            self.size += len(content) - (previous[0] if previous else 0)
+            if self.size > self.max_size:
+                self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        """Deletes the least recently used entries until 90% of max_size is left"""
+        excess = self.size - int(self.max_size * 0.9)
+        keys = []
+        for key, size in self._db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ):
+            if excess <= 0:
+                break
+            keys.append(key)
+            excess -= size
+        self._delete(keys)
+
+    def _delete(self, keys: list[str]):
+        for key in keys:
+            size = self._db.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if size:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.size -= size[0]
+        self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self.size = 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    return _response_cache
+
+
+def set_response_cache(
+    path: str | None,
+    ttls: dict[str, float] | None = None,
+    max_size: int = DEFAULT_MAX_SIZE,
+):
+    """
+    Caches detail page responses of all sessions in a SQLite file
+    :param path: database file, None turns the cache off
+    :param ttls: seconds a response stays valid per site, defaults to CACHE_TTLS
+    :param max_size: bytes of compressed responses kept before evicting
+    """
+    global _response_cache
+    previous, _response_cache = _response_cache, None
+    if previous is not None:
+        previous.close()
+    if path is not None:
+        _response_cache = ResponseCache(path, ttls=ttls, max_size=max_size)
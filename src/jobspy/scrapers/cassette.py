@@ -0,0 +1,100 @@
+"""
+jobspy.scrapers.cassette
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the cassettes recording and replaying the requests of all
+sessions, so scrapes can be benchmarked and tested without network.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import base64
+import threading
+from collections import defaultdict, deque
+from typing import Any
+
+import requests
+
+from .cache import request_key, build_response
+
+
+class CassetteError(Exception):
+    def __init__(self, message=None):
+        super().__init__(message or "Request missing from the cassette")
+
+
+class Cassette:
+    """
+    Gzipped JSON lines file of request / response pairs. In record mode every
+    response is appended to the file. In replay mode responses are served from the
+    file in the order they were recorded for each request, and requests that were
+    never recorded raise CassetteError.
+    """
+
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._responses: dict[str, deque[dict]] = defaultdict(deque)
+        if mode == "replay":
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    interaction = json.loads(line)
+                    self._responses[interaction["key"]].append(interaction)
+        else:
+            # truncate, the file is appended to on each request
+            gzip.open(path, "wt").close()
+
+    def play(self, method: str, url: str, **kwargs) -> requests.Response:
+        key = request_key(method, url, **kwargs)
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise CassetteError(f"{method} {url} missing from {self.path}")
+            # the last response of a request is replayed for any further repeats
+            interaction = responses.popleft() if len(responses) > 1 else responses[0]
+        return build_response(
+            interaction["url"],
+            interaction["status_code"],
+            interaction["headers"],
+            interaction["encoding"],
+            base64.b64decode(interaction["content"]),
+        )
+
+    def record(self, method: str, url: str, response: Any, **kwargs):
+        """Appends a response of a requests or tls_client session"""
+        interaction = {
+            "key": request_key(method, url, **kwargs),
+            "method": method.upper(),
+            "request_url": url,
+            "url": str(response.url),
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "encoding": getattr(response, "encoding", None) or "utf-8",
+            "content": base64.b64encode(response.content).decode(),
+        }
+        line = json.dumps(interaction) + "\n"
+        with self._lock:
+            with gzip.open(self.path, "at", encoding="utf-8") as file:
+                file.write(line)
+
+
+_cassette: Cassette | None = None
+
+
+def get_cassette() -> Cassette | None:
+    return _cassette
+
+
+def set_cassette(path: str | None, mode: str = "replay"):
+    """
+    Records the requests of all sessions to a cassette file, or replays them from it
+    :param path: cassette file, None turns recording and replaying off
+    :param mode: record or replay
+    """
+    global _cassette
+    _cassette = Cassette(path, mode) if path is not None else None
@@ -10,9 +10,8 @@ from __future__ import annotations
 import re
 import json
 import requests
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Iterator
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .constants import fallback_token, query_template, headers
 from .. import Scraper, ScraperInput, Site
@@ -21,13 +20,14 @@ from ..exceptions import GlassdoorException
 from ..utils import (
     create_session,
     markdown_converter,
+    map_cpu_bound,
+    map_concurrent,
 )
 from ...jobs import (
     JobPost,
     Compensation,
     CompensationInterval,
     Location,
-    JobResponse,
     JobType,
     DescriptionFormat,
 )
@@ -48,35 +48,44 @@ class GlassdoorScraper(Scraper):
         self.base_url = None
         self.country = None
         self.session = None
+        self.headers = None
+        self.csrf_tokens: dict[str, str] = {}
         self.scraper_input = None
         self.jobs_per_page = 30
         self.max_pages = 30
         self.seen_urls = set()
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
         Scrapes Glassdoor for jobs with scraper_input criteria.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: jobs found on each page.
         """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=True, has_retry=True
-        )
-        token = self._get_csrf_token()
-        headers["gd-csrf-token"] = token if token else fallback_token
-        self.session.headers.update(headers)
+        if self.session is None:
+            self.session = create_session(
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=True,
+                has_retry=True,
+                site=self.site.value,
+            )
+        if self.base_url not in self.csrf_tokens:
+            token = self._get_csrf_token()
+            self.csrf_tokens[self.base_url] = token if token else fallback_token
+        self.headers = {**headers, "gd-csrf-token": self.csrf_tokens[self.base_url]}
+        self.session.headers.update(self.headers)
 
         location_id, location_type = self._get_location(
             scraper_input.location, scraper_input.is_remote
         )
         if location_type is None:
             logger.error("Glassdoor: location not parsed")
-            return JobResponse(jobs=[])
-        job_list: list[JobPost] = []
+            return
+        job_count = 0
         cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
@@ -88,14 +97,15 @@ class GlassdoorScraper(Scraper):
                 jobs, cursor = self._fetch_jobs_page(
                     scraper_input, location_id, location_type, page, cursor
                 )
-                job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
-                    break
             except Exception as e:
                 logger.error(f"Glassdoor: {str(e)}")
                 break
-        return JobResponse(jobs=job_list)
+            jobs = jobs[: scraper_input.results_wanted - job_count]
+            job_count += len(jobs)
+            if jobs:
+                yield jobs
+            if not jobs or job_count >= scraper_input.results_wanted:
+                break
 
     def _fetch_jobs_page(
         self,
@@ -134,17 +144,22 @@ class GlassdoorScraper(Scraper):
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
-            }
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        try:
+            job_posts = map_concurrent(self._process_job, jobs_data, self.site.value)
+        except Exception as exc:
+            raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        jobs = [job_post for job_post in job_posts if job_post]
+        # the descriptions are converted in one batch once all of them are fetched
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            descriptions = map_cpu_bound(
+                markdown_converter,
+                [job_post.description for job_post in jobs],
+                offload=self.scraper_input.offload_parsing,
+            )
+            for job_post, description in zip(jobs, descriptions):
+                job_post.description = description
+        for job_post in jobs:
+            job_post.emails = extract_emails_from_text(job_post.description)
 
         return jobs, self.get_cursor_for_page(
             res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
@@ -213,14 +228,13 @@ class GlassdoorScraper(Scraper):
             compensation=compensation,
             is_remote=is_remote,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
             company_logo=company_logo,
             listing_type=listing_type,
         )
 
     def _fetch_job_description(self, job_id):
         """
-        Fetches the job description for a single job ID.
+        Fetches the job description html for a single job ID.
         """
         url = f"{self.base_url}/graph"
         body = [
@@ -247,14 +261,11 @@ class GlassdoorScraper(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(url, json=body, cache=True)
         if res.status_code != 200:
             return None
         data = res.json()[0]
-        desc = data["data"]["jobview"]["job"]["description"]
-        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            desc = markdown_converter(desc)
-        return desc
+        return data["data"]["jobview"]["job"]["description"]
 
     def _get_location(self, location: str, is_remote: bool) -> (int, str):
         if not location or is_remote:
@@ -10,24 +10,32 @@ from __future__ import annotations
 import math
 import re
 import json
-from typing import Tuple
+from typing import Tuple, Iterator
 from datetime import datetime, timedelta
 
 from .constants import headers_jobs, headers_initial, async_param
 from .. import Scraper, ScraperInput, Site
-from ..utils import extract_emails_from_text, create_logger, extract_job_type
+from ..analysis import analyze_text
+from ..utils import create_logger
 from ..utils import (
     create_session,
 )
 from ...jobs import (
     JobPost,
-    JobResponse,
     Location,
     JobType,
 )
 
 logger = create_logger("Google")
 
+# key of the job listings in the json of the initial page
+JOB_INFO_KEY = b'520084652":'
+BRACKET_OR_QUOTE = re.compile(rb'[\[\]"]')
+QUOTE_OR_ESCAPE = re.compile(rb'["\\]')
+FORWARD_CURSOR_PATTERN = re.compile(
+    rb'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
+)
+
 
 class GoogleJobsScraper(Scraper):
     def __init__(
@@ -47,31 +55,38 @@ class GoogleJobsScraper(Scraper):
         self.url = "https://www.google.com/search"
         self.jobs_url = "https://www.google.com/async/callback:550"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
         Scrapes Google for jobs with scraper_input criteria.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: jobs found on each page.
         """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
-
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
-        )
-        forward_cursor, job_list = self._get_initial_cursor_and_jobs()
+        start = scraper_input.offset
+        end = scraper_input.offset + scraper_input.results_wanted
+
+        if self.session is None:
+            self.session = create_session(
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=False,
+                has_retry=True,
+                site=self.site.value,
+            )
+        forward_cursor, jobs = self._get_initial_cursor_and_jobs()
+        if jobs[start:end]:
+            yield jobs[start:end]
+        job_count = len(jobs)
         if forward_cursor is None:
             logger.warning(
                 "initial cursor not found, try changing your query or there was at most 10 results"
             )
-            return JobResponse(jobs=job_list)
+            return
 
         page = 1
 
-        while (
-            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
-            and forward_cursor
-        ):
+        while len(self.seen_urls) < end and forward_cursor:
             logger.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
@@ -83,14 +98,11 @@ class GoogleJobsScraper(Scraper):
             if not jobs:
                 logger.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            page_jobs = jobs[max(start - job_count, 0) : max(end - job_count, 0)]
+            job_count += len(jobs)
+            if page_jobs:
+                yield page_jobs
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
     def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
         """Gets initial cursor and jobs to paginate through job listings"""
@@ -132,10 +144,9 @@ class GoogleJobsScraper(Scraper):
         params = {"q": query, "udm": "8"}
         response = self.session.get(self.url, headers=headers_initial, params=params)
 
-        pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
-        match_fc = re.search(pattern_fc, response.text)
-        data_async_fc = match_fc.group(1) if match_fc else None
-        jobs_raw = self._find_job_info_initial_page(response.text)
+        match_fc = FORWARD_CURSOR_PATTERN.search(response.content)
+        data_async_fc = match_fc.group(1).decode() if match_fc else None
+        jobs_raw = self._find_job_info_initial_page(response.content)
         jobs = []
         for job_raw in jobs_raw:
             job_post = self._parse_job(job_raw)
@@ -193,6 +204,7 @@ class GoogleJobsScraper(Scraper):
             date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
         description = job_info[19]
+        analysis = analyze_text(description)
 
         job_post = JobPost(
             id=f"go-{job_info[28]}",
@@ -203,10 +215,10 @@ class GoogleJobsScraper(Scraper):
             ),
             job_url=job_url,
             date_posted=date_posted,
-            is_remote="remote" in description.lower() or "wfh" in description.lower(),
+            is_remote=analysis.is_remote,
             description=description,
-            emails=extract_emails_from_text(description),
-            job_type=extract_job_type(description),
+            emails=analysis.emails,
+            job_type=analysis.job_types,
         )
         return job_post
 
@@ -229,22 +241,55 @@ class GoogleJobsScraper(Scraper):
         return None
 
     @staticmethod
-    def _find_job_info_initial_page(html_text: str):
-        pattern = (
-            f'520084652":('
-            + r"\[(?:[^\[\]]|\[(?:[^\[\]]|\[(?:[^\[\]]|\[[^\[\]]*\])*\])*\])*\])"
-        )
+    def _find_job_info_initial_page(content: bytes) -> list:
+        """
+        Finds the job listings of the initial page, matching the brackets of each
+        520084652 array in one linear scan of the page bytes
+        """
         results = []
-        matches = re.finditer(pattern, html_text)
-
-        import json
+        key = content.find(JOB_INFO_KEY)
+        while key != -1:
+            start = key + len(JOB_INFO_KEY)
+            end = start
+            if content.startswith(b"[", start):
+                end = find_array_end(content, start)
+                if end == -1:
+                    logger.error("Unterminated job listing on the initial page")
+                    break
+                try:
+                    results.append(json.loads(content[start:end]))
+                except json.JSONDecodeError as e:
+                    logger.error(f"Failed to parse job listing: {str(e)}")
+            key = content.find(JOB_INFO_KEY, end)
+        return results
 
-        for match in matches:
-            try:
-                parsed_data = json.loads(match.group(1))
-                results.append(parsed_data)
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse match: {str(e)}")
-                results.append({"raw_match": match.group(0), "error": str(e)})
-        return results
+def find_array_end(content: bytes, start: int) -> int:
+    """
+    :param start: index of the [ opening a json array in content
+    :return: index after the ] closing the array, or -1 if content ends before it
+    """
+    depth = 0
+    position = start
+    while True:
+        match = BRACKET_OR_QUOTE.search(content, position)
+        if match is None:
+            return -1
+        position = match.end()
+        char = match.group()
+        if char == b'"':
+            # skips the string, brackets inside it are text
+            while True:
+                match = QUOTE_OR_ESCAPE.search(content, position)
+                if match is None:
+                    return -1
+                position = match.end()
+                if match.group() == b'"':
+                    break
+                position += 1
+        elif char == b"[":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return position
@@ -8,15 +8,23 @@ This module contains routines to scrape Indeed.
 from __future__ import annotations
 
 import math
-from typing import Tuple
+from typing import Tuple, Iterator
 from datetime import datetime
 
-from .constants import job_search_query, api_headers
+from .constants import (
+    job_search_query,
+    job_base_fields,
+    job_fields,
+    column_job_fields,
+    description_salary_columns,
+    api_headers,
+)
 from .. import Scraper, ScraperInput, Site
+from ..analysis import analyze_text, has_remote_keyword
 from ..utils import (
-    extract_emails_from_text,
     get_enum_from_job_type,
     markdown_converter,
+    map_cpu_bound,
     create_session,
     create_logger,
 )
@@ -25,8 +33,8 @@ from ...jobs import (
     Compensation,
     CompensationInterval,
     Location,
-    JobResponse,
     JobType,
+    Country,
     DescriptionFormat,
 )
 
@@ -40,10 +48,13 @@ class IndeedScraper(Scraper):
         """
         Initializes IndeedScraper with the Indeed API url
         """
-        super().__init__(Site.INDEED, proxies=proxies)
+        super().__init__(Site.INDEED, proxies=proxies, ca_cert=ca_cert)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=ca_cert, is_tls=False
+            proxies=self.proxies,
+            ca_cert=ca_cert,
+            is_tls=False,
+            site=self.site.value,
         )
         self.scraper_input = None
         self.jobs_per_page = 100
@@ -54,23 +65,25 @@ class IndeedScraper(Scraper):
         self.base_url = None
         self.api_url = "https://apis.indeed.com/graphql"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
         Scrapes Indeed for jobs with scraper_input criteria
         :param scraper_input:
-        :return: job_response
+        :return: jobs found on each page
         """
         self.scraper_input = scraper_input
         domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
         self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
-        job_list = []
+        start = scraper_input.offset
+        end = scraper_input.offset + scraper_input.results_wanted
+        job_count = 0
         page = 1
 
         cursor = None
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+        while len(self.seen_urls) < end:
             logger.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
@@ -78,14 +91,11 @@ class IndeedScraper(Scraper):
             if not jobs:
                 logger.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            page_jobs = jobs[max(start - job_count, 0) : max(end - job_count, 0)]
+            job_count += len(jobs)
+            if page_jobs:
+                yield page_jobs
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
     def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
         """
@@ -111,6 +121,7 @@ class IndeedScraper(Scraper):
             dateOnIndeed=self.scraper_input.hours_old,
             cursor=f'cursor: "{cursor}"' if cursor else "",
             filters=filters,
+            job_fields=self._build_job_fields(),
         )
         payload = {
             "query": query,
@@ -132,14 +143,46 @@ class IndeedScraper(Scraper):
         jobs = data["data"]["jobSearch"]["results"]
         new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
 
+        descriptions = [
+            (job["job"].get("description") or {}).get("html") for job in jobs
+        ]
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            descriptions = map_cpu_bound(
+                markdown_converter,
+                descriptions,
+                offload=self.scraper_input.offload_parsing,
+            )
+
         job_list = []
-        for job in jobs:
-            processed_job = self._process_job(job["job"])
+        for job, description in zip(jobs, descriptions):
+            processed_job = self._process_job(job["job"], description)
             if processed_job:
                 job_list.append(processed_job)
 
         return job_list, new_cursor
 
+    def _build_job_fields(self) -> str:
+        """
+        Builds the selection of the job payload, trimmed to the fields needed by the
+        selected columns. All fields are requested without a column selection.
+        """
+        columns = self.scraper_input.columns
+        if columns is None:
+            names = set(job_fields) - {"employer"}
+        else:
+            names = {
+                name for column in columns for name in column_job_fields.get(column, [])
+            }
+            if self.scraper_input.country == Country.USA and (
+                description_salary_columns.intersection(columns)
+            ):
+                names.add("description")
+            if "employer_details" in names:
+                names.discard("employer")
+        return job_base_fields + "".join(
+            fields for name, fields in job_fields.items() if name in names
+        )
+
     def _build_filters(self):
         """
         Builds the filters dict for job type/is_remote. If hours_old is provided, composite filter for job_type/is_remote is not possible.
@@ -198,32 +241,33 @@ class IndeedScraper(Scraper):
                 """
         return filters_str
 
-    def _process_job(self, job: dict) -> JobPost | None:
+    def _process_job(self, job: dict, description: str | None) -> JobPost | None:
         """
         Parses the job dict into JobPost model
         :param job: dict to parse
+        :param description: job description in the requested format
         :return: JobPost if it's a new job
         """
         job_url = f'{self.base_url}/viewjob?jk={job["key"]}'
         if job_url in self.seen_urls:
             return
         self.seen_urls.add(job_url)
-        description = job["description"]["html"]
-        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
 
-        job_type = self._get_job_type(job["attributes"])
+        job_type = self._get_job_type(job.get("attributes") or [])
         timestamp_seconds = job["datePublished"] / 1000
         date_posted = datetime.fromtimestamp(timestamp_seconds).strftime("%Y-%m-%d")
-        employer = job["employer"].get("dossier") if job["employer"] else None
+        employer = job["employer"].get("dossier") if job.get("employer") else None
         employer_details = employer.get("employerDetails", {}) if employer else {}
-        rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
+        rel_url = (
+            job["employer"]["relativeCompanyPageUrl"] if job.get("employer") else None
+        )
+        analysis = analyze_text(description)
         return JobPost(
             id=f'in-{job["key"]}',
             title=job["title"],
             description=description,
             company_name=job["employer"].get("name") if job.get("employer") else None,
-            company_url=(f"{self.base_url}{rel_url}" if job["employer"] else None),
+            company_url=(f"{self.base_url}{rel_url}" if job.get("employer") else None),
             company_url_direct=(
                 employer["links"]["corporateWebsite"] if employer else None
             ),
@@ -233,14 +277,18 @@ class IndeedScraper(Scraper):
                 country=job.get("location", {}).get("countryCode"),
             ),
             job_type=job_type,
-            compensation=self._get_compensation(job["compensation"]),
+            compensation=(
+                self._get_compensation(job["compensation"])
+                if job.get("compensation")
+                else None
+            ),
             date_posted=date_posted,
             job_url=job_url,
             job_url_direct=(
                 job["recruit"].get("viewJobUrl") if job.get("recruit") else None
             ),
-            emails=extract_emails_from_text(description) if description else None,
-            is_remote=self._is_job_remote(job, description),
+            emails=analysis.emails,
+            is_remote=analysis.is_remote or self._is_job_remote(job),
             company_addresses=(
                 employer_details["addresses"][0]
                 if employer_details.get("addresses")
@@ -313,25 +361,17 @@ class IndeedScraper(Scraper):
         )
 
     @staticmethod
-    def _is_job_remote(job: dict, description: str) -> bool:
+    def _is_job_remote(job: dict) -> bool:
         """
-        Searches the description, location, and attributes to check if job is remote
+        Searches the location and attributes to check if job is remote, the
+        description is checked by analyze_text
         """
-        remote_keywords = ["remote", "work from home", "wfh"]
         is_remote_in_attributes = any(
-            any(keyword in attr["label"].lower() for keyword in remote_keywords)
-            for attr in job["attributes"]
-        )
-        is_remote_in_description = any(
-            keyword in description.lower() for keyword in remote_keywords
-        )
-        is_remote_in_location = any(
-            keyword in job["location"]["formatted"]["long"].lower()
-            for keyword in remote_keywords
-        )
-        return (
-            is_remote_in_attributes or is_remote_in_description or is_remote_in_location
+            has_remote_keyword(attr["label"].lower())
+            for attr in job.get("attributes") or []
         )
+        location = ((job.get("location") or {}).get("formatted") or {}).get("long")
+        return is_remote_in_attributes or has_remote_keyword((location or "").lower())
 
     @staticmethod
     def _get_compensation_interval(interval: str) -> CompensationInterval:
@@ -14,61 +14,88 @@ job_search_query = """
         results {{
             trackingKey
             job {{
-            source {{
-                name
+            {job_fields}
             }}
+        }}
+        }}
+    }}
+    """
+
+# selections of the job payload, requested only when a selected column needs them
+job_base_fields = """
+            source {
+                name
+            }
             key
             title
             datePublished
             dateOnIndeed
-            description {{
+"""
+
+job_fields = {
+    "description": """
+            description {
                 html
-            }}
-            location {{
+            }
+""",
+    "location": """
+            location {
                 countryName
                 countryCode
                 admin1Code
                 city
                 postalCode
                 streetAddress
-                formatted {{
+                formatted {
                 short
                 long
-                }}
-            }}
-            compensation {{
-                estimated {{
+                }
+            }
+""",
+    "compensation": """
+            compensation {
+                estimated {
                 currencyCode
-                baseSalary {{
+                baseSalary {
                     unitOfWork
-                    range {{
-                    ... on Range {{
+                    range {
+                    ... on Range {
                         min
                         max
-                    }}
-                    }}
-                }}
-                }}
-                baseSalary {{
+                    }
+                    }
+                }
+                }
+                baseSalary {
                 unitOfWork
-                range {{
-                    ... on Range {{
+                range {
+                    ... on Range {
                     min
                     max
-                    }}
-                }}
-                }}
+                    }
+                }
+                }
                 currencyCode
-            }}
-            attributes {{
+            }
+""",
+    "attributes": """
+            attributes {
                 key
                 label
-            }}
-            employer {{
+            }
+""",
+    "employer": """
+            employer {
                 relativeCompanyPageUrl
                 name
-                dossier {{
-                    employerDetails {{
+            }
+""",
+    "employer_details": """
+            employer {
+                relativeCompanyPageUrl
+                name
+                dossier {
+                    employerDetails {
                     addresses
                     industry
                     employeesLocalizedLabel
@@ -76,26 +103,57 @@ job_search_query = """
                     briefDescription
                     ceoName
                     ceoPhotoUrl
-                    }}
-                    images {{
+                    }
+                    images {
                         headerImageUrl
                         squareLogoUrl
-                    }}
-                    links {{
+                    }
+                    links {
                     corporateWebsite
-                }}
-                }}
-            }}
-            recruit {{
+                }
+                }
+            }
+""",
+    "recruit": """
+            recruit {
                 viewJobUrl
                 detailedSalary
                 workSchedule
-            }}
-            }}
-        }}
-        }}
-    }}
-    """
+            }
+""",
+}
+
+# job_fields needed by each result column, columns missing here only need the base
+column_job_fields = {
+    "description": ["description"],
+    "emails": ["description"],
+    "location": ["location"],
+    "is_remote": ["attributes", "location", "description"],
+    "job_type": ["attributes"],
+    "interval": ["compensation"],
+    "min_amount": ["compensation"],
+    "max_amount": ["compensation"],
+    "currency": ["compensation"],
+    "salary_source": ["compensation"],
+    "company": ["employer"],
+    "company_url": ["employer"],
+    "company_url_direct": ["employer_details"],
+    "company_addresses": ["employer_details"],
+    "company_industry": ["employer_details"],
+    "company_num_employees": ["employer_details"],
+    "company_revenue": ["employer_details"],
+    "company_description": ["employer_details"],
+    "company_logo": ["employer_details"],
+    "job_url_direct": ["recruit"],
+}
+# salary columns, also filled from the descriptions of jobs in the USA
+description_salary_columns = {
+    "interval",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "salary_source",
+}
 
 api_headers = {
     "Host": "apis.indeed.com",
@@ -8,24 +8,29 @@ This module contains routines to scrape LinkedIn.
 from __future__ import annotations
 
 import math
-import time
-import random
 import regex as re
-from typing import Optional
+from typing import Optional, Iterator
 from datetime import datetime
+from functools import partial
 
 from bs4.element import Tag
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from urllib.parse import urlparse, urlunparse, unquote
 
 from .constants import headers
 from .. import Scraper, ScraperInput, Site
 from ..exceptions import LinkedInException
-from ..utils import create_session, remove_attributes, create_logger
+from ..utils import (
+    create_session,
+    remove_attributes,
+    create_logger,
+    map_cpu_bound,
+    parse_html,
+    get_html_parser,
+)
 from ...jobs import (
     JobPost,
     Location,
-    JobResponse,
     JobType,
     Country,
     Compensation,
@@ -43,9 +48,17 @@ logger = create_logger("LinkedIn")
 
 class LinkedInScraper(Scraper):
     base_url = "https://www.linkedin.com"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 25
+    job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
+    # elements of a job page holding its details, the rest of the page is skipped
+    job_page_strainer = SoupStrainer(
+        attrs={
+            "class": re.compile(
+                r"(?:^|\s)(?:show-more-less-html__markup|artdeco-entity-image"
+                r"|description__job-criteria-(?:subheader|text))(?:\s|$)"
+            )
+        }
+    )
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None
@@ -61,20 +74,20 @@ class LinkedInScraper(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            site=self.site.value,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
         self.country = "worldwide"
-        self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
         Scrapes LinkedIn for jobs with scraper_input criteria
         :param scraper_input:
-        :return: job_response
+        :return: jobs found on each page
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         seen_ids = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
         request_count = 0
@@ -82,7 +95,7 @@ class LinkedInScraper(Scraper):
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+            lambda: job_count < scraper_input.results_wanted and start < 1000
         )
         while continue_search():
             request_count += 1
@@ -127,19 +140,21 @@ class LinkedInScraper(Scraper):
                         err = f"LinkedIn response status code {response.status_code}"
                         err += f" - {response.text}"
                     logger.error(err)
-                    return JobResponse(jobs=job_list)
+                    return
             except Exception as e:
                 if "Proxy responded with" in str(e):
                     logger.error(f"LinkedIn: Bad proxy")
                 else:
                     logger.error(f"LinkedIn: {str(e)}")
-                return JobResponse(jobs=job_list)
+                return
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_html(response.text)
             job_cards = soup.find_all("div", class_="base-search-card")
             if len(job_cards) == 0:
-                return JobResponse(jobs=job_list)
+                return
 
+            page_jobs: list[JobPost] = []
+            page_job_ids: list[str] = []
             for job_card in job_cards:
                 href_tag = job_card.find("a", class_="base-card__full-link")
                 if href_tag and "href" in href_tag.attrs:
@@ -151,25 +166,30 @@ class LinkedInScraper(Scraper):
                     seen_ids.add(job_id)
 
                     try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
-                        job_post = self._process_job(job_card, job_id, fetch_desc)
+                        job_post = self._process_job(job_card, job_id)
                         if job_post:
-                            job_list.append(job_post)
+                            page_jobs.append(job_post)
+                            page_job_ids.append(job_id)
+                            job_count += 1
                         if not continue_search():
                             break
                     except Exception as e:
                         raise LinkedInException(str(e))
 
-            if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                start += len(job_list)
+            try:
+                self._add_job_details(
+                    page_jobs, page_job_ids, scraper_input.linkedin_fetch_description
+                )
+            except Exception as e:
+                raise LinkedInException(str(e))
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+            if page_jobs:
+                yield page_jobs
 
-    def _process_job(
-        self, job_card: Tag, job_id: str, full_descr: bool
-    ) -> Optional[JobPost]:
+            if continue_search():
+                start += job_count
+
+    def _process_job(self, job_card: Tag, job_id: str) -> Optional[JobPost]:
         salary_tag = job_card.find("span", class_="job-search-card__salary-info")
 
         compensation = None
@@ -213,9 +233,6 @@ class LinkedInScraper(Scraper):
                 date_posted = datetime.strptime(datetime_str, "%Y-%m-%d")
             except:
                 date_posted = None
-        job_details = {}
-        if full_descr:
-            job_details = self._get_job_details(job_id)
 
         return JobPost(
             id=f"li-{job_id}",
@@ -226,70 +243,134 @@ class LinkedInScraper(Scraper):
             date_posted=date_posted,
             job_url=f"{self.base_url}/jobs/view/{job_id}",
             compensation=compensation,
-            job_type=job_details.get("job_type"),
-            job_level=job_details.get("job_level", "").lower(),
-            company_industry=job_details.get("company_industry"),
-            description=job_details.get("description"),
-            job_url_direct=job_details.get("job_url_direct"),
-            emails=extract_emails_from_text(job_details.get("description")),
-            company_logo=job_details.get("company_logo"),
-            job_function=job_details.get("job_function"),
         )
 
-    def _get_job_details(self, job_id: str) -> dict:
+    def _add_job_details(
+        self, job_posts: list[JobPost], job_ids: list[str], full_descr: bool
+    ):
         """
-        Retrieves job description and other job details by going to the job page url
-        :param job_page_url:
-        :return: dict
+        Sets the details of the jobs of a page from their job pages. The pages are
+        fetched first and then parsed in one batch, see map_cpu_bound.
+        :param job_posts: jobs of a page
+        :param job_ids: LinkedIn ids of job_posts
+        :param full_descr: fetch the job pages, otherwise the jobs get no details
+        """
+        if full_descr:
+            pages = [self._fetch_job_page(job_id) for job_id in job_ids]
+        else:
+            pages = [None] * len(job_ids)
+        parse_job_page = partial(
+            self._parse_job_page,
+            description_format=self.scraper_input.description_format,
+            parser=get_html_parser(),
+        )
+        details = iter(
+            map_cpu_bound(
+                parse_job_page,
+                [page for page in pages if page is not None],
+                offload=self.scraper_input.offload_parsing,
+            )
+        )
+        for job_post, page in zip(job_posts, pages):
+            job_details = next(details) if page is not None else {}
+            job_post.job_type = job_details.get("job_type")
+            job_post.job_level = job_details.get("job_level", "").lower()
+            job_post.company_industry = job_details.get("company_industry")
+            job_post.description = job_details.get("description")
+            job_post.job_url_direct = job_details.get("job_url_direct")
+            job_post.emails = extract_emails_from_text(job_details.get("description"))
+            job_post.company_logo = job_details.get("company_logo")
+            job_post.job_function = job_details.get("job_function")
+
+    def _fetch_job_page(self, job_id: str) -> str | None:
+        """
+        Fetches the job page of a job
+        :param job_id:
+        :return: html of the page, None if it could not be fetched
         """
         try:
             response = self.session.get(
-                f"{self.base_url}/jobs/view/{job_id}", timeout=5
+                f"{self.base_url}/jobs/view/{job_id}", timeout=5, cache=True
             )
             response.raise_for_status()
         except:
-            return {}
+            return None
         if "linkedin.com/signup" in response.url:
-            return {}
+            return None
+        return response.text
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        div_content = soup.find(
-            "div", class_=lambda x: x and "show-more-less-html__markup" in x
-        )
+    @staticmethod
+    def _parse_job_page(
+        html: str, description_format: DescriptionFormat, parser: str | None = None
+    ) -> dict:
+        """
+        Parses the job details out of a job page. Only the elements holding them are
+        parsed, see job_page_strainer, and read in one pass in document order.
+        :param html: job page
+        :param description_format:
+        :param parser: html parser, see set_html_parser
+        :return: dict
+        """
+        soup = parse_html(html, parser, LinkedInScraper.job_page_strainer)
         description = None
-        if div_content is not None:
-            div_content = remove_attributes(div_content)
-            description = div_content.prettify(formatter="html")
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description = markdown_converter(description)
-
-        h3_tag = soup.find(
-            "h3", text=lambda text: text and "Job function" in text.strip()
-        )
-
-        job_function = None
-        if h3_tag:
-            job_function_span = h3_tag.find_next(
-                "span", class_="description__job-criteria-text"
-            )
-            if job_function_span:
-                job_function = job_function_span.text.strip()
-
-        company_logo = (
-            logo_image.get("data-delayed-url")
-            if (logo_image := soup.find("img", {"class": "artdeco-entity-image"}))
-            else None
+        logo_image = None
+        criteria = {}
+        header = None
+        for tag in soup.find_all(recursive=False):
+            classes = tag.get("class", [])
+            if tag.name == "div" and "show-more-less-html__markup" in classes:
+                if description is None:
+                    description = remove_attributes(tag)
+            elif tag.name == "h3" and "description__job-criteria-subheader" in classes:
+                header = tag.get_text(strip=True)
+            elif tag.name == "span" and "description__job-criteria-text" in classes:
+                # the value of a criteria follows its header
+                if header is not None:
+                    criteria[header] = tag.get_text(strip=True)
+                    header = None
+            elif tag.name == "img" and "artdeco-entity-image" in classes:
+                logo_image = logo_image or tag
+
+        if description is not None:
+            # markdown is converted from the plain html, prettifying it is wasted
+            if description_format == DescriptionFormat.MARKDOWN:
+                description = markdown_converter(description.decode())
+            else:
+                description = description.prettify(formatter="html")
+        employment_type = criteria.get("Employment type")
+        job_type = (
+            [get_enum_from_job_type(employment_type.lower().replace("-", ""))]
+            if employment_type
+            else []
         )
         return {
             "description": description,
-            "job_level": self._parse_job_level(soup),
-            "company_industry": self._parse_company_industry(soup),
-            "job_type": self._parse_job_type(soup),
-            "job_url_direct": self._parse_job_url_direct(soup),
-            "company_logo": company_logo,
-            "job_function": job_function,
+            "job_level": criteria.get("Seniority level"),
+            "company_industry": criteria.get("Industries"),
+            "job_type": job_type,
+            "job_url_direct": LinkedInScraper._parse_job_url_direct(html),
+            "company_logo": (
+                logo_image.get("data-delayed-url") if logo_image is not None else None
+            ),
+            "job_function": criteria.get("Job function"),
         }
 
+    @staticmethod
+    def _parse_job_url_direct(html: str) -> str | None:
+        """
+        Gets the job url direct from the applyUrl code element of a job page
+        :param html: job page
+        :return: str
+        """
+        start = html.find('id="applyUrl"')
+        if start == -1:
+            return None
+        end = html.find("</code>", start)
+        job_url_direct_match = LinkedInScraper.job_url_direct_regex.search(
+            html, start, end if end != -1 else len(html)
+        )
+        return unquote(job_url_direct_match.group()) if job_url_direct_match else None
+
     def _get_location(self, metadata_card: Optional[Tag]) -> Location:
         """
         Extracts the location data from the job metadata card.
@@ -316,94 +397,6 @@ class LinkedInScraper(Scraper):
                 location = Location(city=city, state=state, country=country)
         return location
 
-    @staticmethod
-    def _parse_job_type(soup_job_type: BeautifulSoup) -> list[JobType] | None:
-        """
-        Gets the job type from job page
-        :param soup_job_type:
-        :return: JobType
-        """
-        h3_tag = soup_job_type.find(
-            "h3",
-            class_="description__job-criteria-subheader",
-            string=lambda text: "Employment type" in text,
-        )
-        employment_type = None
-        if h3_tag:
-            employment_type_span = h3_tag.find_next_sibling(
-                "span",
-                class_="description__job-criteria-text description__job-criteria-text--criteria",
-            )
-            if employment_type_span:
-                employment_type = employment_type_span.get_text(strip=True)
-                employment_type = employment_type.lower()
-                employment_type = employment_type.replace("-", "")
-
-        return [get_enum_from_job_type(employment_type)] if employment_type else []
-
-    @staticmethod
-    def _parse_job_level(soup_job_level: BeautifulSoup) -> str | None:
-        """
-        Gets the job level from job page
-        :param soup_job_level:
-        :return: str
-        """
-        h3_tag = soup_job_level.find(
-            "h3",
-            class_="description__job-criteria-subheader",
-            string=lambda text: "Seniority level" in text,
-        )
-        job_level = None
-        if h3_tag:
-            job_level_span = h3_tag.find_next_sibling(
-                "span",
-                class_="description__job-criteria-text description__job-criteria-text--criteria",
-            )
-            if job_level_span:
-                job_level = job_level_span.get_text(strip=True)
-
-        return job_level
-
-    @staticmethod
-    def _parse_company_industry(soup_industry: BeautifulSoup) -> str | None:
-        """
-        Gets the company industry from job page
-        :param soup_industry:
-        :return: str
-        """
-        h3_tag = soup_industry.find(
-            "h3",
-            class_="description__job-criteria-subheader",
-            string=lambda text: "Industries" in text,
-        )
-        industry = None
-        if h3_tag:
-            industry_span = h3_tag.find_next_sibling(
-                "span",
-                class_="description__job-criteria-text description__job-criteria-text--criteria",
-            )
-            if industry_span:
-                industry = industry_span.get_text(strip=True)
-
-        return industry
-
-    def _parse_job_url_direct(self, soup: BeautifulSoup) -> str | None:
-        """
-        Gets the job url direct from job page
-        :param soup:
-        :return: str
-        """
-        job_url_direct = None
-        job_url_direct_content = soup.find("code", id="applyUrl")
-        if job_url_direct_content:
-            job_url_direct_match = self.job_url_direct_regex.search(
-                job_url_direct_content.decode_contents().strip()
-            )
-            if job_url_direct_match:
-                job_url_direct = unquote(job_url_direct_match.group())
-
-        return job_url_direct
-
     @staticmethod
     def job_type_code(job_type_enum: JobType) -> str:
         return {
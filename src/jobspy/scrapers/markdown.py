@@ -0,0 +1,378 @@
+"""
+jobspy.scrapers.markdown
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the converter of job description html to markdown.
+"""
+
+from __future__ import annotations
+
+import re
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
+
+from markdownify import markdownify as md
+
+# tags rendered as paragraphs
+BLOCK_TAGS = frozenset(
+    {"p", "div", "section", "article", "header", "footer", "main", "center"}
+)
+# tags skipped with their content
+SKIPPED_TAGS = frozenset({"script", "style", "head", "title", "noscript", "template"})
+# tags the converter has no rendering for, html containing them goes to markdownify
+UNSUPPORTED_TAGS = frozenset(
+    {"table", "thead", "tbody", "tfoot", "tr", "td", "th", "dl", "dt", "dd"}
+)
+VOID_TAGS = frozenset(
+    {"br", "hr", "img", "wbr", "input", "meta", "link", "source", "col", "area"}
+)
+LIST_TAGS = frozenset({"ul", "ol"})
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+# tags rendered as inline code, like markdownify does
+CODE_TAGS = frozenset({"code", "kbd", "samp"})
+BULLETS = "*+-"
+
+WHITESPACE = re.compile(r"[\t\n\r\f ]+")
+ESCAPED = re.compile(r"([*_])")
+BLANK_LINES = re.compile(r"\n(?:[ \t]*\n)+")
+
+
+class UnsupportedHtml(Exception):
+    """Raised for html with tags the converter cannot render"""
+
+
+class _Element:
+    __slots__ = ("tag", "attrs", "parts", "items")
+
+    def __init__(self, tag: str, attrs: dict):
+        self.tag = tag
+        self.attrs = attrs
+        self.parts: list[str] = []
+        self.items = 0
+
+
+class MarkdownConverter(HTMLParser):
+    """
+    Streams html to markdown for the tags job descriptions use, rendering them like
+    markdownify does by default. Unlike markdownify it builds no tree of the html.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = [_Element("", {})]
+        self.skip = 0
+
+    def convert(self, html: str) -> str:
+        self.feed(html)
+        self.close()
+        while len(self.stack) > 1:
+            self._close_top()
+        markdown = "".join(self.stack[0].parts)
+        return BLANK_LINES.sub("\n\n", markdown).strip()
+
+    def handle_starttag(self, tag: str, attrs: list):
+        if tag in UNSUPPORTED_TAGS:
+            raise UnsupportedHtml(tag)
+        if tag in SKIPPED_TAGS:
+            self.skip += 1
+            return
+        if self.skip:
+            return
+        attrs = dict(attrs)
+        if tag == "li":
+            self._close_open("li", until=LIST_TAGS)
+        if self.stack[-1].tag == "p" and (
+            tag in BLOCK_TAGS or tag in LIST_TAGS or tag in HEADING_TAGS
+        ):
+            self._close_top()
+        if tag in VOID_TAGS:
+            parts = self.stack[-1].parts
+            while tag == "br" and parts and parts[-1].endswith(" "):
+                parts[-1] = parts[-1].rstrip(" ")
+                if not parts[-1]:
+                    parts.pop()
+            self._append(self._render_void(tag, attrs))
+        else:
+            self.stack.append(_Element(tag, attrs))
+
+    def handle_startendtag(self, tag: str, attrs: list):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str):
+        if tag in SKIPPED_TAGS:
+            self.skip = max(self.skip - 1, 0)
+            return
+        if self.skip or tag in VOID_TAGS:
+            return
+        self._close_open(tag)
+
+    def handle_data(self, data: str):
+        if self.skip:
+            return
+        if not self._in("pre"):
+            data = WHITESPACE.sub(" ", data)
+            if not any(self._in(tag) for tag in CODE_TAGS):
+                data = ESCAPED.sub(r"\\\1", data)
+            if data.startswith(" ") and self._at_line_start():
+                data = data.lstrip()
+        if data:
+            self._append(data)
+
+    def _append(self, text: str):
+        parts = self.stack[-1].parts
+        if text.startswith(" ") and parts and parts[-1].endswith(" "):
+            if not self._in("pre"):
+                text = text[1:]
+        if text:
+            parts.append(text)
+
+    def _in(self, tag: str) -> bool:
+        return any(element.tag == tag for element in self.stack)
+
+    def _at_line_start(self) -> bool:
+        for element in reversed(self.stack):
+            if element.parts:
+                return element.parts[-1].endswith("\n")
+            if element.tag in BLOCK_TAGS or element.tag in ("li", "blockquote"):
+                return True
+        return True
+
+    def _close_open(self, tag: str, until: frozenset = frozenset()):
+        """Closes the innermost open tag and the tags inside it, if tag is open"""
+        for element in reversed(self.stack[1:]):
+            if element.tag in until:
+                return
+            if element.tag == tag:
+                while self._close_top().tag != tag:
+                    pass
+                return
+
+    def _close_top(self) -> _Element:
+        element = self.stack.pop()
+        self._append(self._render(element, "".join(element.parts)))
+        return element
+
+    def _render_void(self, tag: str, attrs: dict) -> str:
+        if tag == "br":
+            return "  \n"
+        if tag == "hr":
+            return "\n\n---\n\n"
+        if tag == "img":
+            title = f' "{attrs["title"]}"' if attrs.get("title") else ""
+            return f"![{attrs.get('alt') or ''}]({attrs.get('src') or ''}{title})"
+        return ""
+
+    def _render(self, element: _Element, text: str) -> str:
+        tag = element.tag
+        if tag in BLOCK_TAGS:
+            text = text.strip()
+            return f"\n\n{text}\n\n" if text else ""
+        if tag in ("strong", "b"):
+            return _chomp(text, "**")
+        if tag in ("em", "i"):
+            return _chomp(text, "*")
+        if tag in ("del", "s"):
+            return _chomp(text, "~~")
+        if tag in CODE_TAGS:
+            return text if self._in("pre") else _chomp(text, "`")
+        if tag == "a":
+            return self._render_link(element.attrs, text)
+        if tag in HEADING_TAGS:
+            text = WHITESPACE.sub(" ", text).strip()
+            if not text:
+                return ""
+            if tag == "h1":
+                return f"\n\n{text}\n{'=' * len(text)}\n\n"
+            if tag == "h2":
+                return f"\n\n{text}\n{'-' * len(text)}\n\n"
+            return f"\n\n{'#' * int(tag[1])} {text}\n\n"
+        if tag in LIST_TAGS:
+            text = text.strip()
+            if not text:
+                return ""
+            if self._in("li"):
+                # nested lists are indented by a tab, the list item is not
+                return "\n" + "\n".join(f"\t{line}" for line in text.split("\n"))
+            return f"\n\n{text}\n\n"
+        if tag == "li":
+            return self._render_list_item(text)
+        if tag == "pre":
+            return f"\n\n```\n{text.strip(chr(10))}\n```\n\n"
+        if tag == "blockquote":
+            text = BLANK_LINES.sub("\n\n", text.strip())
+            if not text:
+                return ""
+            quoted = "\n".join(f"> {line}" for line in text.split("\n"))
+            return f"\n\n{quoted}\n\n"
+        return text
+
+    def _render_link(self, attrs: dict, text: str) -> str:
+        href = attrs.get("href")
+        prefix, text, suffix = _split_whitespace(text)
+        if not href or not text:
+            return prefix + text + suffix
+        title = attrs.get("title")
+        if text.replace(r"\_", "_") == href and not title:
+            return f"{prefix}<{href}>{suffix}"
+        title = f' "{title}"' if title else ""
+        return f"{prefix}[{text}]({href}{title}){suffix}"
+
+    def _render_list_item(self, text: str) -> str:
+        parent = next(
+            (element for element in reversed(self.stack) if element.tag in LIST_TAGS),
+            None,
+        )
+        if parent is not None and parent.tag == "ol":
+            start = parent.attrs.get("start") or "1"
+            start = int(start) if start.isdigit() else 1
+            bullet = f"{start + parent.items}. "
+        else:
+            depth = sum(element.tag == "ul" for element in self.stack) - 1
+            bullet = BULLETS[max(depth, 0) % len(BULLETS)] + " "
+        if parent is not None:
+            parent.items += 1
+        return f"{bullet}{text.strip()}\n"
+
+
+def _split_whitespace(text: str) -> tuple[str, str, str]:
+    stripped = text.strip()
+    if not stripped:
+        return text, "", ""
+    prefix = " " if text[0].isspace() else ""
+    suffix = " " if text[-1].isspace() else ""
+    return prefix, stripped, suffix
+
+
+def _chomp(text: str, marker: str) -> str:
+    """Wraps text in marker, keeping its surrounding whitespace outside"""
+    prefix, text, suffix = _split_whitespace(text)
+    if not text:
+        return prefix
+    return f"{prefix}{marker}{text}{marker}{suffix}"
+
+
+def html_to_markdown(html: str) -> str:
+    """Converts html to markdown, with markdownify for html the converter cannot render"""
+    try:
+        return MarkdownConverter().convert(html)
+    except UnsupportedHtml:
+        return md(html).strip()
+
+
+class MarkdownMemo:
+    """
+    LRU of converted descriptions keyed by a hash of their html, so descriptions
+    reposted for several locations are converted once. With a path, conversions are
+    also kept in a SQLite file, up to max_disk_entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        path: str | None = None,
+        max_disk_entries: int = 100_000,
+    ):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS markdown (key BLOB PRIMARY KEY, text TEXT)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def key(html: str) -> bytes:
+        return hashlib.blake2b(
+            html.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> str | None:
+        with self._lock:
+            markdown = self._entries.get(key)
+            if markdown is not None:
+                self._entries.move_to_end(key)
+                return markdown
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT text FROM markdown WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def set(self, key: bytes, markdown: str):
+        with self._lock:
+            self._remember(key, markdown)
+            if self._db is not None:
+                cursor = self._db.execute(
+                    "INSERT OR REPLACE INTO markdown VALUES (?, ?)", (key, markdown)
+                )
+                if cursor.lastrowid > self.max_disk_entries:
+                    # rowids grow with every insert, the oldest entries go first
+                    self._db.execute(
+                        "DELETE FROM markdown WHERE rowid <= ?",
+                        (cursor.lastrowid - self.max_disk_entries,),
+                    )
+                self._db.commit()
+
+    def _remember(self, key: bytes, markdown: str):
+        self._entries[key] = markdown
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM markdown")
+                self._db.commit()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_markdown_memo = MarkdownMemo()
+
+
+def convert_markdown(html: str) -> str:
+    """Converts description html to markdown, memoized by the hash of the html"""
+    key = _markdown_memo.key(html)
+    markdown = _markdown_memo.get(key)
+    if markdown is None:
+        markdown = html_to_markdown(html)
+        _markdown_memo.set(key, markdown)
+    return markdown
+
+
+def set_markdown_memo(
+    max_entries: int = 4096,
+    path: str | None = None,
+    max_disk_entries: int = 100_000,
+):
+    """
+    Replaces the memo of converted descriptions
+    :param max_entries: conversions kept in memory, 0 turns the memo off
+    :param path: SQLite file keeping conversions across runs
+    :param max_disk_entries: conversions kept in the file
+    """
+    global _markdown_memo
+    previous, _markdown_memo = _markdown_memo, MarkdownMemo(
+        max_entries, path=path, max_disk_entries=max_disk_entries
+    )
+    previous.close()
@@ -0,0 +1,244 @@
+"""
+jobspy.scrapers.metrics
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the collector of request metrics per site and endpoint.
+"""
+
+from __future__ import annotations
+
+import re
+import bisect
+import threading
+from collections import Counter, defaultdict
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+# upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def endpoint_of(url: str) -> str:
+    """Host and path of url, with ids replaced so job pages share one endpoint"""
+    parts = urlsplit(url)
+    path = re.sub(r"\d+", ":id", parts.path) or "/"
+    return parts.netloc + path
+
+
+class EndpointStats:
+    __slots__ = (
+        "requests",
+        "errors",
+        "cache_hits",
+        "retries",
+        "bytes",
+        "latency_sum",
+        "latency_buckets",
+        "status_codes",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.bytes = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.status_codes: Counter[int] = Counter()
+
+    def latency_quantile(self, q: float) -> float | None:
+        """Estimates a latency quantile as the upper bound of its histogram bucket"""
+        timed = sum(self.latency_buckets)
+        if not timed:
+            return None
+        rank = q * timed
+        seen = 0
+        for bound, count in zip(
+            LATENCY_BUCKETS + (float("inf"),), self.latency_buckets
+        ):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class MetricsCollector:
+    """
+    Counts the requests sent by all sessions and the jobs returned by all scrapers,
+    per site and endpoint. Requests served from the response cache are counted as
+    cache hits only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], EndpointStats] = defaultdict(
+            EndpointStats
+        )
+        self._jobs: Counter[str] = Counter()
+
+    def record_request(
+        self,
+        site: str | None,
+        url: str,
+        latency: float,
+        status_code: int | None = None,
+        size: int = 0,
+        retries: int = 0,
+        error: bool = False,
+    ):
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, latency)
+        with self._lock:
+            stats = self._endpoints[(site or "", endpoint_of(url))]
+            stats.requests += 1
+            stats.latency_sum += latency
+            stats.latency_buckets[bucket] += 1
+            stats.bytes += size
+            stats.retries += retries
+            if error:
+                stats.errors += 1
+            if status_code is not None:
+                stats.status_codes[status_code] += 1
+
+    def record_retry(self, site: str | None, url: str):
+        """Counts a retry made by the retry policy of a session"""
+        with self._lock:
+            self._endpoints[(site or "", endpoint_of(url))].retries += 1
+
+    def record_cache_hit(self, site: str | None, url: str):
+        with self._lock:
+            self._endpoints[(site or "", endpoint_of(url))].cache_hits += 1
+
+    def record_jobs(self, site: str, count: int):
+        with self._lock:
+            self._jobs[site] += count
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._jobs.clear()
+
+    def summary(self) -> pd.DataFrame:
+        """
+        :return: one row per site and endpoint with request counts, latency mean,
+            p50 and p95 in seconds, bytes, retries and status codes
+        """
+        with self._lock:
+            rows = [
+                {
+                    "site": site,
+                    "endpoint": endpoint,
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "cache_hits": stats.cache_hits,
+                    "throttled": stats.status_codes[429],
+                    "retries": stats.retries,
+                    "bytes": stats.bytes,
+                    "latency_mean": (
+                        stats.latency_sum / stats.requests if stats.requests else None
+                    ),
+                    "latency_p50": stats.latency_quantile(0.5),
+                    "latency_p95": stats.latency_quantile(0.95),
+                    "status_codes": dict(sorted(stats.status_codes.items())),
+                }
+                for (site, endpoint), stats in sorted(self._endpoints.items())
+            ]
+        return pd.DataFrame(rows)
+
+    def requests_per_job(self) -> dict[str, float]:
+        """Network requests sent per job returned, per site"""
+        with self._lock:
+            requests = Counter()
+            for (site, _), stats in self._endpoints.items():
+                requests[site] += stats.requests
+            return {
+                site: requests[site] / jobs for site, jobs in self._jobs.items() if jobs
+            }
+
+    def to_prometheus(self) -> str:
+        """Formats the metrics in the Prometheus text exposition format"""
+        requests_per_job = self.requests_per_job()
+        lines = []
+
+        def header(name: str, kind: str, description: str):
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            jobs = sorted(self._jobs.items())
+
+        header("jobspy_requests_total", "counter", "Requests sent, by status code")
+        for (site, endpoint), stats in endpoints:
+            for status_code, count in sorted(stats.status_codes.items()):
+                labels = _labels(site=site, endpoint=endpoint, status=status_code)
+                lines.append(f"jobspy_requests_total{labels} {count}")
+            if stats.errors:
+                labels = _labels(site=site, endpoint=endpoint, status="error")
+                lines.append(f"jobspy_requests_total{labels} {stats.errors}")
+
+        header(
+            "jobspy_request_duration_seconds", "histogram", "Request latency in seconds"
+        )
+        for (site, endpoint), stats in endpoints:
+            cumulative = 0
+            for bound, count in zip(
+                LATENCY_BUCKETS + (float("inf"),), stats.latency_buckets
+            ):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _labels(site=site, endpoint=endpoint, le=le)
+                lines.append(
+                    f"jobspy_request_duration_seconds_bucket{labels} {cumulative}"
+                )
+            labels = _labels(site=site, endpoint=endpoint)
+            lines.append(
+                f"jobspy_request_duration_seconds_sum{labels} {stats.latency_sum}"
+            )
+            lines.append(f"jobspy_request_duration_seconds_count{labels} {cumulative}")
+
+        for name, attribute, description in (
+            ("jobspy_response_bytes_total", "bytes", "Response body bytes received"),
+            ("jobspy_retries_total", "retries", "Retries of failed requests"),
+            ("jobspy_cache_hits_total", "cache_hits", "Responses served from cache"),
+        ):
+            header(name, "counter", description)
+            for (site, endpoint), stats in endpoints:
+                labels = _labels(site=site, endpoint=endpoint)
+                lines.append(f"{name}{labels} {getattr(stats, attribute)}")
+
+        header("jobspy_jobs_total", "counter", "Jobs returned by the scrapers")
+        for site, count in jobs:
+            lines.append(f"jobspy_jobs_total{_labels(site=site)} {count}")
+
+        header("jobspy_requests_per_job", "gauge", "Requests sent per job returned")
+        for site, ratio in sorted(requests_per_job.items()):
+            lines.append(f"jobspy_requests_per_job{_labels(site=site)} {ratio}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """Writes the metrics in the Prometheus text format, e.g. for node_exporter"""
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_prometheus())
+
+
+def _labels(**labels) -> str:
+    escaped = (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for value in labels.values()
+    )
+    return (
+        "{"
+        + ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped))
+        + "}"
+    )
+
+
+def count_retries(response) -> int:
+    """Retries urllib3 made before returning a requests response"""
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    return len(retries.history) if retries is not None else 0
+
+
+metrics = MetricsCollector()
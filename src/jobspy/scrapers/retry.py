@@ -0,0 +1,182 @@
+"""
+jobspy.scrapers.retry
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the retry policy of sessions and the per-site circuit breakers.
+"""
+
+from __future__ import annotations
+
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# statuses of throttled or failing sites, retried and counted by the circuit breakers
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a site whose circuit breaker is open"""
+
+
+def parse_retry_after(response) -> float | None:
+    """
+    :return: seconds to wait given by the Retry-After header of response, or None if
+        it has none
+    """
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Retries throttled and failed responses with jittered exponential backoff, waiting
+    for the Retry-After of a response instead when it gives one. No retry is made
+    that would end later than deadline seconds after the first attempt.
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        deadline: float = 120.0,
+    ):
+        self.total = total
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        :param attempt: number of retries made so far
+        :param retry_after: seconds the site asked to wait
+        :return: seconds to wait before the next retry
+        """
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+class CircuitBreaker:
+    """
+    Opens after threshold consecutive throttled or failed responses of a site, then
+    fails requests fast until the cooldown, or a longer Retry-After, has passed.
+    After that one probe request is let through, closing the breaker if it succeeds
+    and reopening it with a doubled cooldown, up to max_cooldown, if it fails.
+    """
+
+    def __init__(
+        self, threshold: int = 5, cooldown: float = 60.0, max_cooldown: float = 900.0
+    ):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.failures = 0
+        self.openings = 0
+        self.open_until = 0.0
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if not self.openings:
+                return "closed"
+            if self.probing or time.monotonic() >= self.open_until:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Whether a request may be sent, taking the probe of a half open breaker"""
+        with self._lock:
+            if not self.openings:
+                return True
+            if self.probing or time.monotonic() < self.open_until:
+                return False
+            self.probing = True
+            return True
+
+    def remaining(self) -> float:
+        """Seconds left until the breaker lets a probe through"""
+        with self._lock:
+            return max(self.open_until - time.monotonic(), 0.0)
+
+    def record(self, status_code: int | None, retry_after: float | None = None):
+        """
+        Records the outcome of a request, status_code None for a request that raised
+        """
+        with self._lock:
+            probe, self.probing = self.probing, False
+            if status_code is not None and status_code not in RETRY_STATUSES:
+                self.failures = 0
+                self.openings = 0
+                return
+            if status_code is not None:
+                self.failures += 1
+            if probe or (status_code is not None and self.failures >= self.threshold):
+                cooldown = min(self.cooldown * 2**self.openings, self.max_cooldown)
+                self.open_until = time.monotonic() + max(cooldown, retry_after or 0)
+                self.openings += 1
+                self.failures = 0
+
+    def reset(self):
+        with self._lock:
+            self.failures = 0
+            self.openings = 0
+            self.open_until = 0.0
+            self.probing = False
+
+
+# threshold, cooldown and max_cooldown of the circuit breakers per site
+CIRCUIT_BREAKERS: dict[str, tuple[int, float, float]] = {}
+DEFAULT_CIRCUIT_BREAKER = (5, 60.0, 900.0)
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(site: str) -> CircuitBreaker:
+    """Returns the circuit breaker of a site, shared by all sessions of the process"""
+    with _breakers_lock:
+        if site not in _breakers:
+            settings = CIRCUIT_BREAKERS.get(site, DEFAULT_CIRCUIT_BREAKER)
+            _breakers[site] = CircuitBreaker(*settings)
+        return _breakers[site]
+
+
+def set_circuit_breaker(
+    site: str,
+    threshold: int = 5,
+    cooldown: float = 60.0,
+    max_cooldown: float = 900.0,
+):
+    """
+    Configures the circuit breaker of a site, resetting its state
+    :param threshold: consecutive throttled or failed responses opening the breaker
+    :param cooldown: seconds requests fail fast after the breaker first opens
+    :param max_cooldown: longest cooldown after repeated openings
+    """
+    with _breakers_lock:
+        CIRCUIT_BREAKERS[site] = (threshold, cooldown, max_cooldown)
+        _breakers.pop(site, None)
+
+
+def reset_circuit_breakers():
+    """Closes the circuit breakers of all sites"""
+    with _breakers_lock:
+        for breaker in _breakers.values():
+            breaker.reset()
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+import os
 import re
+import ssl
+import time
+import random
 import logging
-from itertools import cycle
+import threading
+import multiprocessing
+from collections import deque
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Callable, Iterable
+from urllib.parse import urlsplit
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 
 import requests
 import tls_client
 import numpy as np
-from markdownify import markdownify as md
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter, Retry
+from requests.structures import CaseInsensitiveDict
 
-from ..jobs import CompensationInterval, JobType
+from .cache import get_response_cache, build_response
+from .cassette import get_cassette
+from .markdown import convert_markdown
+from .analysis import find_emails, find_job_types
+
+# re-exported for callers importing it from utils, where it used to live
+from .analysis import extract_salary  # noqa: F401
+from .metrics import metrics, count_retries
+from .retry import (
+    RETRY_STATUSES,
+    RetryPolicy,
+    CircuitOpenError,
+    get_circuit_breaker,
+    parse_retry_after,
+)
+from ..jobs import JobType
 
 
 def create_logger(name: str):
@@ -26,18 +53,321 @@ def create_logger(name: str):
     return logger
 
 
-class RotatingProxySession:
-    def __init__(self, proxies=None):
-        if isinstance(proxies, str):
-            self.proxy_cycle = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = (
-                cycle([self.format_proxy(proxy) for proxy in proxies])
-                if proxies
-                else None
-            )
+# threads of the pool shared by all scrapers
+MAX_WORKERS = 32
+# maximum number of detail fetches running at once per site, across all searches
+SITE_WORKERS = {
+    "glassdoor": 20,
+    "zip_recruiter": 20,
+}
+DEFAULT_SITE_WORKERS = 10
+# sites whose sessions send requests over HTTP/2, see set_http2
+HTTP2_SITES: set[str] = set()
+
+
+class TokenBucket:
+    """
+    Lets callers through at rate per second on average, and up to burst at once
+    after an idle period. Waiting callers reserve their token, so they are let
+    through in the order they arrived.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token without blocking and returns the seconds until it is due"""
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.updated
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0
+
+    def refund(self):
+        """Gives back a reserved token that was not used"""
+        with self.lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+
+# requests per second and burst, keyed by host or host + path prefix
+RATE_LIMITS: dict[str, tuple[float, int]] = {
+    "www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings": (0.2, 1),
+    "api.ziprecruiter.com/jobs-app/jobs": (0.2, 1),
+}
+
+
+class RateLimiter:
+    """
+    Token buckets shared by all sessions of the process, so concurrent searches
+    hitting the same host are paced together. Urls are matched to the longest
+    configured host + path prefix; hosts without a limit are not paced.
+    """
+
+    def __init__(self, limits: dict[str, tuple[float, int]]):
+        self.limits = limits
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, prefix: str, rate: float | None, burst: int = 1):
+        with self._lock:
+            if rate is None:
+                self.limits.pop(prefix, None)
+            else:
+                self.limits[prefix] = (rate, burst)
+            self._buckets.pop(prefix, None)
+
+    def _bucket(self, prefix: str) -> TokenBucket | None:
+        with self._lock:
+            if prefix not in self.limits:
+                return None
+            if prefix not in self._buckets:
+                self._buckets[prefix] = TokenBucket(*self.limits[prefix])
+            return self._buckets[prefix]
+
+    def _match(self, url: str) -> str | None:
+        parts = urlsplit(url)
+        target = parts.netloc + parts.path
+        with self._lock:
+            prefixes = [prefix for prefix in self.limits if target.startswith(prefix)]
+        return max(prefixes, key=len) if prefixes else None
+
+    def wait(self, url: str):
+        """
+        Blocks until a request to url is allowed. Inside a PacedStep, a token the
+        step paid for in advance is used instead.
+        """
+        prefix = self._match(url)
+        if prefix is None:
+            return
+        step = _paced_step.get()
+        if step is not None:
+            step.paced.add(prefix)
+            if prefix in step.prepaid:
+                step.prepaid.remove(prefix)
+                return
+        bucket = self._bucket(prefix)
+        if bucket is not None:
+            bucket.acquire()
+
+    def prepay(self, step: PacedStep) -> float:
+        """
+        Reserves a token for each limit the previous run of step was paced by
+        :return: seconds to wait before running step again
+        """
+        wait = 0.0
+        for prefix in step.paced:
+            bucket = self._bucket(prefix)
+            if bucket is not None:
+                wait = max(wait, bucket.reserve())
+                step.prepaid.add(prefix)
+        step.paced.clear()
+        return wait
+
+    def refund(self, step: PacedStep):
+        """Gives back the tokens step paid for but did not use"""
+        for prefix in step.prepaid:
+            bucket = self._bucket(prefix)
+            if bucket is not None:
+                bucket.refund()
+        step.prepaid.clear()
+
+
+class PacedStep:
+    """
+    Runs a blocking call, such as the next page of a scraper, with its rate limit
+    waits taken out: the limits a run was paced by are paid in advance for the
+    next run, so an event loop can await the wait instead of a thread sleeping.
+    """
+
+    def __init__(self):
+        self.paced: set[str] = set()
+        self.prepaid: set[str] = set()
+
+    def run(self, func: Callable, *args):
+        token = _paced_step.set(self)
+        try:
+            return func(*args)
+        finally:
+            _paced_step.reset(token)
+
+
+_paced_step: ContextVar[PacedStep | None] = ContextVar("paced_step", default=None)
+rate_limiter = RateLimiter(RATE_LIMITS)
+
+
+def set_rate_limit(prefix: str, rate: float | None, burst: int = 1):
+    """
+    Limits the requests to a host, or to urls starting with a host + path prefix
+    :param prefix: e.g. "www.linkedin.com" or "api.ziprecruiter.com/jobs-app/jobs"
+    :param rate: sustained requests per second, None removes the limit
+    :param burst: requests let through at once after an idle period
+    """
+    rate_limiter.set_limit(prefix, rate, burst)
+
+
+class ProxyStats:
+    """Request outcomes of a proxy, as moving averages over its recent requests"""
+
+    __slots__ = (
+        "requests",
+        "failures",
+        "throttled",
+        "success_rate",
+        "latency",
+        "consecutive_failures",
+        "ejections",
+        "ejected_until",
+    )
+    smoothing = 0.2
+
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.throttled = 0
+        self.success_rate = 1.0
+        self.latency: float | None = None
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+    @property
+    def weight(self) -> float:
+        """Selection weight, the success rate discounted by the latency in seconds"""
+        return max(self.success_rate, 0.01) / (1 + (self.latency or 0))
+
+    def record(self, success: bool, latency: float | None = None):
+        self.requests += 1
+        self.success_rate += self.smoothing * (success - self.success_rate)
+        if latency is not None:
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.smoothing * (latency - self.latency)
+        if success:
+            self.consecutive_failures = 0
         else:
-            self.proxy_cycle = None
+            self.failures += 1
+            self.consecutive_failures += 1
+
+
+class ProxyPool:
+    """
+    Picks proxies at random, weighted by their recent success rate and latency.
+    A proxy failing eject_after requests in a row is left out for eject_seconds,
+    doubled on each further ejection up to max_eject_seconds. Requests failing with
+    an exception, 407, 429 or a 5xx status count as failures.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str],
+        eject_after: int = 3,
+        eject_seconds: float = 30,
+        max_eject_seconds: float = 600,
+    ):
+        self.eject_after = eject_after
+        self.eject_seconds = eject_seconds
+        self.max_eject_seconds = max_eject_seconds
+        self._stats = {proxy: ProxyStats() for proxy in proxies}
+        self._lock = threading.Lock()
+
+    def select(self) -> str:
+        now = time.monotonic()
+        with self._lock:
+            available = [
+                proxy
+                for proxy, stats in self._stats.items()
+                if stats.ejected_until <= now
+            ]
+            if not available:
+                # every proxy is ejected, use the one coming back first
+                return min(self._stats, key=lambda p: self._stats[p].ejected_until)
+            weights = [self._stats[proxy].weight for proxy in available]
+        return random.choices(available, weights)[0]
+
+    def report(
+        self,
+        proxy: str,
+        latency: float | None = None,
+        status_code: int | None = None,
+        failed: bool = False,
+    ):
+        """Records the outcome of a request sent through proxy"""
+        failed = failed or status_code in (407, 429) or (status_code or 0) >= 500
+        with self._lock:
+            stats = self._stats[proxy]
+            stats.record(not failed, latency)
+            if status_code == 429:
+                stats.throttled += 1
+            if stats.consecutive_failures >= self.eject_after:
+                eject_seconds = self.eject_seconds * 2**stats.ejections
+                stats.ejected_until = time.monotonic() + min(
+                    eject_seconds, self.max_eject_seconds
+                )
+                stats.ejections += 1
+                stats.consecutive_failures = 0
+
+    def stats(self) -> list[dict]:
+        """
+        Health of each proxy
+        :return: one dict per proxy, healthiest first
+        """
+        now = time.monotonic()
+        with self._lock:
+            rows = [
+                {
+                    "proxy": proxy,
+                    "requests": stats.requests,
+                    "failures": stats.failures,
+                    "throttled": stats.throttled,
+                    "success_rate": round(stats.success_rate, 3),
+                    "latency": (
+                        round(stats.latency, 3) if stats.latency is not None else None
+                    ),
+                    "ejections": stats.ejections,
+                    "ejected": stats.ejected_until > now,
+                    "weight": round(stats.weight, 3),
+                }
+                for proxy, stats in self._stats.items()
+            ]
+        return sorted(rows, key=lambda row: row["weight"], reverse=True)
+
+
+_proxy_pools: dict[tuple, ProxyPool] = {}
+_proxy_pools_lock = threading.Lock()
+
+
+def get_proxy_pool(proxies: list[str] | str) -> ProxyPool:
+    """
+    Returns the pool shared by all sessions using the same proxies, so the health of
+    a proxy learned by one scraper is used by the others
+    """
+    if isinstance(proxies, str):
+        proxies = [proxies]
+    key = tuple(RotatingProxySession.format_proxy(proxy)["http"] for proxy in proxies)
+    with _proxy_pools_lock:
+        if key not in _proxy_pools:
+            _proxy_pools[key] = ProxyPool(list(dict.fromkeys(key)))
+        return _proxy_pools[key]
+
+
+class RotatingProxySession:
+    def __init__(self, proxies=None, site=None):
+        self.proxy_pool = get_proxy_pool(proxies) if proxies else None
+        self.site = site
+        self.retry_policy: RetryPolicy | None = None
+        self.pool_size: int | None = None
 
     @staticmethod
     def format_proxy(proxy):
@@ -46,60 +376,349 @@ class RotatingProxySession:
             return {"http": proxy, "https": proxy}
         return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
 
+    def proxy_kwargs(self, proxy: str | None) -> dict:
+        """Request arguments sending a request through proxy, or directly for None"""
+        return {"proxies": self.format_proxy(proxy)} if proxy else {}
+
+    def pool_limit(self) -> int:
+        """
+        Connections kept open per host: the session's pool_size if one was given,
+        otherwise the worker limit of its site, read on each request so that
+        set_site_workers applies to open sessions too
+        """
+        if self.pool_size is not None:
+            return self.pool_size
+        return get_site_workers(self.site) if self.site else DEFAULT_SITE_WORKERS
+
+    def dispatch(
+        self, send: Callable, method: str, url: str, cache: bool = False, **kwargs
+    ):
+        """
+        Sends a request with send. With cache set, responses are served from and
+        stored in the response cache, if one is configured for the session's site.
+        While a cassette is set, responses are recorded to or replayed from it.
+        """
+        cassette = get_cassette()
+        if cassette is not None and cassette.mode == "replay":
+            return cassette.play(method, url, **kwargs)
+        response = self._cached_send(send, method, url, cache, **kwargs)
+        if cassette is not None:
+            cassette.record(method, url, response, **kwargs)
+        return response
+
+    def _cached_send(
+        self, send: Callable, method: str, url: str, cache: bool, **kwargs
+    ):
+        response_cache = get_response_cache() if cache else None
+        ttl = response_cache.ttl(self.site) if response_cache else None
+        if ttl:
+            key = response_cache.key(method, url, **kwargs)
+            response = response_cache.get(key, ttl)
+            if response is not None:
+                metrics.record_cache_hit(self.site, url)
+                return response
+        response = self._send(send, method, url, **kwargs)
+        # redirects, like LinkedIn's to its signup page, are not cached
+        if ttl and response.status_code == 200 and not _redirected(response, url):
+            response_cache.set(key, self.site, response)
+        return response
+
+    def _send(self, send: Callable, method: str, url: str, **kwargs):
+        """
+        Sends a request unless the circuit breaker of the session's site is open,
+        retrying throttled and failed responses by the session's retry policy.
+        Sessions without a retry policy have no circuit breaker either.
+        """
+        policy = self.retry_policy
+        breaker = get_circuit_breaker(self.site) if self.site and policy else None
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(
+                f"{self.site} is failing fast after repeated 429 or 5xx responses,"
+                f" retrying in {breaker.remaining():.0f}s"
+            )
+        deadline = time.monotonic() + policy.deadline if policy else None
+        attempt = 0
+        while True:
+            try:
+                response = self._send_once(send, method, url, **kwargs)
+            except Exception:
+                if breaker is not None:
+                    breaker.record(None)
+                raise
+            retry_after = parse_retry_after(response)
+            if breaker is not None:
+                breaker.record(response.status_code, retry_after)
+            if (
+                policy is None
+                or response.status_code not in RETRY_STATUSES
+                or attempt >= policy.total
+            ):
+                return response
+            delay = policy.delay(attempt, retry_after)
+            if time.monotonic() + delay > deadline:
+                return response
+            time.sleep(delay)
+            # the breaker may have opened meanwhile, from this or other threads
+            if breaker is not None and not breaker.allow():
+                return response
+            metrics.record_retry(self.site, url)
+            attempt += 1
+
+    def _send_once(self, send: Callable, method: str, url: str, **kwargs):
+        """
+        Sends a request through a proxy picked from the proxy pool, and reports the
+        outcome back to the pool and the metrics collector
+        """
+        rate_limiter.wait(url)
+        proxy = self.proxy_pool.select() if self.proxy_pool else None
+        if proxy is not None:
+            # passed per request instead of set on the session, which threads share
+            direct = proxy == "http://localhost"
+            kwargs.update(self.proxy_kwargs(None if direct else proxy))
+        start = time.monotonic()
+        try:
+            response = send(method, url, **kwargs)
+        except Exception:
+            latency = time.monotonic() - start
+            if proxy is not None:
+                self.proxy_pool.report(proxy, failed=True)
+            metrics.record_request(self.site, url, latency, error=True)
+            raise
+        latency = time.monotonic() - start
+        if proxy is not None:
+            self.proxy_pool.report(proxy, latency, response.status_code)
+        metrics.record_request(
+            self.site,
+            url,
+            latency,
+            status_code=response.status_code,
+            size=len(response.content or b""),
+            retries=count_retries(response),
+        )
+        return response
+
+
+def _redirected(response, url: str) -> bool:
+    """
+    Whether response was redirected from url. The history of tls_client responses
+    is always empty, they only have the url they were finally fetched from.
+    """
+    if isinstance(response, requests.Response):
+        return bool(response.history)
+    return response.url != url
+
 
 class RequestsRotating(RotatingProxySession, requests.Session):
 
-    def __init__(self, proxies=None, has_retry=False, delay=1, clear_cookies=False):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(
+        self,
+        proxies=None,
+        has_retry=False,
+        delay=1,
+        clear_cookies=False,
+        pool_size=None,
+        site=None,
+    ):
+        RotatingProxySession.__init__(self, proxies=proxies, site=site)
         requests.Session.__init__(self)
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
+        self.pool_size = pool_size
         self.setup_session(has_retry, delay)
 
     def setup_session(self, has_retry, delay):
+        retries = 0
         if has_retry:
+            # throttled and failed responses are retried by the session's retry policy
             retries = Retry(
                 total=3,
                 connect=3,
-                status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
                 backoff_factor=delay,
+                respect_retry_after_header=False,
             )
-            adapter = HTTPAdapter(max_retries=retries)
-            self.mount("http://", adapter)
-            self.mount("https://", adapter)
+        self.max_retries = retries
+        self.mount_adapters(self.pool_limit())
+
+    def mount_adapters(self, pool_size: int):
+        """Mounts adapters keeping pool_size connections open per host"""
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=self.max_retries,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+        self.mounted_pool_size = pool_size
 
     def request(self, method, url, **kwargs):
         if self.clear_cookies:
             self.cookies.clear()
-
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
+        pool_size = self.pool_limit()
+        if pool_size != self.mounted_pool_size:
+            # requests in flight finish on the connections of the replaced adapter
+            self.mount_adapters(pool_size)
+        send = partial(requests.Session.request, self)
+        return self.dispatch(send, method, url, **kwargs)
 
 
 class TLSRotating(RotatingProxySession, tls_client.Session):
 
-    def __init__(self, proxies=None):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(self, proxies=None, site=None):
+        RotatingProxySession.__init__(self, proxies=proxies, site=site)
         tls_client.Session.__init__(self, random_tls_extension_order=True)
 
-    def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
-        response.ok = response.status_code in range(200, 400)
+    def proxy_kwargs(self, proxy: str | None) -> dict:
+        return {"proxy": proxy or ""}
+
+    def execute_request(self, method, url, **kwargs):
+        send = partial(tls_client.Session.execute_request, self)
+        response = self.dispatch(send, method, url, **kwargs)
+        if not isinstance(response, requests.Response):
+            response.ok = response.status_code in range(200, 400)
         return response
 
 
+class HTTP2Rotating(RotatingProxySession):
+    """
+    Sends requests over HTTP/2 with httpx, so the threads fetching the details of a
+    page multiplex their requests over one connection per host and proxy instead of
+    opening a connection each. Returns requests responses, like the other sessions.
+    """
+
+    def __init__(
+        self,
+        proxies=None,
+        has_retry=False,
+        clear_cookies=False,
+        pool_size=None,
+        site=None,
+    ):
+        RotatingProxySession.__init__(self, proxies=proxies, site=site)
+        self.httpx = _import_httpx()
+        self.headers = CaseInsensitiveDict()
+        self.cookies = self.httpx.Cookies()
+        self.verify = True
+        self.clear_cookies = clear_cookies
+        self.retries = 3 if has_retry else 0
+        self.pool_size = pool_size
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+
+    def proxy_kwargs(self, proxy: str | None) -> dict:
+        return {"proxy": proxy}
+
+    def _client(self, proxy: str | None):
+        """
+        The client sending requests through proxy, created on first use and again
+        when the pool limit changes
+        """
+        pool_size = self.pool_limit()
+        with self._clients_lock:
+            client = self._clients.get((proxy, pool_size))
+            if client is None:
+                verify = self.verify
+                if isinstance(verify, str):
+                    verify = ssl.create_default_context(cafile=verify)
+                transport = self.httpx.HTTPTransport(
+                    http2=True,
+                    verify=verify,
+                    proxy=proxy,
+                    retries=self.retries,
+                    limits=self.httpx.Limits(max_connections=pool_size),
+                )
+                client = self.httpx.Client(transport=transport)
+                # all clients of the session share its cookies
+                client.cookies.jar = self.cookies.jar
+                self._clients[(proxy, pool_size)] = client
+            return client
+
+    def _httpx_send(
+        self,
+        method: str,
+        url: str,
+        proxy: str | None = None,
+        params=None,
+        data=None,
+        json=None,
+        headers=None,
+        cookies=None,
+        allow_redirects: bool = True,
+        timeout: float | None = None,
+        timeout_seconds: float | None = None,
+    ) -> requests.Response:
+        if self.clear_cookies:
+            self.cookies.clear()
+        content = None
+        if isinstance(data, (str, bytes)):
+            content, data = data, None
+        response = self._client(proxy).request(
+            method,
+            url,
+            params=params,
+            data=data,
+            content=content,
+            json=json,
+            headers={**self.headers, **(headers or {})},
+            cookies=cookies,
+            follow_redirects=allow_redirects,
+            timeout=timeout_seconds or timeout or 30,
+        )
+        return _to_requests_response(response)
+
+    def request(self, method, url, **kwargs):
+        return self.dispatch(self._httpx_send, method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        with self._clients_lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+
+def _import_httpx():
+    try:
+        import httpx
+        import h2  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "httpx with HTTP/2 support is required for HTTP/2 sessions, install it"
+            " with `pip install python-jobspy[http2]`"
+        ) from e
+    return httpx
+
+
+def _to_requests_response(response) -> requests.Response:
+    """Converts an httpx response to a requests response"""
+    converted = build_response(
+        str(response.url),
+        response.status_code,
+        dict(response.headers),
+        response.encoding,
+        response.content,
+    )
+    converted.reason = response.reason_phrase
+    converted.history = [_to_requests_response(hop) for hop in response.history]
+    return converted
+
+
+def set_http2(site: str, enabled: bool = True):
+    """
+    Sends the requests of a site over HTTP/2, for sites fetching many job pages from
+    one host like glassdoor and zip_recruiter. Needs the http2 extra.
+    """
+    if enabled:
+        _import_httpx()
+        HTTP2_SITES.add(site)
+    else:
+        HTTP2_SITES.discard(site)
+
+
 def create_session(
     *,
     proxies: dict | str | None = None,
@@ -108,27 +727,209 @@ def create_session(
     has_retry: bool = False,
     delay: int = 1,
     clear_cookies: bool = False,
+    pool_size: int | None = None,
+    site: str | None = None,
+    http2: bool = False,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    Sessions can be shared by threads. tls sessions keep their connections alive in
+    the tls client instead, so pool_size and set_site_workers do not apply to them,
+    like the glassdoor and zip_recruiter sessions unless sent over HTTP/2.
+    :param has_retry: retry throttled and failed responses, see RetryPolicy
+    :param delay: base of the exponential backoff between retries, in seconds
+    :param pool_size: connections kept open per host, by default the worker limit of
+        the site, see get_site_workers
+    :param site: site the session scrapes, used for per-site settings like the TTL of
+        cached responses
+    :param http2: send requests over HTTP/2 with httpx instead, also set for the
+        sites in HTTP2_SITES
     :return: A session object
     """
-    if is_tls:
-        session = TLSRotating(proxies=proxies)
+    if http2 or site in HTTP2_SITES:
+        session = HTTP2Rotating(
+            proxies=proxies,
+            has_retry=has_retry,
+            clear_cookies=clear_cookies,
+            pool_size=pool_size,
+            site=site,
+        )
+    elif is_tls:
+        session = TLSRotating(proxies=proxies, site=site)
     else:
         session = RequestsRotating(
             proxies=proxies,
             has_retry=has_retry,
             delay=delay,
             clear_cookies=clear_cookies,
+            pool_size=pool_size,
+            site=site,
         )
 
+    if has_retry:
+        session.retry_policy = RetryPolicy(backoff=delay)
     if ca_cert:
         session.verify = ca_cert
 
     return session
 
 
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+_site_semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+
+def get_executor() -> Executor:
+    """
+    Returns the thread pool shared by all scrapers, creating it on first use with
+    MAX_WORKERS threads
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_WORKERS, thread_name_prefix="JobSpy"
+            )
+        return _executor
+
+
+def set_executor(executor: Executor | None):
+    """
+    Replaces the shared thread pool, e.g. with one owned by the caller. None restores
+    the default pool on next use.
+    """
+    global _executor
+    with _executor_lock:
+        _executor = executor
+
+
+def set_site_workers(site: str, workers: int):
+    """
+    Limits the number of detail fetches running at once for a site. Open sessions
+    of the site resize their connection pools to match on their next request, except
+    tls sessions, see create_session.
+    """
+    with _executor_lock:
+        SITE_WORKERS[site] = workers
+        _site_semaphores.pop(site, None)
+
+
+def get_site_workers(site: str) -> int:
+    """Number of detail fetches running at once for a site"""
+    return SITE_WORKERS.get(site, DEFAULT_SITE_WORKERS)
+
+
+def _get_site_semaphore(site: str) -> threading.BoundedSemaphore:
+    with _executor_lock:
+        if site not in _site_semaphores:
+            workers = get_site_workers(site)
+            _site_semaphores[site] = threading.BoundedSemaphore(workers)
+        return _site_semaphores[site]
+
+
+def map_concurrent(func: Callable, items: Iterable, site: str) -> list:
+    """
+    Applies func to every item on the shared thread pool, with at most the site's
+    worker limit running at once. The calling thread works through the items too, so
+    this never deadlocks when called from a thread of the shared pool.
+    :return: results in the order of items
+    """
+    return run_concurrent(
+        func, items, get_site_workers(site), semaphore=_get_site_semaphore(site)
+    )
+
+
+def run_concurrent(
+    func: Callable,
+    items: Iterable,
+    max_workers: int | None = None,
+    semaphore: threading.Semaphore | None = None,
+) -> list:
+    """
+    Applies func to every item on the shared thread pool, with at most max_workers
+    running at once, the calling thread included. The calling thread works through
+    the items too, so this never deadlocks when called from a thread of the shared
+    pool, even if all its other threads are busy.
+    :param semaphore: also held by every call of func, to share a limit across calls
+    :return: results in the order of items
+    """
+    pending = deque(enumerate(items))
+    results = [None] * len(pending)
+    lock = threading.Lock()
+    workers = max_workers or len(pending)
+
+    def drain():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                i, item = pending.popleft()
+            try:
+                if semaphore is None:
+                    results[i] = func(item)
+                else:
+                    with semaphore:
+                        results[i] = func(item)
+            except BaseException:
+                with lock:
+                    pending.clear()
+                raise
+
+    executor = get_executor()
+    helpers = [executor.submit(drain) for _ in range(min(workers, len(pending)) - 1)]
+    drain()
+    for helper in helpers:
+        # helpers still queued behind busy threads have nothing left to do
+        if not helper.cancel():
+            helper.result()
+    return results
+
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Returns the process pool used for CPU-bound parsing, creating it on first use with
+    one worker per CPU. Workers are not forked from the scraping threads, which may
+    hold locks at that moment, but started from a clean forkserver process.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            _process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _process_pool
+
+
+def run_cpu_bound(func: Callable, *args, offload: bool = False) -> Any:
+    """
+    Runs a CPU-bound function, in a worker process if offload is set. The calling
+    thread waits without holding the GIL, so other threads keep doing network I/O.
+    func and args must be picklable.
+    """
+    if not offload:
+        return func(*args)
+    return get_process_pool().submit(func, *args).result()
+
+
+def map_cpu_bound(func: Callable, items: Iterable, offload: bool = False) -> list:
+    """
+    Applies a CPU-bound function to every item, shipping the items to the worker
+    processes in one batch per worker if offload is set
+    """
+    items = list(items)
+    if not offload or len(items) < 2:
+        return [func(item) for item in items]
+    chunksize = max(1, len(items) // (os.cpu_count() or 1))
+    return list(get_process_pool().map(func, items, chunksize=chunksize))
+
+
 def set_logger_level(verbose: int = 2):
     """
     Adjusts the logger's level. This function allows the logging level to be changed at runtime.
@@ -148,18 +949,60 @@ def set_logger_level(verbose: int = 2):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
+# BeautifulSoup tree builders job pages can be parsed with, see set_html_parser
+HTML_PARSERS = ("html.parser", "lxml")
+_html_parser = "html.parser"
+
+
+def set_html_parser(parser: str):
+    """
+    Sets the parser of the LinkedIn and ZipRecruiter pages. lxml needs the lxml
+    extra, and parses a page about 25% faster than the default html.parser
+    (LinkedIn 41ms -> 30ms, ZipRecruiter 35ms -> 26ms in bench_html_parser.py).
+    :param parser: one of HTML_PARSERS
+    """
+    global _html_parser
+    if parser not in HTML_PARSERS:
+        raise ValueError(
+            f"Invalid html parser: {parser}, expected one of {HTML_PARSERS}"
+        )
+    if parser == "lxml":
+        try:
+            import lxml  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "lxml is required for the lxml html parser, install it with"
+                " `pip install python-jobspy[lxml]`"
+            ) from e
+    _html_parser = parser
+
+
+def get_html_parser() -> str:
+    return _html_parser
+
+
+def parse_html(
+    html: str, parser: str | None = None, parse_only: SoupStrainer | None = None
+) -> BeautifulSoup:
+    """
+    Parses a page with the configured parser. Functions run in the process pool get
+    the parser passed, since the setting is not shared with its workers.
+    :param parser: parser overriding the configured one
+    :param parse_only: strainer of the elements to parse, skipping the rest
+    """
+    return BeautifulSoup(html, parser or _html_parser, parse_only=parse_only)
+
+
 def markdown_converter(description_html: str):
     if description_html is None:
         return None
-    markdown = md(description_html)
-    return markdown.strip()
+    return convert_markdown(description_html)
 
 
 def extract_emails_from_text(text: str) -> list[str] | None:
     if not text:
         return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    return email_regex.findall(text)
+    return find_emails(text)
 
 
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
@@ -196,90 +1039,7 @@ def remove_attributes(tag):
     return tag
 
 
-def extract_salary(
-    salary_str,
-    lower_limit=1000,
-    upper_limit=700000,
-    hourly_threshold=350,
-    monthly_threshold=30000,
-    enforce_annual_salary=False,
-):
-    """
-    Extracts salary information from a string and returns the salary interval, min and max salary values, and currency.
-    (TODO: Needs test cases as the regex is complicated and may not cover all edge cases)
-    """
-    if not salary_str:
-        return None, None, None, None
-
-    annual_max_salary = None
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
-
-    def to_int(s):
-        return int(float(s.replace(",", "")))
-
-    def convert_hourly_to_annual(hourly_wage):
-        return hourly_wage * 2080
-
-    def convert_monthly_to_annual(monthly_wage):
-        return monthly_wage * 12
-
-    match = re.search(min_max_pattern, salary_str)
-
-    if match:
-        min_salary = to_int(match.group(1))
-        max_salary = to_int(match.group(3))
-        # Handle 'k' suffix for min and max salaries independently
-        if "k" in match.group(2).lower() or "k" in match.group(4).lower():
-            min_salary *= 1000
-            max_salary *= 1000
-
-        # Convert to annual if less than the hourly threshold
-        if min_salary < hourly_threshold:
-            interval = CompensationInterval.HOURLY.value
-            annual_min_salary = convert_hourly_to_annual(min_salary)
-            if max_salary < hourly_threshold:
-                annual_max_salary = convert_hourly_to_annual(max_salary)
-
-        elif min_salary < monthly_threshold:
-            interval = CompensationInterval.MONTHLY.value
-            annual_min_salary = convert_monthly_to_annual(min_salary)
-            if max_salary < monthly_threshold:
-                annual_max_salary = convert_monthly_to_annual(max_salary)
-
-        else:
-            interval = CompensationInterval.YEARLY.value
-            annual_min_salary = min_salary
-            annual_max_salary = max_salary
-
-        # Ensure salary range is within specified limits
-        if not annual_max_salary:
-            return None, None, None, None
-        if (
-            lower_limit <= annual_min_salary <= upper_limit
-            and lower_limit <= annual_max_salary <= upper_limit
-            and annual_min_salary < annual_max_salary
-        ):
-            if enforce_annual_salary:
-                return interval, annual_min_salary, annual_max_salary, "USD"
-            else:
-                return interval, min_salary, max_salary, "USD"
-    return None, None, None, None
-
-
 def extract_job_type(description: str):
     if not description:
         return []
-
-    keywords = {
-        JobType.FULL_TIME: r"full\s?time",
-        JobType.PART_TIME: r"part\s?time",
-        JobType.INTERNSHIP: r"internship",
-        JobType.CONTRACT: r"contract",
-    }
-
-    listing_types = []
-    for key, pattern in keywords.items():
-        if re.search(pattern, description, re.IGNORECASE):
-            listing_types.append(key)
-
-    return listing_types if listing_types else None
+    return find_job_types(description.lower()) or None
@@ -10,28 +10,28 @@ from __future__ import annotations
 import json
 import math
 import re
-import time
 from datetime import datetime
-from typing import Optional, Tuple, Any
-
-from concurrent.futures import ThreadPoolExecutor
-
-from bs4 import BeautifulSoup
+from functools import partial
+from typing import Optional, Tuple, Any, Iterator
 
 from .constants import headers
 from .. import Scraper, ScraperInput, Site
+from ..retry import CircuitOpenError
 from ..utils import (
     extract_emails_from_text,
     create_session,
     markdown_converter,
     remove_attributes,
     create_logger,
+    map_cpu_bound,
+    map_concurrent,
+    parse_html,
+    get_html_parser,
 )
 from ...jobs import (
     JobPost,
     Compensation,
     Location,
-    JobResponse,
     JobType,
     Country,
     DescriptionFormat,
@@ -50,44 +50,43 @@ class ZipRecruiterScraper(Scraper):
         """
         Initializes ZipRecruiterScraper with the ZipRecruiter job search url
         """
-        super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
+        super().__init__(Site.ZIP_RECRUITER, proxies=proxies, ca_cert=ca_cert)
 
         self.scraper_input = None
-        self.session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session = create_session(
+            proxies=proxies, ca_cert=ca_cert, site=self.site.value
+        )
         self.session.headers.update(headers)
         self._get_cookies()
 
-        self.delay = 5
         self.jobs_per_page = 20
         self.seen_urls = set()
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
         Scrapes ZipRecruiter for jobs with scraper_input criteria.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: jobs found on each page.
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         continue_token = None
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
         for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
+            if job_count >= scraper_input.results_wanted:
                 break
-            if page > 1:
-                time.sleep(self.delay)
             logger.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
             )
-            if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
+            if not jobs_on_page:
                 break
+            jobs_on_page = jobs_on_page[: scraper_input.results_wanted - job_count]
+            job_count += len(jobs_on_page)
+            yield jobs_on_page
             if not continue_token:
                 break
-        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
@@ -122,15 +121,33 @@ class ZipRecruiterScraper(Scraper):
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
-
-        job_list = list(filter(None, (result.result() for result in job_results)))
+        job_results = map_concurrent(self._process_job, jobs_list, self.site.value)
+        job_results = list(filter(None, job_results))
+        # the job pages are parsed in one batch once all of them are fetched
+        parse_job_page = partial(
+            self._parse_job_page,
+            description_format=scraper_input.description_format,
+            parser=get_html_parser(),
+        )
+        job_pages = map_cpu_bound(
+            parse_job_page,
+            [page for _, page in job_results],
+            offload=scraper_input.offload_parsing,
+        )
+        job_list = []
+        for (job_post, _), (description_full, job_url_direct) in zip(
+            job_results, job_pages
+        ):
+            if description_full:
+                job_post.description = description_full
+            job_post.job_url_direct = job_url_direct
+            job_list.append(job_post)
         return job_list, next_continue_token
 
-    def _process_job(self, job: dict) -> JobPost | None:
+    def _process_job(self, job: dict) -> Tuple[JobPost, str | None] | None:
         """
-        Processes an individual job dict from the response
+        Processes an individual job dict from the response and fetches its job page
+        :return: job, without the details parsed from the job page, and the page
         """
         title = job.get("name")
         job_url = f"{self.base_url}/jobs//j?lvk={job['listing_key']}"
@@ -161,9 +178,9 @@ class ZipRecruiterScraper(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
+        job_page = self._fetch_job_page(job_url)
 
-        return JobPost(
+        job_post = JobPost(
             id=f'zr-{job["listing_key"]}',
             title=title,
             company_name=company,
@@ -177,47 +194,68 @@ class ZipRecruiterScraper(Scraper):
             ),
             date_posted=date_posted,
             job_url=job_url,
-            description=description_full if description_full else description,
+            description=description,
             emails=extract_emails_from_text(description) if description else None,
-            job_url_direct=job_url_direct,
             listing_type=listing_type,
         )
+        return job_post, job_page
 
-    def _get_descr(self, job_url):
-        res = self.session.get(job_url, allow_redirects=True)
-        description_full = job_url_direct = None
-        if res.ok:
-            soup = BeautifulSoup(res.text, "html.parser")
-            job_descr_div = soup.find("div", class_="job_description")
-            company_descr_section = soup.find("section", class_="company_description")
-            job_description_clean = (
-                remove_attributes(job_descr_div).prettify(formatter="html")
-                if job_descr_div
-                else ""
-            )
-            company_description_clean = (
-                remove_attributes(company_descr_section).prettify(formatter="html")
-                if company_descr_section
-                else ""
+    def _fetch_job_page(self, job_url: str) -> str | None:
+        try:
+            res = self.session.get(job_url, allow_redirects=True, cache=True)
+        except CircuitOpenError as e:
+            logger.error(f"ZipRecruiter: {str(e)}")
+            return None
+        if not res.ok:
+            return None
+        return res.text
+
+    @staticmethod
+    def _parse_job_page(
+        html: str | None,
+        description_format: DescriptionFormat,
+        parser: str | None = None,
+    ) -> Tuple[str | None, str | None]:
+        """
+        Parses the full description and the direct job url out of a job page
+        """
+        if html is None:
+            return None, None
+        job_url_direct = None
+        soup = parse_html(html, parser)
+        job_descr_div = soup.find("div", class_="job_description")
+        company_descr_section = soup.find("section", class_="company_description")
+        # markdown is converted from the plain html, prettifying it is wasted
+        markdown = description_format == DescriptionFormat.MARKDOWN
+        description_full = "".join(
+            (
+                remove_attributes(tag).decode()
+                if markdown
+                else remove_attributes(tag).prettify(formatter="html")
             )
-            description_full = job_description_clean + company_description_clean
-            script_tag = soup.find("script", type="application/json")
-            if script_tag:
-                job_json = json.loads(script_tag.string)
-                job_url_val = job_json["model"].get("saveJobURL", "")
-                m = re.search(r"job_url=(.+)", job_url_val)
-                if m:
-                    job_url_direct = m.group(1)
-
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description_full = markdown_converter(description_full)
+            for tag in (job_descr_div, company_descr_section)
+            if tag
+        )
+        script_tag = soup.find("script", type="application/json")
+        if script_tag:
+            job_json = json.loads(script_tag.string)
+            job_url_val = job_json["model"].get("saveJobURL", "")
+            m = re.search(r"job_url=(.+)", job_url_val)
+            if m:
+                job_url_direct = m.group(1)
+
+        if markdown:
+            description_full = markdown_converter(description_full)
 
         return description_full, job_url_direct
 
     def _get_cookies(self):
         data = "event_type=session&logged_in=false&number_of_retry=1&property=model%3AiPhone&property=os%3AiOS&property=locale%3Aen_us&property=app_build_number%3A4734&property=app_version%3A91.0&property=manufacturer%3AApple&property=timestamp%3A2024-01-12T12%3A04%3A42-06%3A00&property=screen_height%3A852&property=os_version%3A16.6.1&property=source%3Ainstall&property=screen_width%3A393&property=device_model%3AiPhone%2014%20Pro&property=brand%3AApple"
         url = f"{self.api_url}/jobs-app/event"
-        self.session.post(url, data=data)
+        try:
+            self.session.post(url, data=data)
+        except CircuitOpenError as e:
+            logger.error(f"ZipRecruiter: {str(e)}")
 
     @staticmethod
     def _get_job_type_enum(job_type_str: str) -> list[JobType] | None:
@@ -0,0 +1,138 @@
+import time
+import threading
+from typing import NamedTuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from jobspy import pool
+from jobspy.jobs import JobPost, Location
+from jobspy.scrapers import Scraper, Site
+
+
+class StubScraper(Scraper):
+    """Scraper returning pages of made up jobs without any network request"""
+
+    pages = 2
+    jobs_per_page = 2
+    delay = 0.0
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+    threads: set[str] = set()
+    pages_returned = 0
+
+    def scrape_pages(self, scraper_input):
+        cls = StubScraper
+        with cls.lock:
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+            cls.threads.add(threading.current_thread().name)
+        try:
+            for page in range(self.pages):
+                time.sleep(self.delay)
+                with cls.lock:
+                    cls.pages_returned += 1
+                yield [
+                    JobPost(
+                        id=f"{self.site.value}-{scraper_input.search_term}-{page}-{i}",
+                        title="Software Engineer",
+                        company_name="Acme",
+                        job_url=f"https://example.com/{self.site.value}/{page}/{i}",
+                        location=Location(city="Austin", state="TX"),
+                    )
+                    for i in range(self.jobs_per_page)
+                ]
+        finally:
+            with cls.lock:
+                cls.running -= 1
+
+
+@pytest.fixture
+def stub_scrapers(monkeypatch):
+    """Replaces the scrapers of all sites with StubScraper"""
+    for site in Site:
+        monkeypatch.setitem(
+            pool.SCRAPER_MAPPING,
+            site,
+            lambda proxies=None, ca_cert=None, site=site: StubScraper(
+                site, proxies=proxies, ca_cert=ca_cert
+            ),
+        )
+    for name in ("pages", "jobs_per_page", "delay"):
+        monkeypatch.setattr(StubScraper, name, getattr(StubScraper, name))
+    monkeypatch.setattr(StubScraper, "running", 0)
+    monkeypatch.setattr(StubScraper, "max_running", 0)
+    monkeypatch.setattr(StubScraper, "threads", set())
+    monkeypatch.setattr(StubScraper, "pages_returned", 0)
+    pool.scraper_pool.clear()
+    yield StubScraper
+    pool.scraper_pool.clear()
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    # header names lowercased
+    headers: dict[str, str]
+    body: bytes
+
+
+class LocalServer:
+    """
+    HTTP/1.1 server on 127.0.0.1 answering every request with handle(request), which
+    returns the status, headers and body of the response
+    """
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                request = Request(
+                    self.command,
+                    self.path,
+                    {name.lower(): value for name, value in self.headers.items()},
+                    self.rfile.read(length),
+                )
+                status, headers, body = server.handle(request)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = respond
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def local_server():
+    """Starts LocalServers for a test, local_server(handle), and stops them after it"""
+    servers = []
+
+    def start(handle) -> LocalServer:
+        server = LocalServer(handle)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
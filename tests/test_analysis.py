@@ -0,0 +1,63 @@
+import pandas as pd
+
+from jobspy.jobs import JobType
+from jobspy.scrapers.analysis import (
+    analyze_text,
+    extract_salaries,
+    extract_salary,
+    find_emails,
+)
+
+
+def test_analyze_text():
+    analysis = analyze_text(
+        "Full time or part-time contract role, work from home.\n"
+        "Pays $40k - $60k. Apply at jobs@example.com or hr.team@example.co.uk."
+    )
+    assert analysis.emails == ["jobs@example.com", "hr.team@example.co.uk"]
+    assert analysis.job_types == [JobType.FULL_TIME, JobType.CONTRACT]
+    assert analysis.is_remote
+
+    analysis = analyze_text("On site internship")
+    assert analysis.emails == []
+    assert analysis.job_types == [JobType.INTERNSHIP]
+    assert not analysis.is_remote
+
+    assert analyze_text(None).emails is None
+    assert analyze_text("Welcome").job_types is None
+
+
+def test_find_emails():
+    assert find_emails("a @ b, x@y, contact: first_last@corp.io.") == [
+        "first_last@corp.io"
+    ]
+    assert find_emails("a@b.com@c.org d@e.net") == ["a@b.com", "d@e.net"]
+
+
+def test_extract_salaries():
+    descriptions = pd.Series(
+        [
+            "Pays $40k - $60k a year",
+            "Hourly rate $25 - $35.50",
+            "Monthly $4,000 - $6,000",
+            "Hourly from $20 to $30",
+            "Bonus up to $5 - $1,000,000",
+            None,
+            "$18 - $400",
+        ],
+        index=range(10, 17),
+        dtype=object,
+    )
+    for enforce_annual_salary in (False, True):
+        salaries = extract_salaries(
+            descriptions, enforce_annual_salary=enforce_annual_salary
+        )
+        assert list(salaries.index) == list(descriptions.index)
+        for row, description in zip(salaries.itertuples(index=False), descriptions):
+            assert tuple(row) == extract_salary(
+                description, enforce_annual_salary=enforce_annual_salary
+            )
+    salaries = extract_salaries(descriptions)
+    assert salaries.loc[11].tolist() == ["hourly", 25, 35, "USD"]
+    assert salaries.loc[12].tolist() == ["monthly", 4000, 6000, "USD"]
+    assert salaries.loc[13].isna().all()
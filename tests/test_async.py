@@ -0,0 +1,29 @@
+import asyncio
+
+from jobspy import pool, scrape_jobs, scrape_jobs_async
+
+
+def test_scrape_jobs_async(stub_scrapers):
+    sites = ["indeed", "glassdoor", "linkedin"]
+    stub_scrapers.delay = 0.02
+    result = asyncio.run(scrape_jobs_async(site_name=sites, verbose=0))
+
+    assert list(result.columns) == list(scrape_jobs(site_name=sites, verbose=0).columns)
+    per_site = stub_scrapers.pages * stub_scrapers.jobs_per_page
+    assert result["site"].value_counts().to_dict() == {site: per_site for site in sites}
+    # the sites are scraped side by side, not one after the other
+    assert stub_scrapers.max_running == len(sites)
+
+
+def test_scrape_jobs_async_releases_scrapers(stub_scrapers):
+    async def cancelled():
+        task = asyncio.create_task(scrape_jobs_async(site_name="indeed", verbose=0))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    stub_scrapers.pages = 20
+    stub_scrapers.delay = 0.02
+    asyncio.run(cancelled())
+    # the cancelled search handed its scraper back to the pool
+    assert sum(map(len, pool.scraper_pool._idle.values())) == 1
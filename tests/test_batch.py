@@ -0,0 +1,35 @@
+from jobspy import pool, scrape_jobs_batch
+
+
+def test_scrape_jobs_batch(stub_scrapers):
+    terms = ["engineer", "nurse", "teacher"]
+    result = scrape_jobs_batch(
+        [{"search_term": term} for term in terms],
+        site_name=["indeed", "linkedin"],
+        max_workers=1,
+        verbose=0,
+    )
+
+    per_query = 2 * stub_scrapers.pages * stub_scrapers.jobs_per_page
+    assert result["query_id"].value_counts().to_dict() == {
+        0: per_query,
+        1: per_query,
+        2: per_query,
+    }
+    for query_id, term in enumerate(terms):
+        ids = result.loc[result["query_id"] == query_id, "id"]
+        assert ids.str.contains(f"-{term}-").all()
+    # one search at a time, each reusing the scraper of its site
+    assert stub_scrapers.max_running == 1
+    assert sorted(map(len, pool.scraper_pool._idle.values())) == [1, 1]
+
+
+def test_scrape_jobs_batch_max_workers(stub_scrapers):
+    stub_scrapers.delay = 0.01
+    scrape_jobs_batch(
+        [{"search_term": term} for term in ("a", "b", "c")],
+        site_name=["indeed", "linkedin"],
+        max_workers=2,
+        verbose=0,
+    )
+    assert stub_scrapers.max_running == 2
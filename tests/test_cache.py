@@ -0,0 +1,61 @@
+import os
+
+import requests
+import tls_client
+
+from jobspy.scrapers.cache import ResponseCache
+from jobspy.scrapers.utils import _redirected
+
+
+def make_response(url: str, content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/html"
+    response._content = content
+    return response
+
+
+def test_response_cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.db"), max_size=2000)
+    url = "https://www.linkedin.com/jobs/view/1"
+    key = cache.key("GET", url)
+    assert cache.key("POST", url, json={"jl": 1}) != key
+    cache.set(key, "linkedin", make_response(url, b"<html>job 1</html>"))
+
+    cached = cache.get(key, ttl=60)
+    assert cached.text == "<html>job 1</html>"
+    assert cached.headers["content-type"] == "text/html"
+    assert cached.ok
+    assert cache.get(key, ttl=-1) is None
+    assert cache.get(key, ttl=60) is None
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.db"), max_size=3000)
+    for i in range(10):
+        url = f"https://www.ziprecruiter.com/jobs/{i}"
+        content = os.urandom(1000)
+        cache.set(cache.key("GET", url), "zip_recruiter", make_response(url, content))
+        cache.get(cache.key("GET", "https://www.ziprecruiter.com/jobs/0"), ttl=60)
+
+    assert cache.size <= 3000
+    assert cache.get(cache.key("GET", "https://www.ziprecruiter.com/jobs/0"), ttl=60)
+    assert (
+        cache.get(cache.key("GET", "https://www.ziprecruiter.com/jobs/1"), 60) is None
+    )
+
+
+def test_redirected_responses():
+    url = "https://www.linkedin.com/jobs/view/1"
+    response = make_response(url, b"")
+    assert not _redirected(response, url)
+    response.history = [make_response(url, b"")]
+    assert _redirected(response, url)
+
+    # tls_client responses have no history
+    tls_response = tls_client.response.Response()
+    tls_response.url = url
+    assert not _redirected(tls_response, url)
+    tls_response.url = "https://www.linkedin.com/signup"
+    assert _redirected(tls_response, url)
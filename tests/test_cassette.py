@@ -0,0 +1,29 @@
+import pytest
+
+from jobspy.scrapers.cassette import set_cassette, CassetteError
+from jobspy.scrapers.utils import create_session
+
+
+def job_page(request):
+    return 200, {"Content-Type": "text/html"}, f"<html>{request.path}</html>".encode()
+
+
+def test_cassette_record_and_replay(tmp_path, local_server):
+    server = local_server(job_page)
+    url = f"{server.url}/jobs/view/1"
+    path = str(tmp_path / "cassette.jsonl.gz")
+    try:
+        set_cassette(path, mode="record")
+        recorded = create_session(is_tls=False).get(url, params={"q": "engineer"})
+    finally:
+        server.close()
+
+    try:
+        set_cassette(path, mode="replay")
+        replayed = create_session(is_tls=False).get(url, params={"q": "engineer"})
+        assert replayed.status_code == 200
+        assert replayed.text == recorded.text == "<html>/jobs/view/1?q=engineer</html>"
+        with pytest.raises(CassetteError):
+            create_session(is_tls=False).get(url)
+    finally:
+        set_cassette(None)
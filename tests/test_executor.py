@@ -0,0 +1,123 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jobspy import scrape_jobs, scrape_jobs_iter, scrape_jobs_batch
+from jobspy.scrapers.analysis import extract_salary
+from jobspy.scrapers.utils import (
+    get_executor,
+    set_executor,
+    set_site_workers,
+    create_session,
+    map_concurrent,
+    get_process_pool,
+    map_cpu_bound,
+    run_cpu_bound,
+    markdown_converter,
+)
+
+
+def test_cpu_bound_offload():
+    html = "<p>Pays <strong>$90,000 - $120,000</strong> a year</p>"
+    assert run_cpu_bound(markdown_converter, html, offload=True) == (
+        markdown_converter(html)
+    )
+
+    descriptions = [f"Pays ${i}0,000 - ${i + 1}0,000" for i in range(2, 9)]
+    assert map_cpu_bound(extract_salary, descriptions, offload=True) == [
+        extract_salary(description) for description in descriptions
+    ]
+    assert get_process_pool()._mp_context.get_start_method() != "fork"
+
+
+def test_map_concurrent():
+    set_site_workers("test_map", 2)
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def square(item: int) -> int:
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return item * item
+
+    assert map_concurrent(square, range(10), "test_map") == [i * i for i in range(10)]
+    assert running[1] == 2
+
+    def fail(item: int) -> int:
+        if item == 3:
+            raise ValueError(item)
+        return item
+
+    with pytest.raises(ValueError):
+        map_concurrent(fail, range(10), "test_map")
+
+
+def test_map_concurrent_in_shared_pool():
+    # the only thread of the pool runs the caller, which works through the items
+    set_executor(ThreadPoolExecutor(max_workers=1))
+    try:
+        future = get_executor().submit(
+            map_concurrent, lambda item: item + 1, range(5), "test_map"
+        )
+        assert future.result(timeout=10) == [1, 2, 3, 4, 5]
+    finally:
+        set_executor(None)
+
+
+def test_scrape_jobs_batch_shared_pool(stub_scrapers):
+    stub_scrapers.delay = 0.01
+    set_executor(ThreadPoolExecutor(max_workers=8, thread_name_prefix="Shared"))
+    try:
+        result = scrape_jobs_batch(
+            [{"search_term": term} for term in ("a", "b", "c")],
+            site_name=["indeed", "linkedin"],
+            max_workers=2,
+            verbose=0,
+        )
+    finally:
+        set_executor(None)
+    assert len(result) == 3 * 2 * stub_scrapers.pages * stub_scrapers.jobs_per_page
+    # the calling thread works through the searches too
+    threads = stub_scrapers.threads - {threading.current_thread().name}
+    assert threads and all(name.startswith("Shared") for name in threads)
+
+
+def test_nested_scrapes_on_small_pool(stub_scrapers):
+    # every thread of the pool runs an outer call, none is left for their sites
+    set_executor(ThreadPoolExecutor(max_workers=2))
+    sites = ["indeed", "linkedin", "google"]
+    try:
+        calls = [
+            lambda: len(scrape_jobs(site_name=sites, verbose=0)),
+            lambda: sum(map(len, scrape_jobs_iter(site_name=sites, verbose=0))),
+            lambda: len(
+                scrape_jobs_batch([{"search_term": "a"}], site_name=sites, verbose=0)
+            ),
+        ]
+        for call in calls:
+            futures = [get_executor().submit(call) for _ in range(2)]
+            expected = len(sites) * stub_scrapers.pages * stub_scrapers.jobs_per_page
+            assert [future.result(timeout=10) for future in futures] == [expected] * 2
+    finally:
+        set_executor(None)
+
+
+def test_sessions_follow_site_workers(local_server):
+    server = local_server(lambda request: (200, {}, b"ok"))
+    set_site_workers("test_session", 3)
+    session = create_session(is_tls=False, site="test_session")
+    assert session.get_adapter(server.url)._pool_maxsize == 3
+
+    set_site_workers("test_session", 5)
+    assert session.get(server.url).text == "ok"
+    assert session.get_adapter(server.url)._pool_maxsize == 5
+    # a given pool_size is kept
+    session = create_session(is_tls=False, site="test_session", pool_size=2)
+    session.get(server.url)
+    assert session.get_adapter(server.url)._pool_maxsize == 2
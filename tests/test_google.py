@@ -1,4 +1,7 @@
+import json
+
 from jobspy import scrape_jobs
+from jobspy.scrapers.google import GoogleJobsScraper
 import pandas as pd
 
 
@@ -10,3 +13,17 @@ def test_google():
     assert (
         isinstance(result, pd.DataFrame) and len(result) == 5
     ), "Result should be a non-empty DataFrame"
+
+
+def test_google_find_job_info_initial_page():
+    listings = [
+        ["Engineer [remote]", 'Says "hi" \\ ]]', [[["deeply"], [["nested"]]]]],
+        ["Analyst", "Example", [[["https://example.com/job"]]]],
+    ]
+    content = (
+        "<html><script>{"
+        + ",".join(f'"520084652":{json.dumps(listing)}' for listing in listings)
+        + ', "520084652":"not a listing"}</script>'
+        + '<div>"520084652":[["unterminated"'
+    ).encode()
+    assert GoogleJobsScraper._find_job_info_initial_page(content) == listings
@@ -0,0 +1,48 @@
+import pytest
+
+from jobspy.jobs import DescriptionFormat, JobType
+from jobspy.scrapers.utils import set_html_parser, get_html_parser
+from jobspy.scrapers.linkedin import LinkedInScraper
+
+JOB_PAGE = """
+<html><body>
+<img class="artdeco-entity-image" data-delayed-url="https://example.com/logo.png">
+<div class="show-more-less-html__markup relative">
+<p>Build <strong>services</strong> &amp; tools.<br>Full-time.</p>
+</div>
+<ul>
+<li><h3 class="description__job-criteria-subheader">Seniority level</h3>
+<span class="description__job-criteria-text description__job-criteria-text--criteria">
+Entry level</span></li>
+<li><h3 class="description__job-criteria-subheader">Employment type</h3>
+<span class="description__job-criteria-text description__job-criteria-text--criteria">
+Full-time</span></li>
+<li><h3 class="description__job-criteria-subheader">Job function</h3>
+<span class="description__job-criteria-text description__job-criteria-text--criteria">
+Engineering</span></li>
+</ul>
+<code id="applyUrl" style="display: none"><!--"https://www.linkedin.com/jobs/view/externalApply/1?url=https%3A%2F%2Fcareers%2Eexample%2Ecom%2Fjobs%2F1"--></code>
+</body></html>
+"""
+
+
+def test_html_parsers():
+    with pytest.raises(ValueError):
+        set_html_parser("html5")
+    assert get_html_parser() == "html.parser"
+
+    details = LinkedInScraper._parse_job_page(JOB_PAGE, DescriptionFormat.MARKDOWN)
+    assert "**services**" in details["description"]
+    assert "Full-time." in details["description"]
+    assert details["job_level"] == "Entry level"
+    assert details["job_type"] == [JobType.FULL_TIME]
+    assert details["job_function"] == "Engineering"
+    assert details["company_industry"] is None
+    assert details["job_url_direct"] == "https://careers.example.com/jobs/1"
+    assert details["company_logo"] == "https://example.com/logo.png"
+
+    pytest.importorskip("lxml")
+    assert (
+        LinkedInScraper._parse_job_page(JOB_PAGE, DescriptionFormat.MARKDOWN, "lxml")
+        == details
+    )
@@ -0,0 +1,152 @@
+import ssl
+import socket
+import shutil
+import threading
+import subprocess
+
+import pytest
+
+from jobspy.scrapers.utils import create_session, set_http2, HTTP2Rotating
+from .conftest import Request
+
+h2 = pytest.importorskip("h2")
+import h2.config
+import h2.events
+import h2.connection
+
+
+class H2Server:
+    """
+    HTTP/2 over TLS server on 127.0.0.1 answering like LocalServer, recording the
+    protocol negotiated for each connection
+    """
+
+    def __init__(self, handle, certfile: str, keyfile: str):
+        self.handle = handle
+        self.certfile = certfile
+        self.protocols: list[str | None] = []
+        self.context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self.context.load_cert_chain(certfile, keyfile)
+        self.context.set_alpn_protocols(["h2"])
+        self.socket = socket.create_server(("127.0.0.1", 0))
+        self.url = f"https://127.0.0.1:{self.socket.getsockname()[1]}"
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def close(self):
+        self.socket.close()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self.socket.accept()
+            except OSError:
+                return
+            threading.Thread(
+                target=self._serve_connection, args=(connection,), daemon=True
+            ).start()
+
+    def _serve_connection(self, connection):
+        with self.context.wrap_socket(connection, server_side=True) as tls:
+            self.protocols.append(tls.selected_alpn_protocol())
+            conn = h2.connection.H2Connection(
+                h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+            )
+            conn.initiate_connection()
+            tls.sendall(conn.data_to_send())
+            streams = {}
+            while data := tls.recv(65535):
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        streams[event.stream_id] = [dict(event.headers), b""]
+                    elif isinstance(event, h2.events.DataReceived):
+                        streams[event.stream_id][1] += event.data
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        self._respond(
+                            conn, event.stream_id, *streams.pop(event.stream_id)
+                        )
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                tls.sendall(conn.data_to_send())
+
+    def _respond(self, conn, stream_id: int, headers: dict, body: bytes):
+        request = Request(headers[":method"], headers[":path"], headers, body)
+        status, response_headers, body = self.handle(request)
+        conn.send_headers(
+            stream_id,
+            [(":status", str(status))]
+            + [(name.lower(), value) for name, value in response_headers.items()]
+            + [("content-length", str(len(body)))],
+        )
+        conn.send_data(stream_id, body, end_stream=True)
+
+
+@pytest.fixture
+def h2_server(tmp_path):
+    """Starts an H2Server with a self-signed certificate, h2_server(handle)"""
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is required to create a test certificate")
+    certfile, keyfile = str(tmp_path / "cert.pem"), str(tmp_path / "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes"]
+        + ["-keyout", keyfile, "-out", certfile, "-days", "1"]
+        + ["-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1"],
+        check=True,
+        capture_output=True,
+    )
+    servers = []
+
+    def start(handle) -> H2Server:
+        server = H2Server(handle, certfile, keyfile)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+def handle(request):
+    if request.path == "/redirect":
+        return 302, {"Location": "/job/1"}, b""
+    if request.method == "POST":
+        return 200, {}, request.body
+    body = f"{request.path} {request.headers.get('x-test')}".encode()
+    return 200, {"Content-Type": "text/plain; charset=utf-8"}, body
+
+
+def check_session(url: str, ca_cert: str | None = None):
+    set_http2("glassdoor")
+    try:
+        session = create_session(site="glassdoor", ca_cert=ca_cert)
+    finally:
+        set_http2("glassdoor", enabled=False)
+    assert isinstance(session, HTTP2Rotating)
+    assert not isinstance(create_session(site="glassdoor"), HTTP2Rotating)
+
+    session.headers.update({"X-Test": "header"})
+    response = session.get(f"{url}/job/1", params={"q": "a"})
+    assert response.ok
+    assert response.text == "/job/1?q=a header"
+
+    response = session.get(f"{url}/redirect")
+    assert response.url.endswith("/job/1")
+    assert len(response.history) == 1
+
+    response = session.post(f"{url}/graph", data="a=1", timeout_seconds=5)
+    assert response.text == "a=1"
+    assert session.post(f"{url}/graph", json={"a": 1}).json() == {"a": 1}
+    session.close()
+
+
+def test_http2_session(local_server):
+    check_session(local_server(handle).url)
+
+
+def test_http2_session_negotiates_h2(h2_server):
+    server = h2_server(handle)
+    check_session(server.url, ca_cert=server.certfile)
+    # all requests multiplexed over one HTTP/2 connection
+    assert server.protocols == ["h2"]
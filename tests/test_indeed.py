@@ -1,4 +1,7 @@
 from jobspy import scrape_jobs
+from jobspy.jobs import Country
+from jobspy.scrapers import ScraperInput, Site
+from jobspy.scrapers.indeed import IndeedScraper
 import pandas as pd
 
 
@@ -11,3 +14,30 @@ def test_indeed():
     assert (
         isinstance(result, pd.DataFrame) and len(result) == 5
     ), "Result should be a non-empty DataFrame"
+
+
+def test_indeed_job_fields_projection():
+    scraper = IndeedScraper()
+    scraper.scraper_input = ScraperInput(
+        site_type=[Site.INDEED], columns=["title", "company", "job_url"]
+    )
+    job_fields = scraper._build_job_fields()
+    assert "employer" in job_fields
+    assert "description" not in job_fields and "dossier" not in job_fields
+
+    job = {
+        "key": "abc",
+        "title": "Engineer",
+        "datePublished": 1700000000000,
+        "employer": {"name": "Acme", "relativeCompanyPageUrl": "/cmp/acme"},
+    }
+    job_post = scraper._process_job(job, None)
+    assert job_post.company_name == "Acme"
+    assert job_post.compensation is None and not job_post.is_remote
+
+    # salaries of jobs in the USA are also read from their descriptions
+    scraper.scraper_input.columns = ["title", "min_amount"]
+    job_fields = scraper._build_job_fields()
+    assert "compensation" in job_fields and "description" in job_fields
+    scraper.scraper_input.country = Country.GERMANY
+    assert "description" not in scraper._build_job_fields()
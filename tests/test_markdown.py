@@ -0,0 +1,84 @@
+import pytest
+
+from jobspy.scrapers.markdown import (
+    MarkdownMemo,
+    html_to_markdown,
+    convert_markdown,
+    set_markdown_memo,
+)
+
+
+def test_html_to_markdown():
+    html = (
+        "<h2>About</h2><p>We build <b> fast </b> tools_for <i>everyone</i>.<br>"
+        'Apply at <a href="https://example.com/jobs">our site</a></p>'
+        "<ul><li>Python<ul><li>pandas</li></ul></li><li>Go</ul>"
+        "<ol start='3'><li>first</li><li>second</li></ol><script>x()</script>"
+    )
+    assert html_to_markdown(html) == (
+        "About\n-----\n\n"
+        "We build **fast** tools\\_for *everyone*.  \n"
+        "Apply at [our site](https://example.com/jobs)\n\n"
+        "* Python\n\t+ pandas\n* Go\n\n"
+        "3. first\n4. second"
+    )
+    # tables are left to markdownify
+    assert "| a |" in html_to_markdown("<table><tr><th>a</th></tr></table>")
+
+
+# markdownify 0.13.1 output, with runs of blank lines collapsed like the converter does
+MARKDOWNIFY_CASES = [
+    ("<blockquote><p>a</p><p>b</p></blockquote>", "> a\n> \n> b"),
+    (
+        "<blockquote>Quoted <b>text</b><br>next line</blockquote>",
+        "> Quoted **text**  \n> next line",
+    ),
+    (
+        "<p>Was <s>$80k</s> <del>$90k</del> now $100k</p>",
+        "Was ~~$80k~~ ~~$90k~~ now $100k",
+    ),
+    ("<p>Old <strike>title</strike></p>", "Old title"),
+    (
+        "<p>Press <kbd>ctrl_c</kbd> or run <samp>a_b</samp> and <code>c_d</code></p>",
+        "Press `ctrl_c` or run `a_b` and `c_d`",
+    ),
+    ("<p>snake_case *stars*</p>", "snake\\_case \\*stars\\*"),
+    (
+        "<h1>Title</h1><h3>Perks</h3><p>Free <em>lunch</em></p>",
+        "Title\n=====\n\n### Perks\n\nFree *lunch*",
+    ),
+    (
+        "<ul><li>a<ol><li>b<ul><li>c</li></ul></li><li>d</li></ol></li><li>e</li></ul>"
+        "<p>after</p>",
+        "* a\n\t1. b\n\t\t+ c\n\t2. d\n* e\n\nafter",
+    ),
+    (
+        '<p><a href="https://example.com">https://example.com</a> and '
+        '<a href="/x" title="t">x</a></p>',
+        '<https://example.com> and [x](/x "t")',
+    ),
+    ("<pre><code>x = 1\n  y_2 = 2</code></pre>", "```\nx = 1\n  y_2 = 2\n```"),
+    ("<p>a</p><hr><p>b</p>", "a\n\n---\n\nb"),
+    ('<p><img src="logo.png" alt="Logo"></p>', "![Logo](logo.png)"),
+]
+
+
+@pytest.mark.parametrize("html, expected", MARKDOWNIFY_CASES)
+def test_html_to_markdown_matches_markdownify(html, expected):
+    assert html_to_markdown(html) == expected
+
+
+def test_markdown_memo(tmp_path):
+    memo = MarkdownMemo(max_entries=2, path=str(tmp_path / "markdown.db"))
+    keys = [memo.key(f"<p>{i}</p>") for i in range(3)]
+    for i, key in enumerate(keys):
+        memo.set(key, str(i))
+    assert memo.get(keys[2]) == "2"
+    assert len(memo._entries) == 2
+    # evicted from memory, still on disk
+    assert memo.get(keys[0]) == "0"
+    memo.close()
+
+    set_markdown_memo(max_entries=10)
+    assert convert_markdown("<p>a</p>") == "a"
+    set_markdown_memo()
@@ -0,0 +1,34 @@
+from jobspy.scrapers.metrics import MetricsCollector, endpoint_of
+
+
+def test_metrics_collector():
+    collector = MetricsCollector()
+    for job_id, latency in ((1, 0.2), (2, 0.4), (3, 3.0)):
+        collector.record_request(
+            "linkedin",
+            f"https://www.linkedin.com/jobs/view/{job_id}",
+            latency,
+            status_code=200,
+            size=1000,
+        )
+    collector.record_request(
+        "linkedin", "https://www.linkedin.com/jobs/view/4", 0.1, status_code=429
+    )
+    collector.record_cache_hit("linkedin", "https://www.linkedin.com/jobs/view/5")
+    collector.record_jobs("linkedin", 2)
+
+    summary = collector.summary().iloc[0]
+    assert summary["endpoint"] == endpoint_of("https://www.linkedin.com/jobs/view/9")
+    assert summary["requests"] == 4
+    assert summary["cache_hits"] == 1
+    assert summary["throttled"] == 1
+    assert summary["bytes"] == 3000
+    assert summary["latency_p50"] == 0.25
+    assert summary["status_codes"] == {200: 3, 429: 1}
+    assert collector.requests_per_job() == {"linkedin": 2}
+
+    text = collector.to_prometheus()
+    labels = 'site="linkedin",endpoint="www.linkedin.com/jobs/view/:id"'
+    assert f'jobspy_requests_total{{{labels},status="429"}} 1' in text
+    assert f'jobspy_request_duration_seconds_bucket{{{labels},le="+Inf"}} 4' in text
+    assert 'jobspy_requests_per_job{site="linkedin"} 2.0' in text
@@ -0,0 +1,13 @@
+from jobspy.pool import ScraperPool
+from jobspy.scrapers import Site
+
+
+def test_scraper_pool_reuses_scrapers():
+    pool = ScraperPool()
+    with pool.scraper(Site.INDEED) as scraper:
+        scraper.seen_urls.add("https://www.indeed.com/viewjob?jk=1")
+    with pool.scraper(Site.INDEED) as reused:
+        assert reused is scraper
+        assert not reused.seen_urls
+    with pool.scraper(Site.INDEED, proxies=["localhost"]) as other:
+        assert other is not scraper
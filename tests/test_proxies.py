@@ -0,0 +1,23 @@
+from jobspy.scrapers.utils import ProxyPool, get_proxy_pool
+
+
+def test_proxy_pool_ejects_failing_proxies():
+    pool = ProxyPool(["http://good:8080", "http://bad:8080"], eject_after=3)
+    for _ in range(3):
+        pool.report("http://good:8080", latency=0.2, status_code=200)
+        pool.report("http://bad:8080", status_code=429)
+
+    assert {pool.select() for _ in range(50)} == {"http://good:8080"}
+    stats = {row["proxy"]: row for row in pool.stats()}
+    assert stats["http://bad:8080"]["ejected"]
+    assert stats["http://bad:8080"]["throttled"] == 3
+    assert stats["http://good:8080"]["success_rate"] == 1
+
+
+def test_get_proxy_pool_is_shared():
+    pool = get_proxy_pool(["good:8080", "localhost"])
+    assert get_proxy_pool(["http://good:8080", "localhost"]) is pool
+    assert [row["proxy"] for row in pool.stats()] == [
+        "http://good:8080",
+        "http://localhost",
+    ]
@@ -0,0 +1,39 @@
+import time
+
+from jobspy.scrapers.utils import RateLimiter, PacedStep
+
+
+def test_rate_limiter_paces_matching_urls():
+    limiter = RateLimiter({"example.com/jobs": (20, 2)})
+
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.wait("https://example.com/jobs/search?q=engineer")
+    assert time.monotonic() - start >= 0.09
+
+    start = time.monotonic()
+    for _ in range(50):
+        limiter.wait("https://example.com/companies")
+    assert time.monotonic() - start < 0.05
+
+
+def test_paced_step_waits_outside_the_step():
+    limiter = RateLimiter({"example.com/jobs": (10, 1)})
+    step = PacedStep()
+    url = "https://example.com/jobs/search"
+
+    assert limiter.prepay(step) == 0
+    step.run(limiter.wait, url)
+    assert step.paced == {"example.com/jobs"}
+
+    wait = limiter.prepay(step)
+    assert 0.05 < wait <= 0.1
+    time.sleep(wait)
+    start = time.monotonic()
+    step.run(limiter.wait, url)
+    assert time.monotonic() - start < 0.05
+    assert not step.prepaid
+
+    limiter.prepay(step)
+    limiter.refund(step)
+    assert not step.prepaid
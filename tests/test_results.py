@@ -0,0 +1,161 @@
+import pytest
+import pandas as pd
+
+from jobspy.jobs import JobPost, Location, Compensation, CompensationInterval, Country
+from jobspy.results import (
+    JobsFrameBuilder,
+    desired_columns,
+    normalize_compensation,
+    deduplicate_jobs,
+)
+
+
+def make_job(job_id: str, **kwargs) -> JobPost:
+    return JobPost(
+        id=job_id,
+        title="Software Engineer",
+        company_name="Acme",
+        job_url=f"https://example.com/{job_id}",
+        location=Location(city="Austin", state="TX", country=Country.USA),
+        **kwargs,
+    )
+
+
+def test_jobs_frame_builder():
+    builder = JobsFrameBuilder(hyperlinks=True, enforce_annual_salary=True)
+    builder.add(
+        "indeed",
+        [
+            make_job(
+                "in-1",
+                emails=["a@example.com", "b@example.com"],
+                compensation=Compensation(
+                    interval=CompensationInterval.HOURLY, min_amount=20, max_amount=30
+                ),
+            ),
+            make_job("in-2", description="Pays $90,000 - $120,000 a year"),
+        ],
+    )
+    builder.add("linkedin", [make_job("li-1")])
+    result = builder.build()
+
+    assert list(result.columns) == desired_columns(hyperlinks=True)
+    assert result["site"].tolist() == ["indeed", "indeed", "linkedin"]
+    first = result.set_index("id").loc["in-1"]
+    assert first["location"] == "Austin, TX, USA"
+    assert first["emails"] == "a@example.com, b@example.com"
+    assert first["job_url_hyper"] == (
+        '<a href="https://example.com/in-1">https://example.com/in-1</a>'
+    )
+    assert (first["min_amount"], first["max_amount"]) == (41600, 62400)
+    second = result.set_index("id").loc["in-2"]
+    assert second["salary_source"] == "description"
+    assert pd.isna(result.set_index("id").loc["li-1"]["salary_source"])
+
+
+def test_jobs_frame_builder_empty():
+    assert JobsFrameBuilder().build().empty
+
+
+def test_normalize_compensation():
+    jobs_df = pd.DataFrame(
+        {
+            "interval": ["hourly", "monthly", "yearly", None, "weekly"],
+            "min_amount": [20, 5000, 90000, None, 0],
+            "max_amount": [30, 6000, 120000, None, 1000],
+            "salary_source": ["direct_data"] * 5,
+        }
+    )
+    result = normalize_compensation(jobs_df, enforce_annual_salary=True)
+
+    assert result["interval"].tolist()[:3] == ["yearly"] * 3
+    assert result["min_amount"].tolist()[:3] == [41600, 60000, 90000]
+    assert result["max_amount"].tolist()[:3] == [62400, 72000, 120000]
+    assert result["interval"].iloc[4] == "weekly"
+    assert result["salary_source"].notna().tolist() == [True, True, True, False, False]
+    assert normalize_compensation(result, enforce_annual_salary=True).equals(result)
+
+
+def test_deduplicate_jobs():
+    jobs_df = pd.DataFrame(
+        {
+            "id": ["in-1", "li-1", "gd-1", "go-1", "in-2"],
+            "site": ["indeed", "linkedin", "glassdoor", "google", "indeed"],
+            "job_url_direct": [
+                None,
+                "https://acme.com/jobs/1?src=li",
+                None,
+                None,
+                None,
+            ],
+            "title": [
+                "Software Engineer",
+                "Software Engineer",
+                "Engineer II",
+                "software engineer!",
+                "Nurse",
+            ],
+            "company": ["Acme Inc.", "Acme", "ACME", "acme", "Acme"],
+            "location": [
+                "Austin, TX, US",
+                "Austin, TX, USA",
+                "Austin, TX",
+                "Austin, TX",
+                "Austin, TX",
+            ],
+            "description": ["short", "a much longer description", None, None, "care"],
+        }
+    )
+    jobs_df.loc[2, "job_url_direct"] = "http://www.acme.com/jobs/1/"
+    result = deduplicate_jobs(jobs_df)
+
+    assert result["id"].tolist() == ["li-1", "in-2"]
+    assert result["duplicate_sites"].iloc[0] == "glassdoor, google, indeed"
+    assert pd.isna(result["duplicate_sites"].iloc[1])
+
+
+def test_jobs_frame_builder_arrow_output():
+    pa = pytest.importorskip("pyarrow")
+    builder = JobsFrameBuilder(output_format="pandas_arrow")
+    builder.add(
+        "indeed", [make_job("in-1", description="Pays $90,000 - $120,000 a year")]
+    )
+    result = builder.build()
+
+    assert list(result.columns) == desired_columns()
+    assert isinstance(result["description"].dtype, pd.ArrowDtype)
+    assert result["min_amount"].iloc[0] == 90000
+
+    builder.output_format = "arrow_table"
+    table = builder.build()
+    assert isinstance(table, pa.Table)
+    assert table.column("id").to_pylist() == ["in-1"]
+
+
+def test_jobs_frame_builder_column_selection():
+    builder = JobsFrameBuilder(columns=["title", "job_url", "site"], hyperlinks=True)
+    builder.add("indeed", [make_job("in-1")])
+    result = builder.build()
+
+    assert list(result.columns) == ["site", "job_url_hyper", "title"]
+    with pytest.raises(ValueError):
+        JobsFrameBuilder(columns=["salary"])
+
+
+def test_deduplicate_jobs_keeps_jobs_of_one_site():
+    jobs_df = pd.DataFrame(
+        {
+            "id": ["in-1", "in-2", "in-3", "go-1", "li-1", "li-2"],
+            "site": ["indeed", "indeed", "indeed", "google", "linkedin", "linkedin"],
+            "job_url_direct": [None] * 6,
+            "title": ["Cashier", "Cashier", "Cashier", "Cashier", "N/A", "N/A"],
+            "company": ["Walmart", "Walmart", "Walmart", "Walmart", "N/A", "N/A"],
+            "location": ["Dallas, TX"] * 4 + [None, None],
+            "description": [None] * 6,
+        }
+    )
+    result = deduplicate_jobs(jobs_df)
+
+    assert result["id"].tolist() == ["in-1", "in-2", "in-3", "li-1", "li-2"]
+    assert result["duplicate_sites"].iloc[0] == "google"
+    assert result["duplicate_sites"].iloc[1:].isna().all()
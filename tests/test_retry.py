@@ -0,0 +1,98 @@
+import pytest
+import requests
+
+from jobspy.scrapers.retry import (
+    RetryPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+    parse_retry_after,
+    get_circuit_breaker,
+    set_circuit_breaker,
+    reset_circuit_breakers,
+)
+from jobspy.scrapers import ScraperInput, Site
+from jobspy.scrapers.google import GoogleJobsScraper
+from jobspy.scrapers.metrics import metrics
+from jobspy.scrapers.utils import create_session
+
+
+def throttled(statuses: list[int]):
+    """Answers with the statuses in turn, then with 200"""
+
+    def handle(request):
+        status = statuses.pop(0) if statuses else 200
+        return status, {"Retry-After": "0"} if status == 429 else {}, b""
+
+    return handle
+
+
+def test_retry_after():
+    response = requests.Response()
+    assert parse_retry_after(response) is None
+    response.headers["Retry-After"] = "120"
+    assert parse_retry_after(response) == 120
+    response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert parse_retry_after(response) == 0
+
+    policy = RetryPolicy(backoff=2, max_backoff=5)
+    assert policy.delay(0, retry_after=30) == 30
+    assert all(0 <= policy.delay(attempt) <= 5 for attempt in range(10))
+
+
+def test_circuit_breaker():
+    breaker = CircuitBreaker(threshold=2, cooldown=0.05)
+    breaker.record(429)
+    breaker.record(200)
+    breaker.record(503)
+    assert breaker.allow()
+    breaker.record(429)
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    breaker.open_until = 0
+    assert breaker.allow()
+    assert not breaker.allow()  # one probe at a time
+    breaker.record(429, retry_after=600)
+    assert breaker.state == "open"
+    assert breaker.remaining() > 500
+
+    breaker.open_until = 0
+    assert breaker.allow()
+    breaker.record(200)
+    assert breaker.state == "closed"
+
+
+def test_session_retries_and_breaker(local_server):
+    statuses = []
+    server = local_server(throttled(statuses)).url
+    set_circuit_breaker("test_retry", threshold=3, cooldown=60)
+    session = create_session(is_tls=False, has_retry=True, site="test_retry")
+
+    statuses[:] = [429, 503]
+    assert session.get(server).status_code == 200
+
+    statuses[:] = [429] * 10
+    assert session.get(server).status_code == 429
+    assert statuses == [429] * 7
+    summary = metrics.summary()
+    assert summary.loc[summary["site"] == "test_retry", "retries"].sum() == 4
+
+    # the breaker is shared by the sessions of the site that retry
+    with pytest.raises(CircuitOpenError):
+        create_session(is_tls=False, has_retry=True, site="test_retry").get(server)
+    assert statuses == [429] * 7
+    assert (
+        create_session(is_tls=False, site="test_retry").get(server).status_code == 429
+    )
+
+
+def test_open_breaker_returns_no_jobs():
+    set_circuit_breaker("google", threshold=1, cooldown=60)
+    try:
+        get_circuit_breaker("google").record(503)
+        response = GoogleJobsScraper().scrape(
+            ScraperInput(site_type=[Site.GOOGLE], search_term="engineer")
+        )
+        assert response.jobs == []
+    finally:
+        reset_circuit_breakers()
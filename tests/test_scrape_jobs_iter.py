@@ -0,0 +1,31 @@
+import time
+
+from jobspy import scrape_jobs, scrape_jobs_iter
+
+
+def test_scrape_jobs_iter_pages(stub_scrapers):
+    sites = ["indeed", "linkedin"]
+    frames = list(scrape_jobs_iter(site_name=sites, verbose=0))
+    columns = list(scrape_jobs(site_name=sites, verbose=0).columns)
+
+    assert len(frames) == len(sites) * stub_scrapers.pages
+    for frame in frames:
+        assert list(frame.columns) == columns
+        assert len(frame) == stub_scrapers.jobs_per_page
+        assert frame["site"].nunique() == 1
+    assert sorted(frame["site"].iloc[0] for frame in frames) == sorted(sites * 2)
+
+
+def test_scrape_jobs_iter_stops_workers(stub_scrapers):
+    stub_scrapers.pages = 20
+    stub_scrapers.delay = 0.02
+    frames = scrape_jobs_iter(site_name=["indeed", "linkedin"], verbose=0)
+    assert len(next(frames)) == stub_scrapers.jobs_per_page
+    frames.close()
+
+    deadline = time.monotonic() + 5
+    while stub_scrapers.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stub_scrapers.running == 0
+    # each worker stops at its next page instead of scraping all 20
+    assert stub_scrapers.pages_returned < 10
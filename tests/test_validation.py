@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+
+from jobspy import scrape_jobs, scrape_jobs_iter, scrape_jobs_async, scrape_jobs_batch
+
+
+def entry_points(**kwargs):
+    return [
+        lambda: scrape_jobs(**kwargs),
+        lambda: next(scrape_jobs_iter(**kwargs)),
+        lambda: asyncio.run(scrape_jobs_async(**kwargs)),
+        lambda: scrape_jobs_batch([{"search_term": "a"}], **kwargs),
+    ]
+
+
+def test_invalid_output_format_fails_before_scraping(stub_scrapers):
+    for call in entry_points(site_name="indeed", output_format="arrow", verbose=0):
+        with pytest.raises(ValueError, match="output_format"):
+            call()
+    assert stub_scrapers.pages_returned == 0
+
+
+def test_invalid_columns_fail_before_scraping(stub_scrapers):
+    for call in entry_points(
+        site_name="indeed", columns=["title", "salary"], verbose=0
+    ):
+        with pytest.raises(ValueError, match=r"Invalid columns: \['salary'\]"):
+            call()
+    assert stub_scrapers.pages_returned == 0